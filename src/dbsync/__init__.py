@@ -7,17 +7,10 @@ Cardano blockchain data.
 For query examples and implementations, see the dbsync.examples package.
 """
 
-__version__ = "1.1.2"
+import importlib
+from types import ModuleType
 
-# Import configuration utilities
-# Import main modules when they are implemented
-# from . import models
-from . import (
-    config,
-    examples,  # Query examples and patterns
-    session,
-    utils,
-)
+__version__ = "1.1.2"
 
 # Main exports (will be populated as modules are implemented)
 __all__ = [
@@ -30,6 +23,24 @@ __all__ = [
     # "models",
 ]
 
+# Submodules are loaded on first attribute access (PEP 562) so that importing
+# the package does not pull in SQLModel/SQLAlchemy until they are needed.
+_LAZY_SUBMODULES = frozenset({"config", "examples", "session", "utils"})
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import lazily-loaded submodules on first access."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the public package attributes, including lazy submodules."""
+    return sorted(set(globals()) | set(__all__))
+
 
 def main() -> None:
     """Entry point for the dbsync-py CLI tool."""
@@ -4,6 +4,8 @@ Provides command-line interface for schema validation, benchmarking, query examp
 and other utilities.
 """
 
+# Bind the group explicitly so ``main`` never refers to the submodule of the
+# same name once ``dbsync.cli.main`` has been imported.
 from .main import main
 
 __all__ = ["main"]
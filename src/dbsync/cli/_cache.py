@@ -0,0 +1,113 @@
+"""On-disk cache for slow CLI inputs.
+
+Holds the query commands' comprehensive analyses and the official schema
+fetched by ``validate``. Analysis entries are keyed by the command, its
+arguments and the chain tip the analysis ran against, so a new block
+invalidates them. Results are stored as JSON with their ``Decimal`` and
+date values tagged, so the text formatters get the same types back.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import tempfile
+from collections.abc import Callable, Hashable
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from ._io import write_json
+
+# Tag wrapping each value JSON has no type for, mapped to its constructor
+_DECODERS: dict[str, Callable[[str], Any]] = {
+    "$decimal": Decimal,
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+}
+
+
+def _encode(obj: Any) -> Any:
+    """Tag ``Decimal`` and date values so ``_decode`` can rebuild them."""
+    if isinstance(obj, Decimal):
+        return {"$decimal": str(obj)}
+    if isinstance(obj, datetime):
+        return {"$datetime": obj.isoformat()}
+    if isinstance(obj, date):
+        return {"$date": obj.isoformat()}
+    raise TypeError(f"Cannot cache {type(obj).__name__} values")
+
+
+def _decode(obj: dict[str, Any]) -> Any:
+    """Rebuild a value tagged by ``_encode``; other objects pass through."""
+    if len(obj) == 1:
+        ((tag, value),) = obj.items()
+        decoder = _DECODERS.get(tag)
+        if decoder is not None:
+            return decoder(value)
+    return obj
+
+
+def cache_dir() -> Path:
+    """Return the cache directory, honouring ``XDG_CACHE_HOME``."""
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "dbsync-py"
+
+
+def cached[T](
+    cmd: str, key: dict[str, Any], tip: Hashable, compute: Callable[[], T]
+) -> T:
+    """Return the cached result for ``cmd``, running ``compute`` on a miss.
+
+    Args:
+        cmd: Name of the command producing the result
+        key: Command arguments the result depends on
+        tip: Identifies the database state, e.g. its URL and latest slot
+        compute: Produces the result when it is not cached
+
+    Returns:
+        The cached or freshly computed result
+    """
+    digest = hashlib.blake2b(
+        json.dumps({"cmd": cmd, "key": key, "tip": repr(tip)}, sort_keys=True).encode(),
+        digest_size=16,
+    ).hexdigest()
+    path = cache_dir() / f"{digest}.json"
+
+    try:
+        return json.loads(path.read_bytes(), object_hook=_decode)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Unreadable entry; recompute it
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+
+    result = compute()
+
+    # A result that cannot be stored only costs recomputing it next time
+    with contextlib.suppress(OSError, TypeError, ValueError):
+        buffer = io.StringIO()
+        write_json(buffer, result, default=_encode)
+        write_entry(path, buffer.getvalue().encode())
+    return result
+
+
+def write_entry(path: Path, data: bytes) -> None:
+    """Store ``data`` at ``path`` in the cache directory.
+
+    The data goes to a temporary file that is then renamed, so concurrent
+    runs never read a partially written entry. The temporary file is removed
+    if the write fails.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,94 @@
+"""Output helpers shared by the CLI commands."""
+
+import json
+import math
+from collections.abc import Callable
+from datetime import date, time
+from typing import Any, TextIO
+
+# Reports can run to several megabytes of JSON; a large buffer lets them
+# reach the disk in a few write calls instead of one per 8 KiB block
+_FILE_BUFFER_SIZE = 1 << 20
+
+try:
+    import orjson
+except ImportError:  # Optional: install the "fast" extra for quicker JSON output
+    orjson = None
+
+# Python's JSON encoder drops to its pure-Python implementation whenever an
+# indent is requested, which every report does. Datetimes are passed through
+# to ``default`` so both encoders render them the same way.
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
+
+def json_default(obj: Any) -> Any:
+    """Encode values JSON has no type for, such as dates and ``Decimal``.
+
+    Dates and times are written in ISO 8601 form; anything else falls back to
+    ``str``.
+    """
+    if isinstance(obj, date | time):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _orjson_dumps(obj: Any, default: Callable[[Any], Any] | None) -> str | None:
+    """Encode ``obj`` with orjson, or return None if it cannot be used.
+
+    orjson is skipped when it is not installed or rejects a value, such as an
+    integer wider than 64 bits, that the standard library can still encode.
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode()
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _finite(obj: Any) -> Any:
+    """Return ``obj`` with NaN and infinite floats replaced by None.
+
+    orjson writes those values as ``null``; the standard library would write
+    ``NaN``, which is not valid JSON.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def open_output(path: str) -> TextIO:
+    """Open ``path`` for writing a report.
+
+    Files are written as UTF-8, since reports contain emoji, without newline
+    translation and through a large buffer.
+    """
+    return open(path, "w", encoding="utf-8", newline="", buffering=_FILE_BUFFER_SIZE)
+
+
+def write_json(
+    fp: TextIO, obj: Any, default: Callable[[Any], Any] | None = None
+) -> None:
+    """Write ``obj`` to ``fp`` as indented JSON followed by a newline.
+
+    Without orjson the standard library encoder's chunks are streamed to
+    ``fp``, so the report is never held in memory as one string. Both
+    encoders write non-ASCII text as is and NaN or infinity as ``null``.
+    """
+    encoded = _orjson_dumps(obj, default)
+    if encoded is None:
+        encoder = json.JSONEncoder(
+            ensure_ascii=False, allow_nan=False, indent=2, default=default
+        )
+        fp.writelines(encoder.iterencode(_finite(obj)))
+    else:
+        fp.write(encoded)
+    fp.write("\n")
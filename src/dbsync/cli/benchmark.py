@@ -3,23 +3,61 @@
 Provides CLI interface for running performance benchmarks on database models and operations.
 """
 
+import functools
 import json
-
-# Import the existing benchmark functionality
+import os
 import sys
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
 import click
 
-# Add tests directory to path to import benchmarks
-tests_path = Path(__file__).parent.parent.parent.parent / "tests"
-sys.path.insert(0, str(tests_path))
+from ._io import open_output
+
+if TYPE_CHECKING:
+    from benchmarks.benchmark_utils import BenchmarkRunner, ModelBenchmarkSuite
+
+# Emoji prefixes for report lines; set DBSYNC_NO_EMOJI to print plain text
+_NO_EMOJI = bool(os.environ.get("DBSYNC_NO_EMOJI"))
+_OK = "" if _NO_EMOJI else "✅ "
+_ERR = "" if _NO_EMOJI else "❌ "
+
+
+@functools.cache
+def _load_benchmark_classes() -> tuple[
+    type["BenchmarkRunner"], type["ModelBenchmarkSuite"]
+]:
+    """Import the benchmark utilities from the tests directory.
+
+    The tests directory is only added to ``sys.path`` when benchmarks are
+    actually run, so other CLI commands do not pay for the import.
+    """
+    tests_path = Path(__file__).parent.parent.parent.parent / "tests"
+    sys.path.insert(0, str(tests_path))
+
+    from benchmarks.benchmark_utils import BenchmarkRunner, ModelBenchmarkSuite
+
+    return BenchmarkRunner, ModelBenchmarkSuite
 
-from benchmarks.benchmark_utils import (
-    BenchmarkRunner,
-    ModelBenchmarkSuite,
-)
+
+@functools.cache
+def _get_runner_and_suite() -> tuple["BenchmarkRunner", "ModelBenchmarkSuite"]:
+    """Build the benchmark runner and suite once per process.
+
+    Each category runs on a pickled copy in a worker process, so the cached
+    instances are never mutated by a benchmark run.
+    """
+    runner_cls, suite_cls = _load_benchmark_classes()
+    return runner_cls(), suite_cls()
+
+
+@functools.lru_cache(maxsize=256)
+def _pretty(name: str) -> str:
+    """Turn a snake_case benchmark name into a display title."""
+    return name.replace("_", " ").title()
 
 
 def run_benchmarks(
@@ -40,8 +78,7 @@ def run_benchmarks(
         click.echo("Initializing benchmark runner...")
 
     # Initialize the benchmark runner
-    runner = BenchmarkRunner()
-    suite = ModelBenchmarkSuite()
+    runner, suite = _get_runner_and_suite()
 
     if verbose:
         click.echo("Running benchmarks...")
@@ -52,28 +89,35 @@ def run_benchmarks(
     except Exception as e:
         raise click.ClickException(f"Benchmark execution failed: {e}")
 
-    # Generate output
-    if format == "json":
-        output = _generate_json_output(results)
-    else:
-        output = _generate_text_output(results, verbose)
-
     # Write output
     if output_file:
         try:
-            with open(output_file, "w") as f:
-                f.write(output)
+            with open_output(output_file) as f:
+                _write_output(f, results, format, verbose)
             if verbose:
                 click.echo(f"Results written to {output_file}")
         except Exception as e:
             raise click.ClickException(f"Failed to write output file: {e}")
     else:
-        click.echo(output)
+        _write_output(sys.stdout, results, format, verbose)
+
+
+def _write_output(fp: TextIO, results: dict, format: str, verbose: bool) -> None:
+    """Write the results to ``fp`` in the requested format.
+
+    Both formats are streamed (``json.dump`` for JSON, section by section for
+    text), so the report is never held in memory as a single string.
+    """
+    if format == "json":
+        json.dump(results, fp, indent=2)
+        fp.write("\n")
+    else:
+        fp.writelines(_generate_text_output(results, verbose))
 
 
 def _run_benchmark_suite(
-    runner: BenchmarkRunner,
-    suite: ModelBenchmarkSuite,
+    runner: "BenchmarkRunner",
+    suite: "ModelBenchmarkSuite",
     quick: bool,
     verbose: bool,
 ) -> dict:
@@ -84,38 +128,30 @@ def _run_benchmark_suite(
         "benchmarks": {},
     }
 
-    # Define benchmark categories
-    categories = [
-        ("Model Creation", _run_model_creation_benchmarks),
-        ("Serialization", _run_serialization_benchmarks),
-        ("Type Conversion", _run_type_conversion_benchmarks),
-    ]
-
-    if not quick:
-        categories.extend(
-            [
-                ("Bulk Operations", _run_bulk_operation_benchmarks),
-                ("Database Operations", _run_database_benchmarks),
-            ]
-        )
-
-    for category_name, benchmark_func in categories:
-        if verbose:
-            click.echo(f"Running {category_name} benchmarks...")
+    categories = _QUICK_CATEGORIES if quick else _FULL_CATEGORIES
 
-        try:
-            category_results = benchmark_func(runner, suite)
-            results["benchmarks"][category_name] = category_results
-        except Exception as e:
+    # Categories share no state, so run them in separate processes
+    max_workers = min(len(categories), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for category_name, benchmark_func in categories:
             if verbose:
-                click.echo(f"Warning: {category_name} benchmarks failed: {e}")
-            results["benchmarks"][category_name] = {"error": str(e)}
+                click.echo(f"Running {category_name} benchmarks...")
+            futures[category_name] = executor.submit(benchmark_func, runner, suite)
+
+        for category_name, future in futures.items():
+            try:
+                results["benchmarks"][category_name] = future.result()
+            except Exception as e:
+                if verbose:
+                    click.echo(f"Warning: {category_name} benchmarks failed: {e}")
+                results["benchmarks"][category_name] = {"error": str(e)}
 
     return results
 
 
 def _run_model_creation_benchmarks(
-    runner: BenchmarkRunner, suite: ModelBenchmarkSuite
+    runner: "BenchmarkRunner", suite: "ModelBenchmarkSuite"
 ) -> dict:
     """Run model creation benchmarks."""
     return {
@@ -132,7 +168,7 @@ def _run_model_creation_benchmarks(
 
 
 def _run_serialization_benchmarks(
-    runner: BenchmarkRunner, suite: ModelBenchmarkSuite
+    runner: "BenchmarkRunner", suite: "ModelBenchmarkSuite"
 ) -> dict:
     """Run serialization benchmarks."""
     return {
@@ -146,7 +182,7 @@ def _run_serialization_benchmarks(
 
 
 def _run_type_conversion_benchmarks(
-    runner: BenchmarkRunner, suite: ModelBenchmarkSuite
+    runner: "BenchmarkRunner", suite: "ModelBenchmarkSuite"
 ) -> dict:
     """Run type conversion benchmarks."""
     return {
@@ -160,7 +196,7 @@ def _run_type_conversion_benchmarks(
 
 
 def _run_bulk_operation_benchmarks(
-    runner: BenchmarkRunner, suite: ModelBenchmarkSuite
+    runner: "BenchmarkRunner", suite: "ModelBenchmarkSuite"
 ) -> dict:
     """Run bulk operation benchmarks."""
     return {
@@ -174,7 +210,7 @@ def _run_bulk_operation_benchmarks(
 
 
 def _run_database_benchmarks(
-    runner: BenchmarkRunner, suite: ModelBenchmarkSuite
+    runner: "BenchmarkRunner", suite: "ModelBenchmarkSuite"
 ) -> dict:
     """Run database operation benchmarks."""
     # Note: These would require actual database connection
@@ -204,61 +240,65 @@ def _run_database_benchmarks(
     }
 
 
-def _generate_text_output(results: dict, verbose: bool) -> str:
-    """Generate text format output."""
-    lines = []
+# Benchmark categories, in report order
+_QUICK_CATEGORIES: tuple[tuple[str, Callable[..., dict]], ...] = (
+    ("Model Creation", _run_model_creation_benchmarks),
+    ("Serialization", _run_serialization_benchmarks),
+    ("Type Conversion", _run_type_conversion_benchmarks),
+)
+_FULL_CATEGORIES: tuple[tuple[str, Callable[..., dict]], ...] = (
+    *_QUICK_CATEGORIES,
+    ("Bulk Operations", _run_bulk_operation_benchmarks),
+    ("Database Operations", _run_database_benchmarks),
+)
 
-    lines.append("=" * 80)
-    lines.append("DBSYNC-PY PERFORMANCE BENCHMARK REPORT")
-    lines.append("=" * 80)
-    lines.append(f"Timestamp: {results['timestamp']}")
-    lines.append(f"Mode: {'Quick' if results['quick_mode'] else 'Full'}")
-    lines.append("")
+
+def _generate_text_output(results: dict, verbose: bool) -> Iterator[str]:
+    """Generate text format output, one section at a time."""
+    yield (
+        f"{'=' * 80}\n"
+        "DBSYNC-PY PERFORMANCE BENCHMARK REPORT\n"
+        f"{'=' * 80}\n"
+        f"Timestamp: {results['timestamp']}\n"
+        f"Mode: {'Quick' if results['quick_mode'] else 'Full'}\n"
+        "\n"
+    )
 
     for category_name, category_results in results["benchmarks"].items():
-        lines.append(f"{category_name.upper()} BENCHMARKS")
-        lines.append("-" * 50)
+        yield f"{category_name.upper()} BENCHMARKS\n{'-' * 50}\n"
 
         if "error" in category_results:
-            lines.append(f"❌ Error: {category_results['error']}")
+            yield f"{_ERR}Error: {category_results['error']}\n"
         else:
             for benchmark_name, benchmark_result in category_results.items():
                 if isinstance(benchmark_result, dict) and "mean" in benchmark_result:
                     mean_ms = benchmark_result["mean"] * 1000  # Convert to milliseconds
                     std_ms = benchmark_result["std"] * 1000
-                    lines.append(f"✅ {benchmark_name.replace('_', ' ').title()}")
-                    lines.append(f"   Mean: {mean_ms:.3f}ms ± {std_ms:.3f}ms")
-                    lines.append(
-                        f"   Range: {benchmark_result['min'] * 1000:.3f}ms - {benchmark_result['max'] * 1000:.3f}ms"
+                    yield (
+                        f"{_OK}{_pretty(benchmark_name)}\n"
+                        f"   Mean: {mean_ms:.3f}ms ± {std_ms:.3f}ms\n"
+                        f"   Range: {benchmark_result['min'] * 1000:.3f}ms - {benchmark_result['max'] * 1000:.3f}ms\n"
+                        f"   Iterations: {benchmark_result['iterations']}\n"
+                        "\n"
                     )
-                    lines.append(f"   Iterations: {benchmark_result['iterations']}")
                 else:
-                    lines.append(
-                        f"❌ {benchmark_name.replace('_', ' ').title()}: Invalid result"
-                    )
-                lines.append("")
+                    yield f"{_ERR}{_pretty(benchmark_name)}: Invalid result\n\n"
 
-        lines.append("")
+        yield "\n"
 
     # Add summary
-    lines.append("SUMMARY")
-    lines.append("-" * 50)
-    total_benchmarks = sum(
-        len(cat) for cat in results["benchmarks"].values() if "error" not in cat
-    )
-    failed_categories = sum(
-        1 for cat in results["benchmarks"].values() if "error" in cat
-    )
-
-    lines.append(f"Total Benchmarks: {total_benchmarks}")
-    lines.append(f"Failed Categories: {failed_categories}")
-    lines.append(
-        f"Success Rate: {((len(results['benchmarks']) - failed_categories) / len(results['benchmarks'])) * 100:.1f}%"
+    total_categories = len(results["benchmarks"])
+    total_benchmarks = failed_categories = 0
+    for cat in results["benchmarks"].values():
+        if "error" in cat:
+            failed_categories += 1
+        else:
+            total_benchmarks += len(cat)
+    success_rate = (total_categories - failed_categories) / total_categories * 100
+
+    yield (
+        f"SUMMARY\n{'-' * 50}\n"
+        f"Total Benchmarks: {total_benchmarks}\n"
+        f"Failed Categories: {failed_categories}\n"
+        f"Success Rate: {success_rate:.1f}%\n"
     )
-
-    return "\n".join(lines)
-
-
-def _generate_json_output(results: dict) -> str:
-    """Generate JSON format output."""
-    return json.dumps(results, indent=2)
@@ -4,17 +4,58 @@ This module provides CLI commands for comprehensive test coverage analysis
 including gap analysis, quality metrics, trend tracking, and CI integration.
 """
 
+import contextlib
+import functools
 import json
+import os
 import sys
 from pathlib import Path
 
 import click
 
-from tests.coverage.analyzer import CoverageAnalyzer
-from tests.coverage.ci import CICoverageRunner, QualityGate
-from tests.coverage.generator import TestGenerator
-from tests.coverage.reporter import CoverageReporter
-from tests.coverage.tracker import CoverageTracker
+from ._io import open_output
+
+# The tests.coverage toolchain is imported inside each command so that
+# ``--help`` and unrelated subcommands do not pay for loading it.
+
+# Emoji prefixes for report lines; set DBSYNC_NO_EMOJI to print plain text
+_NO_EMOJI = bool(os.environ.get("DBSYNC_NO_EMOJI"))
+_OK = "" if _NO_EMOJI else "✅ "
+_ERR = "" if _NO_EMOJI else "❌ "
+_CHART = "" if _NO_EMOJI else "📊 "
+_SEARCH = "" if _NO_EMOJI else "🔍 "
+_DOC = "" if _NO_EMOJI else "📄 "
+_LINK = "" if _NO_EMOJI else "🌐 "
+_ALERT = "" if _NO_EMOJI else "🚨 "
+_TREND = "" if _NO_EMOJI else "📈 "
+_FOLDER = "" if _NO_EMOJI else "📁 "
+_FIRE = "" if _NO_EMOJI else "🔥 "
+_CALENDAR = "" if _NO_EMOJI else "📅 "
+
+
+@functools.lru_cache(maxsize=256)
+def _pretty(name):
+    """Turn a snake_case identifier into a display title."""
+    return name.replace("_", " ").title()
+
+
+@functools.lru_cache(maxsize=512)
+def _basename(path):
+    """Return the final component of a file path."""
+    return os.path.basename(path)
+
+
+def _output_stream(path):
+    """Open ``path`` for writing, or wrap stdout when no path is given."""
+    if path:
+        return open_output(path)
+    return contextlib.nullcontext(sys.stdout)
+
+
+def _dump_json(data, fp):
+    """Stream ``data`` to ``fp`` as indented JSON without building a string."""
+    json.dump(data, fp, indent=2)
+    fp.write("\n")
 
 
 @click.group()
@@ -48,10 +89,12 @@ def coverage():
 def analyze(source_dir, coverage_file, output, output_format, detailed):
     """Analyze test coverage and identify gaps."""
     try:
+        from tests.coverage.analyzer import CoverageAnalyzer
+
         analyzer = CoverageAnalyzer(source_dir, coverage_file)
 
         if not analyzer.load_coverage_data():
-            click.echo("❌ Failed to load coverage data", err=True)
+            click.echo(f"{_ERR}Failed to load coverage data", err=True)
             click.echo(
                 "Make sure to run tests with coverage first: pytest --cov=src", err=True
             )
@@ -76,22 +119,18 @@ def analyze(source_dir, coverage_file, output, output_format, detailed):
                 for gap in gaps[:20]  # Top 20 gaps
             ]
 
-        # Format output
-        if output_format == "json":
-            output_text = json.dumps(summary, indent=2)
-        else:
-            output_text = _format_analysis_text(metrics, summary, detailed)
-
         # Write output
+        with _output_stream(output) as f:
+            if output_format == "json":
+                _dump_json(summary, f)
+            else:
+                f.writelines(_format_analysis_text(metrics, summary, detailed))
+
         if output:
-            with open(output, "w") as f:
-                f.write(output_text)
-            click.echo(f"✅ Coverage analysis saved to: {output}")
-        else:
-            click.echo(output_text)
+            click.echo(f"{_OK}Coverage analysis saved to: {output}")
 
     except Exception as e:
-        click.echo(f"❌ Coverage analysis failed: {e}", err=True)
+        click.echo(f"{_ERR}Coverage analysis failed: {e}", err=True)
         sys.exit(1)
 
 
@@ -119,6 +158,11 @@ def report(
 ):
     """Generate comprehensive coverage reports."""
     try:
+        from tests.coverage.analyzer import CoverageAnalyzer
+        from tests.coverage.generator import TestGenerator
+        from tests.coverage.reporter import CoverageReporter
+        from tests.coverage.tracker import CoverageTracker
+
         # Initialize components
         analyzer = CoverageAnalyzer(source_dir, coverage_file)
         tracker = CoverageTracker(output_dir / "history") if include_trends else None
@@ -126,7 +170,7 @@ def report(
         reporter = CoverageReporter(output_dir)
 
         if not analyzer.load_coverage_data():
-            click.echo("❌ Failed to load coverage data", err=True)
+            click.echo(f"{_ERR}Failed to load coverage data", err=True)
             sys.exit(1)
 
         # Generate reports
@@ -138,16 +182,18 @@ def report(
             bar.update(80)
 
         # Display results
-        click.echo("✅ Coverage reports generated:")
+        click.echo(f"{_OK}Coverage reports generated:")
         for report_type, file_path in reports.items():
             if report_type != "error":
-                click.echo(f"  📄 {report_type.upper()}: {file_path}")
+                click.echo(f"  {_DOC}{report_type.upper()}: {file_path}")
 
         if "html" in reports:
-            click.echo(f"\n🌐 Open HTML report: file://{reports['html'].absolute()}")
+            click.echo(
+                f"\n{_LINK}Open HTML report: file://{reports['html'].absolute()}"
+            )
 
     except Exception as e:
-        click.echo(f"❌ Report generation failed: {e}", err=True)
+        click.echo(f"{_ERR}Report generation failed: {e}", err=True)
         sys.exit(1)
 
 
@@ -189,6 +235,8 @@ def suggest(
 ):
     """Generate test suggestions based on coverage gaps."""
     try:
+        from tests.coverage.generator import TestGenerator
+
         generator = TestGenerator(source_dir, test_dir)
 
         # Generate suggestions
@@ -198,38 +246,34 @@ def suggest(
             bar.update(50)
 
         if not suggestions:
-            click.echo("✅ No test suggestions needed - coverage looks good!")
+            click.echo(f"{_OK}No test suggestions needed - coverage looks good!")
             return
 
-        # Format output
-        if output_format == "json":
-            suggestions_data = [
-                {
-                    "file": s.file_path,
-                    "function": s.function_name,
-                    "class": s.class_name,
-                    "type": s.test_type,
-                    "priority": s.priority,
-                    "description": s.description,
-                    "test_name": s.full_test_name,
-                    "template": s.test_template,
-                }
-                for s in suggestions
-            ]
-            output_text = json.dumps(suggestions_data, indent=2)
-        else:
-            output_text = _format_suggestions_text(suggestions)
-
         # Write output
+        with _output_stream(output) as f:
+            if output_format == "json":
+                suggestions_data = [
+                    {
+                        "file": s.file_path,
+                        "function": s.function_name,
+                        "class": s.class_name,
+                        "type": s.test_type,
+                        "priority": s.priority,
+                        "description": s.description,
+                        "test_name": s.full_test_name,
+                        "template": s.test_template,
+                    }
+                    for s in suggestions
+                ]
+                _dump_json(suggestions_data, f)
+            else:
+                f.writelines(_format_suggestions_text(suggestions))
+
         if output:
-            with open(output, "w") as f:
-                f.write(output_text)
-            click.echo(f"✅ Test suggestions saved to: {output}")
-        else:
-            click.echo(output_text)
+            click.echo(f"{_OK}Test suggestions saved to: {output}")
 
     except Exception as e:
-        click.echo(f"❌ Test suggestion generation failed: {e}", err=True)
+        click.echo(f"{_ERR}Test suggestion generation failed: {e}", err=True)
         sys.exit(1)
 
 
@@ -251,13 +295,15 @@ def suggest(
 def trends(data_dir, period, output_format):
     """Analyze coverage trends over time."""
     try:
+        from tests.coverage.tracker import CoverageTracker
+
         tracker = CoverageTracker(data_dir)
 
         # Get trend statistics
         stats = tracker.get_coverage_statistics(period)
 
         if "error" in stats:
-            click.echo(f"❌ {stats['error']}", err=True)
+            click.echo(f"{_ERR}{stats['error']}", err=True)
             sys.exit(1)
 
         # Check for regressions
@@ -265,12 +311,12 @@ def trends(data_dir, period, output_format):
 
         if output_format == "json":
             output_data = {"statistics": stats, "regression_check": regression_info}
-            click.echo(json.dumps(output_data, indent=2))
+            _dump_json(output_data, sys.stdout)
         else:
             _display_trends_text(stats, regression_info)
 
     except Exception as e:
-        click.echo(f"❌ Trend analysis failed: {e}", err=True)
+        click.echo(f"{_ERR}Trend analysis failed: {e}", err=True)
         sys.exit(1)
 
 
@@ -315,6 +361,8 @@ def ci(
 ):
     """Run coverage analysis for CI/CD pipelines."""
     try:
+        from tests.coverage.ci import CICoverageRunner, QualityGate
+
         runner = CICoverageRunner(source_dir, coverage_file, output_dir)
 
         # Set up quality gates
@@ -354,13 +402,13 @@ def ci(
         # Export JUnit XML if requested
         if junit_xml:
             runner.export_junit_xml(results, junit_xml)
-            click.echo(f"📄 JUnit XML exported to: {junit_xml}")
+            click.echo(f"{_DOC}JUnit XML exported to: {junit_xml}")
 
         # Exit with appropriate code
         sys.exit(results["exit_code"])
 
     except Exception as e:
-        click.echo(f"❌ CI coverage analysis failed: {e}", err=True)
+        click.echo(f"{_ERR}CI coverage analysis failed: {e}", err=True)
         sys.exit(1)
 
 
@@ -380,111 +428,108 @@ def ci(
 def clean(data_dir, keep_days):
     """Clean up old coverage data."""
     try:
+        from tests.coverage.tracker import CoverageTracker
+
         tracker = CoverageTracker(data_dir)
         tracker.cleanup_old_data(keep_days)
-        click.echo(f"✅ Cleaned up coverage data older than {keep_days} days")
+        click.echo(f"{_OK}Cleaned up coverage data older than {keep_days} days")
 
     except Exception as e:
-        click.echo(f"❌ Cleanup failed: {e}", err=True)
+        click.echo(f"{_ERR}Cleanup failed: {e}", err=True)
         sys.exit(1)
 
 
 def _format_analysis_text(metrics, summary, detailed):
-    """Format coverage analysis as text."""
-    lines = [
-        "=" * 60,
-        "COVERAGE ANALYSIS REPORT",
-        "=" * 60,
-        "",
-        "📊 COVERAGE METRICS",
-        "-" * 30,
-        f"Line Coverage:      {metrics.line_coverage_percent:6.1f}%",
-        f"Branch Coverage:    {metrics.branch_coverage_percent:6.1f}%",
-        f"Function Coverage:  {metrics.function_coverage_percent:6.1f}%",
-        f"Overall Score:      {metrics.overall_score:6.1f}",
-        f"Effective Coverage: {metrics.effective_coverage_score:6.1f}%",
-        f"Test Quality:       {metrics.test_quality_score:6.1f}",
-        "",
-        "🚨 COVERAGE GAPS",
-        "-" * 30,
-        f"Total Gaps:         {metrics.total_gaps}",
-        f"Critical Gaps:      {metrics.critical_gaps}",
-        f"High Priority:      {metrics.high_priority_gaps}",
-        "",
-        "📈 TREND ANALYSIS",
-        "-" * 30,
-        f"Trend Direction:    {metrics.coverage_trend.title()}",
-        f"Trend Change:       {metrics.trend_percentage:+.1f}%",
-        "",
-        "📁 FILE ANALYSIS",
-        "-" * 30,
-        f"Well Covered:       {metrics.well_covered_files} files (≥90%)",
-        f"Poorly Covered:     {metrics.poorly_covered_files} files (<50%)",
-        f"Uncovered:          {metrics.uncovered_files} files (0%)",
-    ]
+    """Format coverage analysis as text, yielding one section at a time."""
+    yield (
+        f"""{"=" * 60}
+COVERAGE ANALYSIS REPORT
+{"=" * 60}
+
+{_CHART}COVERAGE METRICS
+{"-" * 30}
+Line Coverage:      {metrics.line_coverage_percent:6.1f}%
+Branch Coverage:    {metrics.branch_coverage_percent:6.1f}%
+Function Coverage:  {metrics.function_coverage_percent:6.1f}%
+Overall Score:      {metrics.overall_score:6.1f}
+Effective Coverage: {metrics.effective_coverage_score:6.1f}%
+Test Quality:       {metrics.test_quality_score:6.1f}
+
+{_ALERT}COVERAGE GAPS
+{"-" * 30}
+Total Gaps:         {metrics.total_gaps}
+Critical Gaps:      {metrics.critical_gaps}
+High Priority:      {metrics.high_priority_gaps}
+
+{_TREND}TREND ANALYSIS
+{"-" * 30}
+Trend Direction:    {metrics.coverage_trend.title()}
+Trend Change:       {metrics.trend_percentage:+.1f}%
+
+{_FOLDER}FILE ANALYSIS
+{"-" * 30}
+Well Covered:       {metrics.well_covered_files} files (≥90%)
+Poorly Covered:     {metrics.poorly_covered_files} files (<50%)
+Uncovered:          {metrics.uncovered_files} files (0%)
+"""
+    )
 
     if detailed and "gaps_detail" in summary:
-        lines.extend(["", "🔍 DETAILED GAPS (Top 20)", "-" * 30])
+        yield f"\n{_SEARCH}DETAILED GAPS (Top 20)\n{'-' * 30}\n"
 
         for gap in summary["gaps_detail"]:
-            lines.append(
-                f"• {Path(gap['file']).name}:{gap['lines']} - {gap['type']} ({gap['severity']})"
+            yield (
+                f"• {_basename(gap['file'])}:{gap['lines']} - {gap['type']} ({gap['severity']})\n"
             )
             if gap["function"]:
-                lines.append(f"  Function: {gap['function']}")
+                yield f"  Function: {gap['function']}\n"
             if gap["suggestions"]:
-                lines.append(f"  Suggestion: {gap['suggestions'][0]}")
-            lines.append("")
-
-    return "\n".join(lines)
+                yield f"  Suggestion: {gap['suggestions'][0]}\n"
+            yield "\n"
 
 
 def _format_suggestions_text(suggestions):
-    """Format test suggestions as text."""
-    lines = [
-        "=" * 60,
-        "TEST SUGGESTIONS",
-        "=" * 60,
-        "",
-        f"Generated {len(suggestions)} test suggestions to improve coverage:",
-        "",
-    ]
+    """Format test suggestions as text, yielding one entry at a time."""
+    yield (
+        f"{'=' * 60}\n"
+        "TEST SUGGESTIONS\n"
+        f"{'=' * 60}\n"
+        "\n"
+        f"Generated {len(suggestions)} test suggestions to improve coverage:\n"
+        "\n"
+    )
 
     # Group by priority
-    high_priority = [s for s in suggestions if s.priority == "high"]
-    medium_priority = [s for s in suggestions if s.priority == "medium"]
-    low_priority = [s for s in suggestions if s.priority == "low"]
+    buckets = {"high": [], "medium": [], "low": []}
+    for suggestion in suggestions:
+        buckets.setdefault(suggestion.priority, []).append(suggestion)
 
     for priority_name, priority_suggestions in [
-        ("HIGH PRIORITY", high_priority),
-        ("MEDIUM PRIORITY", medium_priority),
-        ("LOW PRIORITY", low_priority),
+        ("HIGH PRIORITY", buckets["high"]),
+        ("MEDIUM PRIORITY", buckets["medium"]),
+        ("LOW PRIORITY", buckets["low"]),
     ]:
         if not priority_suggestions:
             continue
 
-        lines.extend(
-            [f"🔥 {priority_name} ({len(priority_suggestions)} suggestions)", "-" * 50]
+        yield (
+            f"{_FIRE}{priority_name} ({len(priority_suggestions)} suggestions)\n{'-' * 50}\n"
         )
 
         for suggestion in priority_suggestions:
-            file_name = Path(suggestion.file_path).name
+            file_name = _basename(suggestion.file_path)
             function_info = suggestion.function_name or "module level"
             if suggestion.class_name:
                 function_info = f"{suggestion.class_name}.{function_info}"
 
-            lines.extend(
-                [
-                    f"• {file_name} - {function_info}",
-                    f"  Type: {suggestion.test_type.replace('_', ' ').title()}",
-                    f"  Description: {suggestion.description}",
-                    f"  Suggested test: {suggestion.full_test_name}",
-                    "",
-                ]
+            yield (
+                f"• {file_name} - {function_info}\n"
+                f"  Type: {_pretty(suggestion.test_type)}\n"
+                f"  Description: {suggestion.description}\n"
+                f"  Suggested test: {suggestion.full_test_name}\n"
+                "\n"
             )
 
-    return "\n".join(lines)
-
 
 def _display_trends_text(stats, regression_info):
     """Display trend analysis as formatted text."""
@@ -493,17 +538,19 @@ def _display_trends_text(stats, regression_info):
     click.echo("=" * 60)
     click.echo()
 
-    click.echo(f"📊 ANALYSIS PERIOD: {stats['period_days']} days")
-    click.echo(f"📈 DATA POINTS: {stats['data_points']}")
-    click.echo(f"📅 PERIOD: {stats['first_timestamp']} to {stats['last_timestamp']}")
+    click.echo(f"{_CHART}ANALYSIS PERIOD: {stats['period_days']} days")
+    click.echo(f"{_TREND}DATA POINTS: {stats['data_points']}")
+    click.echo(
+        f"{_CALENDAR}PERIOD: {stats['first_timestamp']} to {stats['last_timestamp']}"
+    )
     click.echo()
 
     # Display statistics for each metric
     for metric, data in stats.get("statistics", {}).items():
-        metric_name = metric.replace("_", " ").title()
+        metric_name = _pretty(metric)
         trend = data.get("trend", {})
 
-        click.echo(f"📊 {metric_name.upper()}")
+        click.echo(f"{_CHART}{metric_name.upper()}")
         click.echo("-" * 30)
         click.echo(f"Current:    {data['current']:.1f}%")
         click.echo(f"Average:    {data['average']:.1f}%")
@@ -514,17 +561,17 @@ def _display_trends_text(stats, regression_info):
 
     # Display regression information
     if regression_info.get("has_regression"):
-        click.echo("🚨 REGRESSION DETECTED")
+        click.echo(f"{_ALERT}REGRESSION DETECTED")
         click.echo("-" * 30)
         for regression in regression_info.get("regressions", []):
-            click.echo(f"• {regression['metric'].replace('_', ' ').title()}")
+            click.echo(f"• {_pretty(regression['metric'])}")
             click.echo(f"  Current: {regression['current_value']:.1f}")
             click.echo(f"  Average: {regression['recent_average']:.1f}")
             click.echo(f"  Drop: {regression['percentage_drop']:.1f}%")
             click.echo(f"  Severity: {regression['severity'].upper()}")
             click.echo()
     else:
-        click.echo("✅ No regressions detected")
+        click.echo(f"{_OK}No regressions detected")
 
 
 if __name__ == "__main__":
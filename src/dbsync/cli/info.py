@@ -3,12 +3,47 @@
 Provides CLI interface for showing package information and configuration.
 """
 
+import functools
 import importlib.util
+import io
 import sys
+from typing import TYPE_CHECKING
 
 import click
 
-from ..config import DatabaseConfig, get_version
+from ..config import get_config, get_version
+
+if TYPE_CHECKING:
+    from sqlalchemy import TextClause
+
+
+def _module_available(name: str) -> bool:
+    """Return whether ``name`` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # Raised when a parent package of a dotted name is missing
+        return False
+
+
+# Installed modules don't change during the process, so probe them once
+_SCHEMA_VALIDATION_AVAILABLE = _module_available("schema_validation.schema_validator")
+_BENCHMARK_UTILS_AVAILABLE = _module_available("benchmarks.benchmark_utils")
+_DATABASE_AVAILABLE = _module_available("dbsync.session")
+
+_SEP30 = "-" * 30
+
+_HEADER = f"{'=' * 60}\nDBSYNC-PY PACKAGE INFORMATION\n{'=' * 60}\n"
+
+_USAGE_EXAMPLES = (
+    f"USAGE EXAMPLES\n{_SEP30}\n"
+    "dbsync-py validate              # Validate schema\n"
+    "dbsync-py validate --coverage-only  # Show coverage only\n"
+    "dbsync-py benchmark             # Run benchmarks\n"
+    "dbsync-py benchmark --quick     # Quick benchmarks\n"
+    "dbsync-py info --check-connection  # Test connection\n"
+    "dbsync-py --help                # Show help"
+)
 
 
 def show_info(
@@ -23,65 +58,56 @@ def show_info(
         show_config: Show current configuration
         verbose: Enable verbose output
     """
-    lines = []
+    buf = io.StringIO()
 
     # Package information
-    lines.append("=" * 60)
-    lines.append("DBSYNC-PY PACKAGE INFORMATION")
-    lines.append("=" * 60)
-    lines.append(f"Version: {get_version()}")
-    lines.append(f"Python: {sys.version.split()[0]}")
-    lines.append(f"Platform: {sys.platform}")
-    lines.append("")
+    buf.write(_HEADER)
+    buf.write(
+        f"Version: {get_version()}\n"
+        f"Python: {sys.version.split()[0]}\n"
+        f"Platform: {sys.platform}\n"
+        "\n"
+    )
 
     # Configuration information
     if show_config:
-        lines.append("CONFIGURATION")
-        lines.append("-" * 30)
+        buf.write(f"CONFIGURATION\n{_SEP30}\n")
         try:
-            config = DatabaseConfig()
-            lines.append(f"Database Host: {config.host}")
-            lines.append(f"Database Port: {config.port}")
-            lines.append(f"Database Name: {config.database}")
-            lines.append(f"Database User: {config.user}")
-            lines.append(f"SSL Mode: {config.sslmode}")
-            lines.append(f"Pool Size: {config.pool_size}")
-            lines.append(f"Max Overflow: {config.max_overflow}")
-            lines.append("")
+            config = get_config()
+            buf.write(f"Database Host: {config.host}\n")
+            buf.write(f"Database Port: {config.port}\n")
+            buf.write(f"Database Name: {config.database}\n")
+            buf.write(f"Database User: {config.user}\n")
+            buf.write(f"SSL Mode: {config.sslmode}\n")
+            buf.write(f"Pool Size: {config.pool_size}\n")
+            buf.write(f"Max Overflow: {config.max_overflow}\n\n")
         except Exception as e:
-            lines.append(f"❌ Configuration Error: {e}")
-            lines.append("")
+            buf.write(f"❌ Configuration Error: {e}\n\n")
 
     # Connection test
     if check_connection:
-        lines.append("CONNECTION TEST")
-        lines.append("-" * 30)
+        buf.write(f"CONNECTION TEST\n{_SEP30}\n")
         try:
             from ..session import get_session
 
             if verbose:
                 click.echo("Testing database connection...")
 
+            probe = _connection_probe()
             with get_session() as session:
-                # Simple test query
-                from sqlalchemy import text
-
-                result = session.execute(text("SELECT 1 as test")).fetchone()
+                result = session.execute(probe).fetchone()
                 if result and result[0] == 1:
-                    lines.append("✅ Database connection successful")
+                    buf.write("✅ Database connection successful\n")
                 else:
-                    lines.append("❌ Database connection failed: Invalid response")
+                    buf.write("❌ Database connection failed: Invalid response\n")
         except ImportError:
-            lines.append(
-                "❌ Database connection test unavailable: Missing dependencies"
-            )
+            buf.write("❌ Database connection test unavailable: Missing dependencies\n")
         except Exception as e:
-            lines.append(f"❌ Database connection failed: {e}")
-        lines.append("")
+            buf.write(f"❌ Database connection failed: {e}\n")
+        buf.write("\n")
 
     # Feature availability
-    lines.append("FEATURE AVAILABILITY")
-    lines.append("-" * 30)
+    buf.write(f"FEATURE AVAILABILITY\n{_SEP30}\n")
 
     # Check for optional dependencies
     features = [
@@ -98,38 +124,42 @@ def show_info(
         except Exception as e:
             status = f"❌ Error: {e}"
 
-        lines.append(f"{feature_name}: {status}")
+        buf.write(f"{feature_name}: {status}\n")
 
-    lines.append("")
+    buf.write("\n")
 
     # Usage examples
-    lines.append("USAGE EXAMPLES")
-    lines.append("-" * 30)
-    lines.append("dbsync-py validate              # Validate schema")
-    lines.append("dbsync-py validate --coverage-only  # Show coverage only")
-    lines.append("dbsync-py benchmark             # Run benchmarks")
-    lines.append("dbsync-py benchmark --quick     # Quick benchmarks")
-    lines.append("dbsync-py info --check-connection  # Test connection")
-    lines.append("dbsync-py --help                # Show help")
+    buf.write(_USAGE_EXAMPLES)
+
+    click.echo(buf.getvalue())
+
+
+@functools.cache
+def _connection_probe() -> "TextClause":
+    """Return the ``SELECT 1`` statement used to test the database connection.
+
+    Built once per process; SQLAlchemy is imported here rather than at module
+    level so ``info`` without ``--check-connection`` never loads it.
+    """
+    from sqlalchemy import text
 
-    click.echo("\n".join(lines))
+    return text("SELECT 1 as test")
 
 
 def _has_schema_validation() -> bool:
     """Check if schema validation functionality is available."""
-    return importlib.util.find_spec("schema_validation.schema_validator") is not None
+    return _SCHEMA_VALIDATION_AVAILABLE
 
 
 def _has_benchmark_utils() -> bool:
     """Check if benchmark utilities are available."""
-    return importlib.util.find_spec("benchmarks.benchmark_utils") is not None
+    return _BENCHMARK_UTILS_AVAILABLE
 
 
 def _has_database_functionality() -> bool:
     """Check if database functionality is available."""
-    return importlib.util.find_spec("dbsync.session") is not None
+    return _DATABASE_AVAILABLE
 
 
-def _has_async_functionality() -> bool:
-    """Check if async functionality is available."""
-    return importlib.util.find_spec("dbsync.session") is not None
+# Sync and async sessions both live in dbsync.session, so one probe covers both
+_has_async_functionality = _has_database_functionality
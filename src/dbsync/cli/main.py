@@ -4,6 +4,7 @@
 Provides command-line interface for schema validation, benchmarking, and other utilities.
 """
 
+import importlib
 import sys
 
 import click
@@ -11,7 +12,47 @@ import click
 from ..config import get_version
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports some subcommands only when they are requested.
+
+    Subcommands whose module cannot be imported (missing optional dependencies)
+    are silently left out, as they were when registered eagerly.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> module (relative to this package) defining it
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy subcommand names without importing anything."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the named subcommand, importing its module if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command | None:
+        """Import a lazy subcommand's module and return the command object."""
+        try:
+            module = importlib.import_module(
+                self.lazy_subcommands[cmd_name], package=__package__
+            )
+        except ImportError:
+            return None  # Optional dependencies not available
+        return getattr(module, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "query": ".query",
+        "performance": ".performance",
+        "coverage": ".coverage",
+    },
+)
 @click.version_option(version=get_version(), prog_name="dbsync-py")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.pass_context
@@ -28,13 +69,18 @@ def main(ctx: click.Context, verbose: bool) -> None:
 @main.command()
 @click.option(
     "--format",
-    type=click.Choice(["text", "json"]),
+    type=click.Choice(["text", "json", "ndjson"]),
     default="text",
-    help="Output format (text or json)",
+    help="Output format (text, json, or ndjson with one table per line)",
 )
 @click.option("--coverage-only", is_flag=True, help="Show only coverage statistics")
 @click.option("--errors-only", is_flag=True, help="Show only validation errors")
 @click.option("--output", "-o", type=click.Path(), help="Output file (default: stdout)")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Download the official schema even if a cached copy is fresh",
+)
 @click.pass_context
 def validate(
     ctx: click.Context,
@@ -42,11 +88,13 @@ def validate(
     coverage_only: bool,
     errors_only: bool,
     output: str | None,
+    no_cache: bool,
 ) -> None:
     """Validate database schema against official Cardano DB Sync schema.
 
-    Downloads the latest schema from the official repository and validates
-    all implemented models against it, reporting any discrepancies.
+    Downloads the latest schema from the official repository (reusing a copy
+    downloaded within the last day) and validates all implemented models
+    against it, reporting any discrepancies.
     """
     from .validate import run_validation
 
@@ -59,6 +107,7 @@ def validate(
             errors_only=errors_only,
             output_file=output,
             verbose=verbose,
+            use_cache=not no_cache,
         )
     except Exception as e:
         if verbose:
@@ -122,30 +171,5 @@ def info(ctx: click.Context, check_connection: bool, show_config: bool) -> None:
         sys.exit(1)
 
 
-# Add query examples commands
-try:
-    from .query import query
-
-    main.add_command(query)
-except ImportError:
-    pass  # Query examples not available
-
-# Add performance monitoring commands if available
-try:
-    from .performance import performance
-
-    main.add_command(performance)
-except ImportError:
-    pass  # Performance monitoring dependencies not available
-
-# Add coverage analysis commands if available
-try:
-    from .coverage import coverage
-
-    main.add_command(coverage)
-except ImportError:
-    pass  # Coverage analysis dependencies not available
-
-
 if __name__ == "__main__":
     main()
@@ -4,34 +4,51 @@ Provides command-line interface for performance monitoring, baseline management,
 regression detection, and performance profiling operations.
 """
 
+import functools
+import importlib.util
+import os
+import shutil
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import click
 
-# Import only what we actually use
-try:
-    from ..performance import (
-        BaselineManager,
-        ExecutionProfiler,
-        MemoryProfiler,
-        PerformanceMonitor,
-        PerformanceReporter,
-        RegressionDetector,
-    )
-except ImportError:
-    BaselineManager = None
-    ExecutionProfiler = None
-    MemoryProfiler = None
-    PerformanceMonitor = None
-    PerformanceReporter = None
-    RegressionDetector = None
+# The performance toolchain is imported inside each command so that
+# unrelated CLI invocations do not pay for loading it; availability is
+# checked without executing the package.
+_PERF_AVAILABLE = importlib.util.find_spec("dbsync.performance") is not None
+
+# Directories holding generated performance data; only these may be removed
+# wholesale by ``clean``
+_DEFAULT_DATA_DIRS = (
+    Path("tests/performance/baselines"),
+    Path("tests/performance/reports"),
+    Path("tests/performance/profiles"),
+)
+
+
+def _with_verbose(fn: Callable[..., None]) -> Callable[..., None]:
+    """Pass the context and the group's ``verbose`` flag to a subcommand.
+
+    Replaces ``@click.pass_context``; the wrapped command receives
+    ``(ctx, verbose, **options)``.
+    """
+
+    @functools.wraps(fn)
+    @click.pass_context
+    def wrapper(ctx: click.Context, *args: Any, **kwargs: Any) -> None:
+        verbose = ctx.parent.obj.get("verbose", False)
+        return fn(ctx, verbose, *args, **kwargs)
+
+    return wrapper
 
 
 @click.group()
 def performance():
     """Performance monitoring and analysis tools."""
-    if not BaselineManager or not PerformanceReporter or not RegressionDetector:
+    if not _PERF_AVAILABLE:
         click.echo(
             "Error: Performance monitoring dependencies not available.", err=True
         )
@@ -55,18 +72,19 @@ def performance():
     help="Directory containing performance baselines",
 )
 @click.option("--include-charts", is_flag=True, help="Include trend charts in reports")
-@click.pass_context
+@_with_verbose
 def report(
     ctx: click.Context,
+    verbose: bool,
     output: str | None,
     format: str,
     baseline_dir: str | None,
     include_charts: bool,
 ) -> None:
     """Generate performance reports from collected metrics."""
-    verbose = ctx.parent.obj.get("verbose", False)
-
     try:
+        from ..performance import BaselineManager, PerformanceReporter
+
         output_path = Path(output) if output else Path("tests/performance/reports")
         baseline_path = Path(baseline_dir) if baseline_dir else None
 
@@ -74,17 +92,14 @@ def report(
         reporter = PerformanceReporter(output_path)
         baseline_manager = BaselineManager(baseline_path) if baseline_path else None
 
-        # Load metrics from recent test runs
-        metrics_files = list(output_path.glob("metrics_*.json"))
-        if not metrics_files:
+        # Load most recent metrics from recent test runs
+        latest_metrics_file = _latest_metrics_file(output_path)
+        if latest_metrics_file is None:
             click.echo(
                 "No performance metrics found. Run tests with performance monitoring first."
             )
             return
 
-        # Load most recent metrics
-        latest_metrics_file = max(metrics_files, key=lambda p: p.stat().st_mtime)
-
         if verbose:
             click.echo(f"Loading metrics from: {latest_metrics_file}")
 
@@ -136,9 +151,10 @@ def report(
 @click.option(
     "--cpu-threshold", type=float, default=1.4, help="CPU regression threshold factor"
 )
-@click.pass_context
+@_with_verbose
 def baseline(
     ctx: click.Context,
+    verbose: bool,
     baseline_dir: str | None,
     test_pattern: str | None,
     duration_threshold: float,
@@ -146,9 +162,9 @@ def baseline(
     cpu_threshold: float,
 ) -> None:
     """Create or update performance baselines."""
-    verbose = ctx.parent.obj.get("verbose", False)
-
     try:
+        from ..performance import BaselineManager
+
         baseline_path = (
             Path(baseline_dir) if baseline_dir else Path("tests/performance/baselines")
         )
@@ -202,18 +218,19 @@ def baseline(
     default="text",
     help="Output format",
 )
-@click.pass_context
+@_with_verbose
 def detect(
     ctx: click.Context,
+    verbose: bool,
     baseline_dir: str | None,
     sensitivity: float,
     output: str | None,
     format: str,
 ) -> None:
     """Detect performance regressions against baselines."""
-    verbose = ctx.parent.obj.get("verbose", False)
-
     try:
+        from ..performance import BaselineManager, RegressionDetector
+
         baseline_path = (
             Path(baseline_dir) if baseline_dir else Path("tests/performance/baselines")
         )
@@ -254,17 +271,16 @@ def detect(
 @click.option("--execution", is_flag=True, help="Enable execution profiling")
 @click.option("--output", "-o", type=click.Path(), help="Output directory for profiles")
 @click.argument("test_command", nargs=-1)
-@click.pass_context
+@_with_verbose
 def profile(
     ctx: click.Context,
+    verbose: bool,
     memory: bool,
     execution: bool,
     output: str | None,
     test_command: tuple,
 ) -> None:
     """Profile test execution with detailed analysis."""
-    verbose = ctx.parent.obj.get("verbose", False)
-
     if not test_command:
         click.echo("Error: No test command provided.")
         click.echo("Example: dbsync-py performance profile --memory pytest tests/unit/")
@@ -306,9 +322,10 @@ def profile(
 )
 @click.option("--all", "clean_all", is_flag=True, help="Clean all performance data")
 @click.option("--confirm", is_flag=True, help="Skip confirmation prompt")
-@click.pass_context
+@_with_verbose
 def clean(
     ctx: click.Context,
+    verbose: bool,
     baseline_dir: str | None,
     reports_dir: str | None,
     profiles_dir: str | None,
@@ -316,19 +333,11 @@ def clean(
     confirm: bool,
 ) -> None:
     """Clean performance monitoring data."""
-    verbose = ctx.parent.obj.get("verbose", False)
-
     try:
         dirs_to_clean = []
 
         if clean_all:
-            dirs_to_clean.extend(
-                [
-                    Path("tests/performance/baselines"),
-                    Path("tests/performance/reports"),
-                    Path("tests/performance/profiles"),
-                ]
-            )
+            dirs_to_clean.extend(_DEFAULT_DATA_DIRS)
         else:
             if baseline_dir:
                 dirs_to_clean.append(Path(baseline_dir))
@@ -353,9 +362,9 @@ def clean(
 
         # Show what will be cleaned
         click.echo("The following directories will be cleaned:")
-        for dir_path in existing_dirs:
-            file_count = len(list(dir_path.glob("*")))
-            click.echo(f"  {dir_path} ({file_count} files)")
+        dir_files = {dir_path: _scan_dir(dir_path) for dir_path in existing_dirs}
+        for dir_path, (entries, _) in dir_files.items():
+            click.echo(f"  {dir_path} ({len(entries)} files)")
 
         # Confirmation
         if not confirm and not click.confirm(
@@ -365,12 +374,18 @@ def clean(
             return
 
         # Clean directories
-        for dir_path in existing_dirs:
-            for file_path in dir_path.glob("*"):
-                if file_path.is_file():
-                    file_path.unlink()
-                    if verbose:
-                        click.echo(f"Deleted: {file_path}")
+        for dir_path, (entries, files_only) in dir_files.items():
+            if not verbose and files_only and _is_default_data_dir(dir_path):
+                # Drop and recreate the directory rather than unlinking each file
+                shutil.rmtree(dir_path)
+                dir_path.mkdir(parents=True, exist_ok=True)
+            elif verbose:
+                for entry in entries:
+                    os.unlink(entry.path)
+                    click.echo(f"Deleted: {entry.path}")
+            else:
+                for entry in entries:
+                    os.unlink(entry.path)
 
             click.echo(f"Cleaned: {dir_path}")
 
@@ -381,3 +396,45 @@ def clean(
             raise
         click.echo(f"Error cleaning performance data: {e}", err=True)
         sys.exit(1)
+
+
+def _latest_metrics_file(output_path: Path) -> Path | None:
+    """Find the most recently modified ``metrics_*.json`` file in one scan."""
+    latest, latest_mtime = None, float("-inf")
+    try:
+        with os.scandir(output_path) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith("metrics_") and name.endswith(".json")):
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+    except FileNotFoundError:
+        return None
+    return Path(latest) if latest else None
+
+
+def _scan_dir(dir_path: Path) -> tuple[list[os.DirEntry], bool]:
+    """List the files directly inside ``dir_path`` in a single directory scan.
+
+    Returns:
+        The file entries, and whether the directory contains nothing but files
+    """
+    files_only = True
+    files = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.is_file():
+                files.append(entry)
+            else:
+                files_only = False
+    return files, files_only
+
+
+def _is_default_data_dir(dir_path: Path) -> bool:
+    """Check whether ``dir_path`` is one of the package's own data directories."""
+    if dir_path.is_symlink():
+        return False
+    resolved = dir_path.resolve()
+    return any(resolved == d.resolve() for d in _DEFAULT_DATA_DIRS)
@@ -0,0 +1,533 @@
+"""Text formatters for the query example commands.
+
+Kept apart from :mod:`dbsync.cli.query` so that ``--format json`` runs never
+import them.
+"""
+
+import io
+from itertools import islice
+from typing import Any
+
+from .query import _to_ada
+
+_RULE40 = "=" * 40
+_RULE50 = "=" * 50
+_RULE60 = "=" * 60
+
+
+def _write_individual_results(buf: io.StringIO, results: dict[str, Any]) -> None:
+    """Write the sections for individual chain metadata query results."""
+    queries = results["queries"]
+    meta = queries["chain_metadata"]
+    supply = queries["current_supply"]
+
+    buf.write(f"\n1. Chain Metadata:\n   Network: {meta['network']}\n")
+    if meta["start_time"]:
+        buf.write(f"   Start time: {meta['start_time']}\n")
+
+    buf.write(
+        "\n2. Current Supply:\n"
+        f"   Total: {supply['lovelace']:,} Lovelace\n"
+        f"   Total: {supply['ada']:,.2f} ADA\n"
+        "\n3. Latest Slot:\n"
+    )
+    if queries["latest_slot"]:
+        buf.write(f"   Latest slot: {queries['latest_slot']:,}\n")
+    else:
+        buf.write("   Latest slot: Unknown\n")
+
+    buf.write(
+        "\n4. Database Information:\n"
+        f"   Database size: {queries['database_size']}\n"
+        f"   Block table size: {queries['block_table_size']}\n"
+        "\n5. Sync Status:\n"
+        f"   Progress: {queries['sync_progress_percent']:.2f}%\n"
+        f"   Behind by: {queries['sync_behind'] or 'Unknown'}\n"
+        f"\nTotal queries executed: {results['total_queries']}\n"
+    )
+
+
+def _write_summary_results(buf: io.StringIO, results: dict[str, Any]) -> None:
+    """Write the lines for the comprehensive chain info summary."""
+    info = results["chain_info"]
+
+    buf.write(f"Network: {info['network']}\n")
+    if info["start_time"]:
+        buf.write(f"Start time: {info['start_time']}\n")
+    buf.write(
+        f"Supply: {info['supply_ada']:,.2f} ADA ({info['supply_lovelace']:,} Lovelace)\n"
+    )
+
+    if info["latest_slot"]:
+        buf.write(f"Latest slot: {info['latest_slot']:,}\n")
+    else:
+        buf.write("Latest slot: Unknown\n")
+
+    buf.write(
+        f"Database size: {info['database_size']}\n"
+        f"Block table size: {info['block_table_size']}\n"
+        f"Sync progress: {info['sync_progress_percent']:.2f}%\n"
+    )
+
+    if info["sync_behind"]:
+        buf.write(f"Sync behind by: {info['sync_behind']}\n")
+    else:
+        buf.write("Sync status: Up to date\n")
+
+
+# Chain metadata result type -> writer for its body
+_CHAIN_METADATA_WRITERS = {
+    "individual_results": _write_individual_results,
+    "summary_results": _write_summary_results,
+}
+
+
+def format_chain_metadata_output(results: dict[str, Any]) -> str:
+    """Format results as human-readable text."""
+    buf = io.StringIO()
+    buf.write(f"Chain Metadata Query Examples\n{_RULE40}\n")
+
+    _CHAIN_METADATA_WRITERS[results["type"]](buf, results)
+
+    buf.write(
+        f"\n{_RULE40}\n"
+        "✅ Examples completed successfully!\n"
+        "Source: dbsync.examples.queries.chain_metadata"
+    )
+
+    return buf.getvalue()
+
+
+def format_transaction_analysis_output(results: dict[str, Any]) -> str:
+    """Format transaction analysis results as human-readable text."""
+    period = results["analysis_period_days"]
+    fee_stats = results["fee_stats"]
+    throughput = results["throughput"]
+    size_dist = results["size_distribution"]
+    large_txs = results["large_transactions"]
+    summary = results["summary"]
+    min_fee_ada = _to_ada(fee_stats["min_fee"])
+    max_fee_ada = _to_ada(fee_stats["max_fee"])
+    total_fees_ada = _to_ada(fee_stats["total_fees"])
+
+    buf = io.StringIO()
+    buf.write(
+        f"Transaction Analysis Query Examples\n{_RULE50}\n"
+        f"\nAnalysis Period: {period} days\n"
+        f"Total Transactions: {fee_stats['tx_count']:,}\n"
+        "\n1. Fee Statistics:\n"
+        f"   Average fee: {summary['avg_fee_ada']:.4f} ADA\n"
+        f"   Min fee: {min_fee_ada:.4f} ADA\n"
+        f"   Max fee: {max_fee_ada:.4f} ADA\n"
+        f"   Total fees: {total_fees_ada:,.2f} ADA\n"
+        "\n2. Transaction Throughput:\n"
+        f"   Peak hourly: {throughput['peak_hour_transactions']:,} transactions\n"
+        f"   Average per hour: {throughput['average_per_hour']:.1f} transactions\n"
+        "\n3. Transaction Size Distribution:\n"
+        f"   Average inputs per transaction: {size_dist['avg_inputs']:.2f}\n"
+        f"   Average outputs per transaction: {size_dist['avg_outputs']:.2f}\n"
+        "\n4. Large Transactions (>1000 ADA):\n"
+        f"   Found: {large_txs['transaction_count']} transactions\n"
+    )
+    if large_txs["transactions"]:
+        largest = large_txs["transactions"][0]
+        buf.write(f"   Largest: {largest['total_output_ada']:,.2f} ADA\n")
+
+    buf.write(
+        f"\n{_RULE50}\n"
+        "✅ Examples completed successfully!\n"
+        "Source: dbsync.examples.queries.transaction_analysis"
+    )
+
+    return buf.getvalue()
+
+
+def format_pool_management_output(results: dict[str, Any]) -> str:
+    """Format pool analysis results as human-readable text."""
+    buf = io.StringIO()
+    buf.write(f"Pool Management & Block Production Examples\n{_RULE60}\n")
+
+    if not results["found"]:
+        buf.write(
+            f"\n❌ Pool {results['pool_id']} not found\n"
+            f"Error: {results.get('error', 'Unknown error')}"
+        )
+        return buf.getvalue()
+
+    pool_id = results["pool_id"]
+    epochs = results["analysis_epochs"]
+    summary = results["summary"]
+    registration = results["registration_info"]
+    block_production = results["block_production"]
+    rewards = results["rewards_analysis"]
+    status = results["operational_status"]
+
+    buf.write(
+        f"\nPool ID: {pool_id}\n"
+        f"Analysis Period: {epochs} epochs\n"
+        f"Status: {summary['status'].upper()}\n"
+        "\n1. Registration Information:\n"
+        f"   Pledge: {registration['pledge_ada']:,.2f} ADA\n"
+        f"   Margin: {registration['margin_percent']:.2f}%\n"
+        f"   Fixed Cost: {registration['fixed_cost_ada']:.2f} ADA\n"
+    )
+    if registration["metadata"]:
+        metadata = registration["metadata"]
+        if metadata.get("ticker"):
+            buf.write(f"   Ticker: {metadata['ticker']}\n")
+        if metadata.get("name"):
+            buf.write(f"   Name: {metadata['name']}\n")
+
+    buf.write(
+        f"\n2. Block Production:\n   Total blocks produced: {summary['total_blocks']:,}\n"
+    )
+    if block_production["epochs_analyzed"] > 0:
+        avg_blocks = summary["total_blocks"] / block_production["epochs_analyzed"]
+        buf.write(f"   Average per epoch: {avg_blocks:.2f}\n")
+
+    buf.write(
+        f"   Epoch range: {block_production.get('epoch_range', 'N/A')}\n"
+        "\n3. Current Delegation:\n"
+        f"   Total delegators: {summary['total_delegators']:,}\n"
+        f"   Total stake: {summary['total_stake_ada']:,.2f} ADA\n"
+        "\n4. Rewards (Recent Epochs):\n"
+        f"   Total rewards distributed: {summary['total_rewards_ada']:,.2f} ADA\n"
+    )
+    if rewards["epochs_analyzed"] > 0:
+        avg_rewards = summary["total_rewards_ada"] / rewards["epochs_analyzed"]
+        buf.write(f"   Average per epoch: {avg_rewards:.2f} ADA\n")
+
+    buf.write(
+        "\n5. Operational Details:\n"
+        f"   Current epoch: {status.get('current_epoch', 'Unknown')}\n"
+    )
+    if status.get("pool_hash"):
+        buf.write(f"   Pool hash: {status['pool_hash'][:16]}...\n")
+
+    buf.write(
+        f"\n{_RULE60}\n"
+        "✅ Examples completed successfully!\n"
+        "Source: dbsync.examples.queries.pool_management"
+    )
+
+    return buf.getvalue()
+
+
+def format_staking_delegation_output(results: dict[str, Any]) -> str:
+    """Format staking analysis results as human-readable text."""
+    buf = io.StringIO()
+    buf.write(f"Staking & Delegation Pattern Examples\n{_RULE60}\n")
+
+    if not results["found"]:
+        buf.write(
+            f"\n❌ Stake address {results['stake_address']} not found\n"
+            f"Error: {results.get('error', 'Unknown error')}"
+        )
+        return buf.getvalue()
+
+    stake_address = results["stake_address"]
+    summary = results["summary"]
+    delegation_history = results["delegation_history"]
+    lifecycle = results["lifecycle"]
+    rewards = results["rewards"]
+    network_context = results["network_context"]
+
+    buf.write(
+        f"\nStake Address: {stake_address}\n"
+        f"Status: {'ACTIVE' if summary['is_active'] else 'INACTIVE'}\n"
+        "\n1. Current Status:\n"
+        f"   Current stake: {summary['current_stake_ada']:,.2f} ADA\n"
+        f"   Total rewards earned: {summary['total_rewards_ada']:,.2f} ADA\n"
+        f"   Total delegations: {summary['delegation_count']}\n"
+        "\n2. Delegation Lifecycle:\n"
+    )
+    if lifecycle["registration"]["tx_id"]:
+        buf.write(f"   Registered: Yes (TX: {lifecycle['registration']['tx_id']})\n")
+    else:
+        buf.write("   Registered: No\n")
+
+    if lifecycle["deregistration"]["tx_id"]:
+        buf.write(
+            f"   Deregistered: Yes (TX: {lifecycle['deregistration']['tx_id']})\n"
+        )
+    else:
+        buf.write("   Deregistered: No\n")
+
+    if lifecycle["current_delegation"]["pool_hash_id"]:
+        buf.write(
+            f"   Current pool: {lifecycle['current_delegation']['pool_hash_id']}\n"
+            f"   Since epoch: {lifecycle['current_delegation']['epoch']}\n"
+        )
+
+    buf.write("\n3. Delegation History:\n")
+    if delegation_history["total_delegations"] > 0:
+        buf.write(
+            f"   Total delegation changes: {delegation_history['total_delegations']}\n"
+        )
+        # Show first few delegations
+        all_history = delegation_history["delegation_history"]
+        history_count = len(all_history)
+        buf.writelines(
+            f"   {i}. Epoch {delegation['epoch']} → Pool {delegation['pool_hash_id']}\n"
+            for i, delegation in enumerate(islice(all_history, 5), 1)
+        )
+        if history_count > 5:
+            buf.write(f"   ... and {history_count - 5} more delegation(s)\n")
+    else:
+        buf.write("   No delegation history found\n")
+
+    buf.write("\n4. Reward History:\n")
+    if rewards["total_rewards"] > 0:
+        buf.write(
+            f"   Epochs analyzed: {rewards['epochs_analyzed']}\n"
+            f"   Epoch range: {rewards['epoch_range']}\n"
+            f"   Total rewards: {rewards['total_rewards_ada']:,.2f} ADA\n"
+            f"   Average per epoch: {rewards['total_rewards_ada'] / rewards['epochs_analyzed']:,.2f} ADA\n"
+        )
+
+        # Show reward history
+        recent_rewards = rewards["rewards_history"][-3:]  # Last 3 epochs
+        if recent_rewards:
+            buf.write("   Recent epochs:\n")
+            # Joining the by_type dict iterates its keys without copying them
+            buf.writelines(
+                f"     Epoch {epoch_reward['epoch']}: "
+                f"{_to_ada(epoch_reward['total_rewards']):.2f} ADA "
+                f"({', '.join(epoch_reward['by_type'])})\n"
+                for epoch_reward in recent_rewards
+            )
+    else:
+        buf.write("   No rewards found in analyzed period\n")
+
+    buf.write("\n5. Network Context:\n")
+    active_monitoring = network_context["active_monitoring"]
+    if active_monitoring["found"]:
+        buf.write(
+            f"   Network active stake: {active_monitoring['total_active_stake_ada']:,.0f} ADA\n"
+            f"   Active delegators: {active_monitoring['active_delegators']:,}\n"
+            f"   Active pools: {active_monitoring['active_pools']:,}\n"
+            f"   Average stake per delegator: {active_monitoring['average_stake_per_delegator_ada']:,.0f} ADA\n"
+        )
+
+    buf.write(
+        f"\n{_RULE60}\n"
+        "✅ Examples completed successfully!\n"
+        "Source: dbsync.examples.queries.staking_delegation"
+    )
+
+    return buf.getvalue()
+
+
+def format_smart_contracts_output(results: dict[str, Any]) -> str:
+    """Format smart contracts analysis results as human-readable text."""
+    buf = io.StringIO()
+    buf.write(f"Smart Contracts & Scripts Analysis\n{_RULE50}\n")
+
+    if not results.get("found"):
+        buf.write(
+            f"\n❌ Analysis failed\nError: {results.get('error', 'Unknown error')}"
+        )
+        return buf.getvalue()
+
+    summary = results.get("summary", {})
+    buf.write(
+        f"\nAnalysis Period: {results.get('analysis_period_days', 'N/A')} days\n"
+        "\n📊 Network Summary:\n"
+        f"   Total scripts: {summary.get('total_scripts', 0):,}\n"
+        f"   Native scripts: {summary.get('native_scripts', 0):,}\n"
+        f"   Plutus scripts: {summary.get('plutus_scripts', 0):,}\n"
+        f"   Executions (period): {summary.get('total_executions', 0):,}\n"
+    )
+
+    script_analysis = results.get("script_analysis", {})
+    if script_analysis.get("found") and script_analysis.get("scripts"):
+        buf.write("\n🔍 Script Analysis:\n")
+        buf.writelines(
+            f"   {i}. "
+            f"{script['script_hash'][:16] + '...' if script['script_hash'] else 'N/A'}"
+            f" ({script['type']}) - {script['total_usage']} uses\n"
+            for i, script in enumerate(islice(script_analysis["scripts"], 5), 1)
+        )
+
+    buf.write(f"\n{_RULE50}\n✅ Analysis completed")
+    return buf.getvalue()
+
+
+def format_multi_asset_output(results: dict[str, Any]) -> str:
+    """Format multi-asset analysis results as human-readable text."""
+    buf = io.StringIO()
+    buf.write(f"Multi-Asset & Token Operations Analysis\n{_RULE50}\n")
+
+    if not results.get("found"):
+        buf.write(
+            f"\n❌ Analysis failed\nError: {results.get('error', 'Unknown error')}"
+        )
+        return buf.getvalue()
+
+    buf.write(f"\nAnalysis Period: {results.get('analysis_period_days', 'N/A')} days\n")
+    if results.get("policy_id"):
+        buf.write(f"Policy ID: {results['policy_id']}\n")
+
+    summary = results.get("summary", {})
+    buf.write(
+        "\n📊 Network Summary:\n"
+        f"   Total assets: {summary.get('total_assets', 0):,}\n"
+        f"   Total policies: {summary.get('total_policies', 0):,}\n"
+        f"   Active assets (period): {summary.get('active_assets_period', 0):,}\n"
+        f"   Total transfers (period): {summary.get('total_transfers_period', 0):,}\n"
+    )
+
+    portfolio = results.get("portfolio_analysis", {})
+    if portfolio.get("found") and portfolio.get("portfolio"):
+        buf.write("\n💰 Top Token Holdings:\n")
+        buf.writelines(
+            f"   {i}. {(token['asset_name'] or 'Unnamed')[:20]} - "
+            f"{token['total_quantity']:,} tokens, {token['holder_count']} holders\n"
+            for i, token in enumerate(islice(portfolio["portfolio"], 5), 1)
+        )
+
+    metadata = results.get("metadata_tracking", {})
+    if metadata.get("found") and metadata.get("assets"):
+        buf.write("\n📝 Recent Asset Activity:\n")
+        buf.writelines(
+            f"   {i}. {(asset['asset_name'] or 'Unnamed')[:20]} - "
+            f"Minted: {asset['mint_quantity']:,}\n"
+            for i, asset in enumerate(islice(metadata["assets"], 3), 1)
+        )
+
+    transfers = results.get("transfer_patterns", {})
+    if transfers.get("found") and transfers.get("top_patterns"):
+        buf.write("\n🔄 Top Transfer Patterns:\n")
+        buf.writelines(
+            f"   {i}. {(pattern['asset_name'] or 'Unnamed')[:20]} - "
+            f"{pattern['transfer_count']} transfers, "
+            f"{pattern['unique_recipients']} recipients\n"
+            for i, pattern in enumerate(islice(transfers["top_patterns"], 3), 1)
+        )
+
+    buf.write(f"\n{_RULE50}\n✅ Analysis completed")
+    return buf.getvalue()
+
+
+def _proposal_row(i: int, proposal: dict[str, Any]) -> str:
+    """Format one governance proposal."""
+    return (
+        f"   {i}. #{proposal['index']} ({proposal['action_type']}) - "
+        f"{proposal['status']}\n"
+        f"      Deposit: {proposal['deposit_lovelace']:,} lovelace\n"
+    )
+
+
+def _drep_row(i: int, drep: dict[str, Any]) -> str:
+    """Format one DRep delegation leader."""
+    return (
+        f"   {i}. {drep['drep_id'][:20]}... - {drep['delegator_count']} delegators\n"
+        f"      Total stake: {drep['total_stake_lovelace']:,} lovelace\n"
+    )
+
+
+# Ranked lists in the governance report, in output order:
+# (section key, heading, list key, entries shown, row formatter)
+_GOVERNANCE_LISTS = (
+    (
+        "proposal_analysis",
+        "🏛️ Recent Governance Proposals:",
+        "proposals",
+        5,
+        _proposal_row,
+    ),
+    (
+        "drep_activity",
+        "🗳️ Top DRep Delegation Leaders:",
+        "delegation_leaders",
+        3,
+        _drep_row,
+    ),
+)
+
+# Statistics blocks following the lists:
+# (section key, heading, statistics key, ((line template, statistic), ...))
+_GOVERNANCE_STATISTICS = (
+    (
+        "committee_operations",
+        "👥 Committee Operations:",
+        "statistics",
+        (
+            ("Total Members: {}", "total_members"),
+            ("Active Members: {}", "active_members"),
+            ("Total Registrations: {}", "total_registrations"),
+        ),
+    ),
+    (
+        "treasury_analysis",
+        "💰 Treasury Activity:",
+        "statistics",
+        (
+            ("Total Withdrawals: {:,}", "total_withdrawals"),
+            ("Total Amount: {:,} lovelace", "total_amount_lovelace"),
+            ("Unique Recipients: {}", "unique_recipients"),
+        ),
+    ),
+    (
+        "voting_metrics",
+        "🗳️ Voting Participation:",
+        "overall_statistics",
+        (
+            ("Total Votes: {:,}", "total_votes"),
+            ("Proposals Voted On: {:,}", "proposals_voted_on"),
+            ("Active DRep Voters: {:,}", "unique_drep_voters"),
+        ),
+    ),
+)
+
+
+def format_governance_output(results: dict[str, Any]) -> str:
+    """Format governance analysis results as human-readable text."""
+    buf = io.StringIO()
+    buf.write(f"Conway Era Governance Analysis\n{_RULE50}\n")
+
+    if not results.get("found"):
+        buf.write(
+            f"\n❌ Analysis failed\nError: {results.get('error', 'Unknown error')}"
+        )
+        return buf.getvalue()
+
+    params = results.get("analysis_parameters", {})
+    buf.write(f"\nAnalysis Period: {params.get('analysis_period_days', 'N/A')} days\n")
+    if params.get("proposal_id"):
+        buf.write(f"Proposal ID: {params['proposal_id']}\n")
+    if params.get("drep_id"):
+        buf.write(f"DRep ID: {params['drep_id']}\n")
+    if params.get("committee_member"):
+        buf.write(f"Committee Member: {params['committee_member']}\n")
+
+    summary = results.get("summary", {})
+    buf.write(
+        "\n📊 Governance Summary:\n"
+        f"   Total Proposals: {summary.get('total_proposals', 0):,}\n"
+        f"   Total DReps: {summary.get('total_dreps', 0):,}\n"
+        f"   Active Committee Members: {summary.get('active_committee_members', 0):,}\n"
+        f"   Treasury Withdrawals: {summary.get('treasury_withdrawals', 0):,}\n"
+        f"   Total Votes: {summary.get('total_votes', 0):,}\n"
+    )
+
+    for key, heading, list_key, limit, format_row in _GOVERNANCE_LISTS:
+        section = results.get(key, {})
+        if section.get("found") and section.get(list_key):
+            buf.write(f"\n{heading}\n")
+            buf.writelines(
+                format_row(i, entry)
+                for i, entry in enumerate(islice(section[list_key], limit), 1)
+            )
+
+    for key, heading, stats_key, rows in _GOVERNANCE_STATISTICS:
+        section = results.get(key, {})
+        if section.get("found"):
+            stats = section.get(stats_key, {})
+            buf.write(f"\n{heading}\n")
+            buf.writelines(
+                f"   {template.format(stats.get(stat, 0))}\n" for template, stat in rows
+            )
+
+    buf.write(f"\n{_RULE50}\n✅ Conway Era Governance analysis completed")
+    return buf.getvalue()
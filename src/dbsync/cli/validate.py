@@ -3,23 +3,71 @@
 Provides CLI interface for validating database schema against official Cardano DB Sync schema.
 """
 
+import contextlib
+import functools
+import importlib.util
 import json
-
-# Import the existing schema validation functionality
 import sys
+import time
+from operator import itemgetter
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, TextIO
 
 import click
 
-# Add tests directory to path to import schema validation
-tests_path = Path(__file__).parent.parent.parent.parent / "tests"
-sys.path.insert(0, str(tests_path))
+from ._cache import cache_dir, write_entry
+from ._io import open_output, write_json
+
+if TYPE_CHECKING:
+    import requests
+    from schema_validation.schema_validator import ValidationResult
 
-from schema_validation.schema_validator import (
-    SchemaValidator,
-    ValidationResult,
+# The validator lives with the tests rather than in the installed package
+_SCHEMA_VALIDATOR_PATH = (
+    Path(__file__).parent.parent.parent.parent
+    / "tests"
+    / "schema_validation"
+    / "schema_validator.py"
 )
 
+_RULE80 = "=" * 80
+_SEP50 = "-" * 50
+
+# How long a downloaded official schema is reused, in seconds
+_SCHEMA_CACHE_TTL = 24 * 60 * 60
+
+
+@functools.cache
+def _load_schema_validator() -> ModuleType:
+    """Import the schema validator module from the tests directory.
+
+    The module is loaded from its file path, so ``sys.path`` is left alone
+    and the import is only paid for when validation actually runs.
+
+    Raises:
+        click.ClickException: If the validator is not available, as in
+            installs without the source tree.
+    """
+    name = "schema_validation.schema_validator"
+    if name in sys.modules:
+        return sys.modules[name]
+    if not _SCHEMA_VALIDATOR_PATH.is_file():
+        raise click.ClickException(
+            f"Schema validator not found at {_SCHEMA_VALIDATOR_PATH}; "
+            "validate must be run from a source checkout"
+        )
+
+    spec = importlib.util.spec_from_file_location(name, _SCHEMA_VALIDATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
 
 def run_validation(
     format: str = "text",
@@ -27,28 +75,31 @@ def run_validation(
     errors_only: bool = False,
     output_file: str | None = None,
     verbose: bool = False,
+    use_cache: bool = True,
 ) -> None:
     """Run schema validation with the specified options.
 
     Args:
-        format: Output format ("text" or "json")
+        format: Output format ("text", "json" or "ndjson")
         coverage_only: Show only coverage statistics
         errors_only: Show only validation errors
         output_file: Output file path (None for stdout)
         verbose: Enable verbose output
+        use_cache: Reuse an official schema downloaded in the last day
     """
     if verbose:
         click.echo("Initializing schema validator...")
 
     # Initialize the validator
-    validator = SchemaValidator()
+    validator = _load_schema_validator().SchemaValidator()
 
     if verbose:
         click.echo("Fetching official schema...")
 
     # Fetch the official schema
     try:
-        validator.fetch_official_schema()
+        schema = _official_schema_markdown(validator.OFFICIAL_SCHEMA_URL, use_cache)
+        validator.load_official_schema(schema)
     except Exception as e:
         raise click.ClickException(f"Failed to fetch official schema: {e}")
 
@@ -61,75 +112,153 @@ def run_validation(
     except Exception as e:
         raise click.ClickException(f"Validation failed: {e}")
 
-    # Generate output
-    if format == "json":
-        output = _generate_json_output(results, coverage_only, errors_only)
-    else:
-        output = _generate_text_output(results, coverage_only, errors_only, verbose)
-
     # Write output
     if output_file:
         try:
-            with open(output_file, "w") as f:
-                f.write(output)
+            with open_output(output_file) as f:
+                _write_output(f, results, format, coverage_only, errors_only, verbose)
             if verbose:
                 click.echo(f"Results written to {output_file}")
         except Exception as e:
             raise click.ClickException(f"Failed to write output file: {e}")
     else:
-        click.echo(output)
+        stdout = click.get_text_stream("stdout")
+        _write_output(stdout, results, format, coverage_only, errors_only, verbose)
 
 
-def _generate_text_output(
-    results: dict[str, ValidationResult],
+@functools.cache
+def _http_session() -> "requests.Session":
+    """Return an HTTP session shared by the schema downloads in this process.
+
+    Repeated validations in one process (e.g. from a watch loop) reuse its
+    pooled keep-alive connection instead of a new TCP and TLS handshake.
+    """
+    import requests
+
+    return requests.Session()
+
+
+def _official_schema_markdown(url: str, use_cache: bool) -> str:
+    """Return the official schema document, downloading it when needed.
+
+    Downloads are kept in the CLI cache directory and reused for
+    ``_SCHEMA_CACHE_TTL`` seconds unless ``use_cache`` is False.
+    """
+    path = cache_dir() / "official_schema.md"
+
+    if use_cache:
+        try:
+            if time.time() - path.stat().st_mtime < _SCHEMA_CACHE_TTL:
+                return path.read_text(encoding="utf-8")
+        except OSError:
+            pass  # Not cached yet
+
+    response = _http_session().get(url, timeout=30)
+    response.raise_for_status()
+    schema = response.text
+
+    # An unwritable cache only costs a download next time
+    with contextlib.suppress(OSError):
+        write_entry(path, schema.encode("utf-8"))
+
+    return schema
+
+
+def _write_output(
+    fp: TextIO,
+    results: dict[str, "ValidationResult"],
+    format: str,
     coverage_only: bool,
     errors_only: bool,
     verbose: bool,
-) -> str:
-    """Generate text format output."""
-    lines = []
+) -> None:
+    """Write the report to ``fp`` in the requested format.
 
-    if not coverage_only:
-        lines.append("=" * 80)
-        lines.append("CARDANO DB SYNC SCHEMA VALIDATION REPORT")
-        lines.append("=" * 80)
-        lines.append("")
+    JSON is streamed to ``fp`` rather than serialized into a string first.
+    """
+    if format == "json":
+        write_json(fp, _generate_json_output(results, coverage_only, errors_only))
+    elif format == "ndjson":
+        _write_ndjson(fp, results, coverage_only, errors_only)
+    else:
+        text = _generate_text_output(results, coverage_only, errors_only, verbose)
+        fp.write(f"{text}\n")
 
-    # Calculate statistics
-    total_tables = len(results)
-    valid_tables = sum(1 for r in results.values() if r.is_valid)
-    invalid_tables = total_tables - valid_tables
-
-    if coverage_only or not errors_only:
-        lines.append("COVERAGE STATISTICS")
-        lines.append("-" * 50)
-        lines.append(f"Total Tables: {total_tables}")
-        lines.append(f"Valid Tables: {valid_tables}")
-        lines.append(f"Invalid Tables: {invalid_tables}")
-        lines.append(f"Coverage: {(valid_tables / total_tables) * 100:.1f}%")
-        lines.append("")
 
+def _partition(
+    results: dict[str, "ValidationResult"],
+) -> tuple[list[str], list[tuple[str, "ValidationResult"]]]:
+    """Split results into valid table names and invalid ``(name, result)`` pairs.
+
+    Both lists keep the order of ``results``.
+    """
+    valid_names = []
+    invalid_items = []
+    for table_name, result in results.items():
+        if result.is_valid:
+            valid_names.append(table_name)
+        else:
+            invalid_items.append((table_name, result))
+    return valid_names, invalid_items
+
+
+def _coverage_lines(total_tables: int, valid_tables: int) -> list[str]:
+    """Return the coverage statistics section of the text report."""
+    return [
+        "COVERAGE STATISTICS",
+        _SEP50,
+        f"Total Tables: {total_tables}",
+        f"Valid Tables: {valid_tables}",
+        f"Invalid Tables: {total_tables - valid_tables}",
+        f"Coverage: {(valid_tables / total_tables) * 100:.1f}%",
+        "",
+    ]
+
+
+def _summary(total_tables: int, valid_tables: int) -> dict[str, Any]:
+    """Return the summary section of the JSON report."""
+    return {
+        "total_tables": total_tables,
+        "valid_tables": valid_tables,
+        "invalid_tables": total_tables - valid_tables,
+        "coverage_percentage": (valid_tables / total_tables) * 100
+        if total_tables > 0
+        else 0,
+    }
+
+
+def _generate_text_output(
+    results: dict[str, "ValidationResult"],
+    coverage_only: bool,
+    errors_only: bool,
+    verbose: bool,
+) -> str:
+    """Generate text format output."""
     if coverage_only:
-        return "\n".join(lines)
+        valid_tables = sum(result.is_valid for result in results.values())
+        return "\n".join(_coverage_lines(len(results), valid_tables))
 
+    lines = [_RULE80, "CARDANO DB SYNC SCHEMA VALIDATION REPORT", _RULE80, ""]
+
+    valid_names, invalid_items = _partition(results)
     if not errors_only:
-        # Show valid tables
-        valid_results = {k: v for k, v in results.items() if v.is_valid}
-        if valid_results:
-            lines.append("VALID TABLES")
-            lines.append("-" * 50)
-            for table_name in sorted(valid_results.keys()):
-                lines.append(f"✅ {table_name}")
-            lines.append("")
+        lines.extend(_coverage_lines(len(results), len(valid_names)))
+
+    # Show valid tables
+    if valid_names and not errors_only:
+        lines.append("VALID TABLES")
+        lines.append(_SEP50)
+        valid_names.sort()
+        lines.extend(f"✅ {table_name}" for table_name in valid_names)
+        lines.append("")
 
     # Show invalid tables
-    invalid_results = {k: v for k, v in results.items() if not v.is_valid}
-    if invalid_results:
+    if invalid_items:
         lines.append("VALIDATION ERRORS" if errors_only else "INVALID TABLES")
-        lines.append("-" * 50)
+        lines.append(_SEP50)
 
-        for table_name in sorted(invalid_results.keys()):
-            result = invalid_results[table_name]
+        invalid_items.sort(key=itemgetter(0))
+        for table_name, result in invalid_items:
             lines.append(f"❌ {table_name}")
 
             if result.missing_fields:
@@ -144,62 +273,85 @@ def _generate_text_output(
                 lines.append(f"   Errors: {', '.join(result.errors)}")
             lines.append("")
 
-    if not invalid_results and errors_only:
+    if not invalid_items and errors_only:
         lines.append("🎉 No validation errors found!")
         lines.append("")
 
     return "\n".join(lines)
 
 
+def _result_fields(result: "ValidationResult") -> dict[str, Any]:
+    """Return the discrepancies of one table for the JSON reports."""
+    return {
+        "missing_fields": result.missing_fields,
+        "extra_fields": result.extra_fields,
+        "type_mismatches": result.type_mismatches,
+        "errors": result.errors,
+    }
+
+
 def _generate_json_output(
-    results: dict[str, ValidationResult],
+    results: dict[str, "ValidationResult"],
     coverage_only: bool,
     errors_only: bool,
-) -> str:
-    """Generate JSON format output."""
-    # Calculate statistics
-    total_tables = len(results)
-    valid_tables = sum(1 for r in results.values() if r.is_valid)
-    invalid_tables = total_tables - valid_tables
-
-    output = {
-        "summary": {
-            "total_tables": total_tables,
-            "valid_tables": valid_tables,
-            "invalid_tables": invalid_tables,
-            "coverage_percentage": (valid_tables / total_tables) * 100
-            if total_tables > 0
-            else 0,
-        }
-    }
-
+) -> dict[str, Any]:
+    """Generate the JSON report data."""
     if coverage_only:
-        return json.dumps(output, indent=2)
+        valid_tables = sum(result.is_valid for result in results.values())
+        return {"summary": _summary(len(results), valid_tables)}
+
+    valid_names, invalid_items = _partition(results)
+    output = {"summary": _summary(len(results), len(valid_names))}
 
     # Add detailed results
     if errors_only:
         # Only include invalid tables
         output["validation_errors"] = {
-            table_name: {
-                "missing_fields": result.missing_fields,
-                "extra_fields": result.extra_fields,
-                "type_mismatches": result.type_mismatches,
-                "errors": result.errors,
-            }
-            for table_name, result in results.items()
-            if not result.is_valid
+            table_name: _result_fields(result) for table_name, result in invalid_items
         }
     else:
         # Include all results
         output["results"] = {
-            table_name: {
-                "is_valid": result.is_valid,
-                "missing_fields": result.missing_fields,
-                "extra_fields": result.extra_fields,
-                "type_mismatches": result.type_mismatches,
-                "errors": result.errors,
-            }
+            table_name: {"is_valid": result.is_valid, **_result_fields(result)}
             for table_name, result in results.items()
         }
 
-    return json.dumps(output, indent=2)
+    return output
+
+
+def _write_ndjson(
+    fp: TextIO,
+    results: dict[str, "ValidationResult"],
+    coverage_only: bool,
+    errors_only: bool,
+) -> None:
+    """Write the JSON report as newline-delimited records.
+
+    The first line holds the summary and every following line one table (only
+    invalid tables with ``errors_only``), so consumers can process the report
+    line by line instead of loading it whole.
+    """
+    if coverage_only:
+        valid_tables = sum(result.is_valid for result in results.values())
+        records = ()
+    else:
+        valid_names, invalid_items = _partition(results)
+        valid_tables = len(valid_names)
+        if errors_only:
+            records = (
+                {"table": table_name, **_result_fields(result)}
+                for table_name, result in invalid_items
+            )
+        else:
+            records = (
+                {
+                    "table": table_name,
+                    "is_valid": result.is_valid,
+                    **_result_fields(result),
+                }
+                for table_name, result in results.items()
+            )
+
+    summary = _summary(len(results), valid_tables)
+    fp.write(f"{json.dumps({'summary': summary})}\n")
+    fp.writelines(f"{json.dumps(record)}\n" for record in records)
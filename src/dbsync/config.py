@@ -4,57 +4,97 @@ This module provides configuration utilities for managing database connection
 parameters and URLs for Cardano DB Sync PostgreSQL databases.
 """
 
+import functools
 import os
+import threading
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse, urlunparse
-
-from dotenv import load_dotenv
+from urllib.parse import urlsplit, urlunsplit
 
 
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """Get the package version.
 
+    The metadata lookup reads from disk, so the result is computed once
+    per process.
+
     Returns:
         Package version string
     """
-    # Try to get version from package metadata
-    try:
-        from importlib.metadata import version
+    # importlib.metadata is always available on the supported Pythons
+    from importlib.metadata import PackageNotFoundError, version
 
+    try:
         return version("dbsync-py")
-    except ImportError:
-        # Fallback for older Python versions
-        try:
-            import pkg_resources
-
-            return pkg_resources.get_distribution("dbsync-py").version
-        except Exception:
-            return "0.1.0"  # Fallback version
-
+    except PackageNotFoundError:
+        return "0.1.0"  # Fallback version when running without metadata
+
+
+# PostgreSQL URL schemes accepted by validate_database_url
+_VALID_SCHEMES = frozenset(
+    {
+        "postgresql",
+        "postgresql+psycopg",
+        "postgresql+asyncpg",
+        "postgres",
+        "postgres+psycopg",
+        "postgres+asyncpg",
+    }
+)
+
+# Async driver scheme for each accepted URL scheme
+_ASYNC_SCHEME_MAP = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg": "postgresql+asyncpg",
+    "postgresql+asyncpg": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgres+psycopg": "postgresql+asyncpg",
+    "postgres+asyncpg": "postgres+asyncpg",
+}
 
 # Load environment variables from .env file if it exists
 _env_loaded = False
+_env_lock = threading.Lock()
 
 # Global configuration state
 _default_async_mode: bool | None = None
 
 
 def _ensure_env_loaded() -> None:
-    """Ensure .env file is loaded (only once)."""
+    """Ensure .env file is loaded (only once).
+
+    Loading is skipped when ``DBSYNC_SKIP_DOTENV=1``. Otherwise the file fills
+    in only the variables the environment does not set, so e.g. an exported
+    ``DBSYNC_DATABASE_URL`` can be combined with other settings kept in
+    ``.env``. Safe to call from several threads; only one of them loads the
+    file.
+    """
     global _env_loaded
-    if not _env_loaded:
-        # Look for .env file in current directory, then parent directories
-        env_path = Path.cwd() / ".env"
-        if not env_path.exists():
-            # Try parent directory (common for src/ structure)
-            env_path = Path.cwd().parent / ".env"
-
-        if env_path.exists():
-            load_dotenv(env_path)
-        else:
-            # Try to load from any .env file in the path
-            load_dotenv()
+    if _env_loaded:
+        return
+
+    with _env_lock:
+        if _env_loaded:
+            return
+
+        if os.environ.get("DBSYNC_SKIP_DOTENV") != "1":
+            # Imported here so configuring through the environment alone
+            # never pays for importing dotenv
+            from dotenv import load_dotenv
+
+            # Look for .env file in current directory, then parent directories
+            cwd = Path.cwd()
+            env_path = cwd / ".env"
+            if not env_path.exists():
+                # Try parent directory (common for src/ structure)
+                env_path = cwd.parent / ".env"
+
+            if env_path.exists():
+                load_dotenv(env_path, override=False)
+            else:
+                # Try to load from any .env file in the path
+                load_dotenv(override=False)
 
         _env_loaded = True
 
@@ -100,17 +140,23 @@ def reset_default_async_mode() -> None:
 __all__ = [
     "DatabaseConfig",
     "get_async_database_url",
+    "get_config",
     "get_database_url",
     "get_default_async_mode",
     "get_version",
     "reset_default_async_mode",
+    "reset_default_config",
     "set_default_async_mode",
     "validate_database_url",
 ]
 
 
 class DatabaseConfig:
-    """Database configuration container with validation."""
+    """Database configuration container with validation.
+
+    Treat instances as read-only once built: ``to_url`` caches the URLs it
+    renders.
+    """
 
     def __init__(
         self,
@@ -141,12 +187,14 @@ class DatabaseConfig:
         _ensure_env_loaded()
 
         # Load configuration with precedence: params > env vars > defaults
-        self.host = host or os.getenv("DBSYNC_HOST", "localhost")
-        self.port = port or int(os.getenv("DBSYNC_PORT", "5432"))
-        self.database = database or os.getenv("DBSYNC_DB_NAME", "cexplorer")
-        self.username = username or os.getenv("DBSYNC_USER")
-        self.password = password or os.getenv("DBSYNC_PASS")
+        env = os.environ
+        self.host = host or env.get("DBSYNC_HOST", "localhost")
+        self.port = port or int(env.get("DBSYNC_PORT", "5432"))
+        self.database = database or env.get("DBSYNC_DB_NAME", "cexplorer")
+        self.username = username or env.get("DBSYNC_USER")
+        self.password = password or env.get("DBSYNC_PASS")
         self.extra_params = kwargs
+        self._urls: dict[bool, str] = {}
 
     def to_url(self, async_driver: bool = False) -> str:
         """Convert configuration to database URL.
@@ -157,20 +205,45 @@ class DatabaseConfig:
         Returns:
             Database URL string
         """
+        if async_driver in self._urls:
+            return self._urls[async_driver]
+
         scheme = "postgresql+asyncpg" if async_driver else "postgresql+psycopg"
 
-        # Build authority part (user:pass@host:port)
-        authority = self.host
-        if self.port != 5432:
-            authority = f"{authority}:{self.port}"
+        # Build authority parts (user:pass@host:port)
+        port = "" if self.port == 5432 else f":{self.port}"
+        if not self.username:
+            userinfo = ""
+        elif self.password:
+            userinfo = f"{self.username}:{self.password}@"
+        else:
+            userinfo = f"{self.username}@"
+
+        url = f"{scheme}://{userinfo}{self.host}{port}/{self.database}"
+        self._urls[async_driver] = url
+        return url
 
-        if self.username:
-            if self.password:
-                authority = f"{self.username}:{self.password}@{authority}"
-            else:
-                authority = f"{self.username}@{authority}"
 
-        return f"{scheme}://{authority}/{self.database}"
+@functools.lru_cache(maxsize=1)
+def get_config() -> DatabaseConfig:
+    """Get the default database configuration.
+
+    The configuration is built from the environment once and reused for the
+    rest of the process. Call ``reset_default_config()`` after changing
+    ``DBSYNC_*`` environment variables to pick up the new values.
+
+    Returns:
+        Shared DatabaseConfig instance built from environment variables
+    """
+    return DatabaseConfig()
+
+
+def reset_default_config() -> None:
+    """Discard the cached default configuration.
+
+    The next ``get_config()`` call re-reads the environment.
+    """
+    get_config.cache_clear()
 
 
 def get_database_url(url: str | None = None) -> str:
@@ -183,6 +256,9 @@ def get_database_url(url: str | None = None) -> str:
     3. Individual environment variables (DBSYNC_HOST, DBSYNC_PORT, etc.)
     4. Default values
 
+    The URL built from the individual variables is cached with the default
+    configuration; call ``reset_default_config()`` after changing them.
+
     Args:
         url: Explicit database URL (optional)
 
@@ -203,8 +279,7 @@ def get_database_url(url: str | None = None) -> str:
         return validate_database_url(env_url)
 
     # Build from individual environment variables or defaults
-    config = DatabaseConfig()
-    return config.to_url(async_driver=False)
+    return get_config().to_url(async_driver=False)
 
 
 def get_async_database_url(url: str | None = None) -> str:
@@ -217,6 +292,9 @@ def get_async_database_url(url: str | None = None) -> str:
     3. Individual environment variables (DBSYNC_HOST, DBSYNC_PORT, etc.)
     4. Default values
 
+    The URL built from the individual variables is cached with the default
+    configuration; call ``reset_default_config()`` after changing them.
+
     Args:
         url: Explicit database URL (optional)
 
@@ -230,27 +308,43 @@ def get_async_database_url(url: str | None = None) -> str:
     _ensure_env_loaded()
 
     if url:
-        base_url = validate_database_url(url)
-        # Convert to async scheme if needed
-        parsed = urlparse(base_url)
-        if not parsed.scheme.endswith("+asyncpg"):
-            scheme = "postgresql+asyncpg"
-            parsed = parsed._replace(scheme=scheme)
-            return urlunparse(parsed)
-        return base_url
+        return _to_async_scheme(validate_database_url(url))
 
     env_url = os.getenv("DBSYNC_DATABASE_URL")
     if env_url:
-        return get_async_database_url(env_url)
+        return _to_async_scheme(validate_database_url(env_url))
 
     # Build from individual environment variables or defaults
-    config = DatabaseConfig()
-    return config.to_url(async_driver=True)
+    return get_config().to_url(async_driver=True)
+
 
+def _to_async_scheme(url: str) -> str:
+    """Rewrite a validated database URL to use the asyncpg driver.
 
+    Args:
+        url: Database URL that passed ``validate_database_url``
+
+    Returns:
+        The URL with an asyncpg scheme
+    """
+    # Swap the prefix directly for the common schemes instead of
+    # re-tokenizing the whole URL
+    scheme, sep, rest = url.partition("://")
+    if scheme in _ASYNC_SCHEME_MAP:
+        return f"{_ASYNC_SCHEME_MAP[scheme]}{sep}{rest}"
+
+    parsed = urlsplit(url)
+    if not parsed.scheme.endswith("+asyncpg"):
+        return urlunsplit(parsed._replace(scheme="postgresql+asyncpg"))
+    return url
+
+
+@functools.lru_cache(maxsize=32)
 def validate_database_url(url: str) -> str:
     """Validate database URL format.
 
+    Successful validations are cached per URL; invalid URLs raise every time.
+
     Args:
         url: Database URL to validate
 
@@ -264,21 +358,12 @@ def validate_database_url(url: str) -> str:
         raise ValueError("Database URL cannot be empty")
 
     try:
-        parsed = urlparse(url)
-
-        # Check for valid PostgreSQL schemes
-        valid_schemes = {
-            "postgresql",
-            "postgresql+psycopg",
-            "postgresql+asyncpg",
-            "postgres",
-            "postgres+psycopg",
-            "postgres+asyncpg",
-        }
-
-        if parsed.scheme not in valid_schemes:
+        parsed = urlsplit(url)
+
+        if parsed.scheme not in _VALID_SCHEMES:
             raise ValueError(
-                f"Invalid scheme '{parsed.scheme}'. Must be one of: {valid_schemes}"
+                f"Invalid scheme '{parsed.scheme}'. "
+                f"Must be one of: {', '.join(sorted(_VALID_SCHEMES))}"
             )
 
         if not parsed.hostname:
@@ -22,7 +22,12 @@ These are educational examples showing best practices for:
 """
 
 # Import available examples
-from .chain_metadata import ChainMetadataQueries, get_chain_info
+from .chain_metadata import (
+    AsyncChainMetadataQueries,
+    ChainMetadataQueries,
+    get_chain_info,
+    get_chain_info_async,
+)
 from .governance import GovernanceQueries, get_comprehensive_governance_analysis
 from .multi_asset import MultiAssetQueries, get_comprehensive_multi_asset_analysis
 from .pool_management import PoolManagementQueries, get_comprehensive_pool_analysis
@@ -40,6 +45,7 @@ from .transaction_analysis import (
 )
 
 __all__ = [
+    "AsyncChainMetadataQueries",
     "ChainMetadataQueries",
     "GovernanceQueries",
     "MultiAssetQueries",
@@ -48,6 +54,7 @@ __all__ = [
     "StakingDelegationQueries",
     "TransactionAnalysisQueries",
     "get_chain_info",
+    "get_chain_info_async",
     "get_comprehensive_governance_analysis",
     "get_comprehensive_multi_asset_analysis",
     "get_comprehensive_pool_analysis",
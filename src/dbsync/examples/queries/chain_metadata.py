@@ -16,13 +16,22 @@ Usage:
     with get_session() as session:
         info = get_chain_info(session)
         print(f"Current supply: {info['supply_ada']:.2f} ADA")
+
+    # Async sessions use the async counterparts
+    from dbsync.examples.queries.chain_metadata import get_chain_info_async
+    from dbsync.session import get_async_session_context
+
+    async with get_async_session_context() as session:
+        info = await get_chain_info_async(session)
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, overload
 
-from sqlalchemy import func, select, text
+from sqlalchemy import Row, Select, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
@@ -30,6 +39,283 @@ from ...models import Block, ChainMeta, TransactionInput, TransactionOutput
 
 # Lovelace is just an int in the application layer
 
+# Statements shared by ChainMetadataQueries and AsyncChainMetadataQueries.
+# They are built once and reused so SQLAlchemy's compiled cache keeps hitting.
+_CHAIN_METADATA_STMT = select(ChainMeta)
+
+# Correlated anti-join so PostgreSQL can probe the tx_in (tx_out_id,
+# tx_out_index) index per output instead of materializing every spent output
+# id. tx_out.consumed_by_tx_id would be cheaper still, but db-sync only
+# populates it when run with the consumed-tx-out option.
+_CURRENT_SUPPLY_STMT = select(func.sum(TransactionOutput.value)).where(
+    ~select(1)
+    .where(
+        (TransactionInput.tx_out_id == TransactionOutput.tx_id)
+        & (TransactionInput.tx_out_index == TransactionOutput.index)
+    )
+    .correlate(TransactionOutput)
+    .exists()
+)
+
+_LATEST_SLOT_STMT = (
+    select(Block.slot_no)
+    .where(Block.block_no.is_not(None))
+    .order_by(Block.block_no.desc())
+    .limit(1)
+)
+
+_DATABASE_SIZE_STMT = text(
+    "SELECT pg_size_pretty(pg_database_size(current_database()))"
+)
+
+_TABLE_SIZE_STMT = text("SELECT pg_size_pretty(pg_total_relation_size(:table_name))")
+
+_SIZES_STMT = text(
+    "SELECT pg_size_pretty(pg_database_size(current_database())),"
+    " pg_size_pretty(pg_total_relation_size(:table_name))"
+)
+
+_SYNC_PROGRESS_STMT = select(
+    100.0
+    * (
+        func.extract("epoch", func.max(Block.time))
+        - func.extract("epoch", func.min(Block.time))
+    )
+    / (func.extract("epoch", func.now()) - func.extract("epoch", func.min(Block.time)))
+)
+
+_SYNC_BEHIND_STMT = select(func.now() - func.max(Block.time))
+
+
+def _sizes(row: Row) -> tuple[str, str]:
+    database_size, table_size = row
+    return database_size or "Unknown", table_size or "Unknown"
+
+
+def _build_chain_info_stmt() -> Select:
+    """Build the single statement behind ``get_chain_info``.
+
+    Combines the chain metadata, latest slot, size and sync progress queries
+    of ``ChainMetadataQueries`` as columns of one row.
+    """
+    blocks = select(
+        func.min(Block.time).label("first_time"),
+        func.max(Block.time).label("last_time"),
+    ).subquery()
+    first_epoch = func.extract("epoch", blocks.c.first_time)
+
+    return select(
+        select(ChainMeta.network_name).limit(1).scalar_subquery().label("network"),
+        select(ChainMeta.start_time).limit(1).scalar_subquery().label("start_time"),
+        _LATEST_SLOT_STMT.scalar_subquery().label("latest_slot"),
+        func.pg_size_pretty(func.pg_database_size(func.current_database())).label(
+            "database_size"
+        ),
+        func.pg_size_pretty(func.pg_total_relation_size("block")).label(
+            "block_table_size"
+        ),
+        (
+            100.0
+            * (func.extract("epoch", blocks.c.last_time) - first_epoch)
+            / (func.extract("epoch", func.now()) - first_epoch)
+        ).label("sync_progress_percent"),
+        (func.now() - blocks.c.last_time).label("sync_behind"),
+    ).select_from(blocks)
+
+
+_CHAIN_INFO_STMT = _build_chain_info_stmt()
+
+
+# Query implementations, exposed as static methods of ChainMetadataQueries
+# (Session) and AsyncChainMetadataQueries (AsyncSession) below
+def _get_chain_metadata(session: Session) -> ChainMeta | None:
+    """Get chain metadata information.
+
+    SQL equivalent:
+        SELECT * FROM meta;
+
+    Returns:
+        ChainMeta object with network information, or None if not found
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     meta = ChainMetadataQueries.get_chain_metadata(session)
+        ...     print(f"Network: {meta.network_name}")
+        ...     print(f"Start time: {meta.start_time}")
+    """
+    result = session.execute(_CHAIN_METADATA_STMT).scalar_one_or_none()
+    return result
+
+
+def _get_current_supply(session: Session) -> int:
+    """Calculate the current total on-chain supply of Ada.
+
+    Note: 1 ADA == 1,000,000 Lovelace
+
+    This queries the UTxO set for unspent transaction outputs. It does not
+    include staking rewards that have not yet been withdrawn. Before being
+    withdrawn, rewards exist in ledger state and not on-chain.
+
+    SQL equivalent:
+        SELECT sum(value) FROM tx_out WHERE
+            NOT EXISTS (
+                SELECT 1 FROM tx_in
+                WHERE tx_in.tx_out_id = tx_out.tx_id
+                    AND tx_in.tx_out_index = tx_out.index
+            );
+
+    Returns:
+        Total supply in Lovelace
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     supply = ChainMetadataQueries.get_current_supply(session)
+        ...     print(f"Current supply: {supply / 1_000_000:.2f} ADA")
+    """
+    result = session.execute(_CURRENT_SUPPLY_STMT).scalar()
+    return int(result or 0)
+
+
+def _get_latest_slot_number(session: Session) -> int | None:
+    """Get the slot number of the most recent block.
+
+    SQL equivalent:
+        SELECT slot_no FROM block WHERE block_no IS NOT NULL
+        ORDER BY block_no DESC LIMIT 1;
+
+    Returns:
+        Latest slot number, or None if no blocks found
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     slot = ChainMetadataQueries.get_latest_slot_number(session)
+        ...     print(f"Latest slot: {slot}")
+    """
+    result = session.execute(_LATEST_SLOT_STMT).scalar_one_or_none()
+    return result
+
+
+def _get_database_size_pretty(session: Session) -> str:
+    """Get the human-readable size of the database.
+
+    SQL equivalent:
+        SELECT pg_size_pretty(pg_database_size(current_database()));
+
+    Returns:
+        Human-readable database size (e.g., "116 GB")
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     size = ChainMetadataQueries.get_database_size_pretty(session)
+        ...     print(f"Database size: {size}")
+    """
+    result = session.execute(_DATABASE_SIZE_STMT).scalar()
+    return result or "Unknown"
+
+
+def _get_table_size_pretty(session: Session, table_name: str = "block") -> str:
+    """Get the human-readable size of a specific database table.
+
+    SQL equivalent:
+        SELECT pg_size_pretty(pg_total_relation_size('block'));
+
+    Args:
+        table_name: Name of the table to check (default: 'block')
+
+    Returns:
+        Human-readable table size (e.g., "2760 MB")
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     size = ChainMetadataQueries.get_table_size_pretty(session, "tx_out")
+        ...     print(f"tx_out table size: {size}")
+    """
+    result = session.execute(_TABLE_SIZE_STMT, {"table_name": table_name}).scalar()
+    return result or "Unknown"
+
+
+def _get_sizes_pretty(session: Session, table_name: str = "block") -> tuple[str, str]:
+    """Get the database and table sizes in a single round trip.
+
+    Use this instead of ``get_database_size_pretty`` and
+    ``get_table_size_pretty`` when both sizes are needed.
+
+    SQL equivalent:
+        SELECT pg_size_pretty(pg_database_size(current_database())),
+            pg_size_pretty(pg_total_relation_size('block'));
+
+    Args:
+        table_name: Name of the table to check (default: 'block')
+
+    Returns:
+        Human-readable database and table sizes (e.g., ("116 GB", "2760 MB"))
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     db_size, block_size = ChainMetadataQueries.get_sizes_pretty(session)
+        ...     print(f"Database: {db_size}, block table: {block_size}")
+    """
+    result = session.execute(_SIZES_STMT, {"table_name": table_name}).one()
+    return _sizes(result)
+
+
+def _get_sync_progress_percent(session: Session) -> float:
+    """Get rough estimate of sync progress as a percentage.
+
+    To get a rough estimate of how close to fully synced the database is,
+    we use the timestamps on the blocks.
+
+    Note: This value can be misleading as it operates on block timestamps
+    and early epochs contain much less data (e.g., Byron era did not have
+    staking) and much fewer transactions.
+
+    SQL equivalent:
+        SELECT 100 * (
+            extract(epoch from (max(time) at time zone 'UTC')) -
+            extract(epoch from (min(time) at time zone 'UTC'))
+        ) / (
+            extract(epoch from (now() at time zone 'UTC')) -
+            extract(epoch from (min(time) at time zone 'UTC'))
+        ) AS sync_percent
+        FROM block;
+
+    Returns:
+        Sync progress percentage (0.0 to 100.0)
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     progress = ChainMetadataQueries.get_sync_progress_percent(session)
+        ...     print(f"Sync progress: {progress:.2f}%")
+    """
+    result = session.execute(_SYNC_PROGRESS_STMT).scalar()
+    return float(result or 0.0)
+
+
+def _get_sync_behind_duration(session: Session) -> str | None:
+    """Get how far behind the sync is from current time.
+
+    SQL equivalent:
+        SELECT now() - max(time) AS behind_by FROM block;
+
+    Returns:
+        Time duration string (e.g., "4 days 20:59:39.134497") or None
+
+    Example:
+        >>> from dbsync.session import get_session
+        >>> with get_session() as session:
+        ...     behind = ChainMetadataQueries.get_sync_behind_duration(session)
+        ...     print(f"Sync is behind by: {behind}")
+    """
+    result = session.execute(_SYNC_BEHIND_STMT).scalar()
+    return str(result) if result else None
+
 
 class ChainMetadataQueries:
     """Example chain metadata and fundamental blockchain data queries.
@@ -38,242 +324,116 @@ class ChainMetadataQueries:
     queries, including supply calculations, sync progress, and basic chain info.
 
     These are example implementations showing how to use the dbsync-py package
-    models to build useful queries.
+    models to build useful queries. Every method takes a synchronous
+    ``Session``; ``AsyncChainMetadataQueries`` has the ``AsyncSession`` versions.
     """
 
-    @staticmethod
-    def get_chain_metadata(session: Session | AsyncSession) -> ChainMeta | None:
-        """Get chain metadata information.
-
-        SQL equivalent:
-            SELECT * FROM meta;
-
-        Returns:
-            ChainMeta object with network information, or None if not found
-
-        Example:
-            >>> from dbsync.session import get_session
-            >>> with get_session() as session:
-            ...     meta = ChainMetadataQueries.get_chain_metadata(session)
-            ...     print(f"Network: {meta.network_name}")
-            ...     print(f"Start time: {meta.start_time}")
-        """
-        stmt = select(ChainMeta)
-
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
-        else:
-            result = session.execute(stmt).scalar_one_or_none()
-            return result
-
-    @staticmethod
-    def get_current_supply(session: Session | AsyncSession) -> int:
-        """Calculate the current total on-chain supply of Ada.
-
-        Note: 1 ADA == 1,000,000 Lovelace
-
-        This queries the UTxO set for unspent transaction outputs. It does not
-        include staking rewards that have not yet been withdrawn. Before being
-        withdrawn, rewards exist in ledger state and not on-chain.
-
-        SQL equivalent:
-            SELECT sum(value) FROM tx_out AS tx_outer WHERE
-                NOT EXISTS (
-                    SELECT tx_out.id FROM tx_out
-                    INNER JOIN tx_in ON tx_out.tx_id = tx_in.tx_out_id
-                        AND tx_out.index = tx_in.tx_out_index
-                    WHERE tx_outer.id = tx_out.id
-                );
-
-        Returns:
-            Total supply in Lovelace
-
-        Example:
-            >>> from dbsync.session import get_session
-            >>> with get_session() as session:
-            ...     supply = ChainMetadataQueries.get_current_supply(session)
-            ...     print(f"Current supply: {supply / 1_000_000:.2f} ADA")
-        """
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
-
-        # Create subquery for spent outputs
-        spent_outputs = select(TransactionOutput.id_).select_from(
-            TransactionOutput.__table__.join(
-                TransactionInput.__table__,
-                (TransactionOutput.tx_id == TransactionInput.tx_out_id)
-                & (TransactionOutput.index == TransactionInput.tx_out_index),
-            )
-        )
-
-        # Main query for unspent outputs
-        stmt = select(func.sum(TransactionOutput.value)).where(
-            ~TransactionOutput.id_.in_(spent_outputs)
-        )
-
-        result = session.execute(stmt).scalar()
-        return int(result or 0)
-
-    @staticmethod
-    def get_latest_slot_number(session: Session | AsyncSession) -> int | None:
-        """Get the slot number of the most recent block.
-
-        SQL equivalent:
-            SELECT slot_no FROM block WHERE block_no IS NOT NULL
-            ORDER BY block_no DESC LIMIT 1;
-
-        Returns:
-            Latest slot number, or None if no blocks found
-
-        Example:
-            >>> from dbsync.session import get_session
-            >>> with get_session() as session:
-            ...     slot = ChainMetadataQueries.get_latest_slot_number(session)
-            ...     print(f"Latest slot: {slot}")
-        """
-        stmt = (
-            select(Block.slot_no)
-            .where(Block.block_no.is_not(None))
-            .order_by(Block.block_no.desc())
-            .limit(1)
-        )
-
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
-        else:
-            result = session.execute(stmt).scalar_one_or_none()
-            return result
-
-    @staticmethod
-    def get_database_size_pretty(session: Session | AsyncSession) -> str:
-        """Get the human-readable size of the database.
-
-        SQL equivalent:
-            SELECT pg_size_pretty(pg_database_size(current_database()));
-
-        Returns:
-            Human-readable database size (e.g., "116 GB")
-
-        Example:
-            >>> from dbsync.session import get_session
-            >>> with get_session() as session:
-            ...     size = ChainMetadataQueries.get_database_size_pretty(session)
-            ...     print(f"Database size: {size}")
-        """
-        stmt = text("SELECT pg_size_pretty(pg_database_size(current_database()))")
-
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
-        else:
-            result = session.execute(stmt).scalar()
-            return result or "Unknown"
-
-    @staticmethod
-    def get_table_size_pretty(
-        session: Session | AsyncSession, table_name: str = "block"
-    ) -> str:
-        """Get the human-readable size of a specific database table.
-
-        SQL equivalent:
-            SELECT pg_size_pretty(pg_total_relation_size('block'));
-
-        Args:
-            table_name: Name of the table to check (default: 'block')
-
-        Returns:
-            Human-readable table size (e.g., "2760 MB")
-
-        Example:
-            >>> from dbsync.session import get_session
-            >>> with get_session() as session:
-            ...     size = ChainMetadataQueries.get_table_size_pretty(session, "tx_out")
-            ...     print(f"tx_out table size: {size}")
-        """
-        stmt = text("SELECT pg_size_pretty(pg_total_relation_size(:table_name))")
-
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
-        else:
-            result = session.execute(stmt, {"table_name": table_name}).scalar()
-            return result or "Unknown"
-
-    @staticmethod
-    def get_sync_progress_percent(session: Session | AsyncSession) -> float:
-        """Get rough estimate of sync progress as a percentage.
-
-        To get a rough estimate of how close to fully synced the database is,
-        we use the timestamps on the blocks.
-
-        Note: This value can be misleading as it operates on block timestamps
-        and early epochs contain much less data (e.g., Byron era did not have
-        staking) and much fewer transactions.
-
-        SQL equivalent:
-            SELECT 100 * (
-                extract(epoch from (max(time) at time zone 'UTC')) -
-                extract(epoch from (min(time) at time zone 'UTC'))
-            ) / (
-                extract(epoch from (now() at time zone 'UTC')) -
-                extract(epoch from (min(time) at time zone 'UTC'))
-            ) AS sync_percent
-            FROM block;
-
-        Returns:
-            Sync progress percentage (0.0 to 100.0)
-
-        Example:
-            >>> from dbsync.session import get_session
-            >>> with get_session() as session:
-            ...     progress = ChainMetadataQueries.get_sync_progress_percent(session)
-            ...     print(f"Sync progress: {progress:.2f}%")
-        """
-        stmt = select(
-            100.0
-            * (
-                func.extract("epoch", func.max(Block.time))
-                - func.extract("epoch", func.min(Block.time))
-            )
-            / (
-                func.extract("epoch", func.now())
-                - func.extract("epoch", func.min(Block.time))
-            )
-        )
-
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
-        else:
-            result = session.execute(stmt).scalar()
-            return float(result or 0.0)
-
-    @staticmethod
-    def get_sync_behind_duration(session: Session | AsyncSession) -> str | None:
-        """Get how far behind the sync is from current time.
-
-        SQL equivalent:
-            SELECT now() - max(time) AS behind_by FROM block;
-
-        Returns:
-            Time duration string (e.g., "4 days 20:59:39.134497") or None
-
-        Example:
-            >>> from dbsync.session import get_session
-            >>> with get_session() as session:
-            ...     behind = ChainMetadataQueries.get_sync_behind_duration(session)
-            ...     print(f"Sync is behind by: {behind}")
-        """
-        stmt = select(func.now() - func.max(Block.time))
-
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
-        else:
-            result = session.execute(stmt).scalar()
-            return str(result) if result else None
+    get_chain_metadata = staticmethod(_get_chain_metadata)
+    get_current_supply = staticmethod(_get_current_supply)
+    get_latest_slot_number = staticmethod(_get_latest_slot_number)
+    get_database_size_pretty = staticmethod(_get_database_size_pretty)
+    get_table_size_pretty = staticmethod(_get_table_size_pretty)
+    get_sizes_pretty = staticmethod(_get_sizes_pretty)
+    get_sync_progress_percent = staticmethod(_get_sync_progress_percent)
+    get_sync_behind_duration = staticmethod(_get_sync_behind_duration)
+
+
+async def _get_chain_metadata_async(session: AsyncSession) -> ChainMeta | None:
+    """Get chain metadata information."""
+    result = await session.execute(_CHAIN_METADATA_STMT)
+    return result.scalar_one_or_none()
+
+
+async def _get_current_supply_async(session: AsyncSession) -> int:
+    """Calculate the current total on-chain supply in Lovelace."""
+    result = await session.execute(_CURRENT_SUPPLY_STMT)
+    return int(result.scalar() or 0)
+
+
+async def _get_latest_slot_number_async(session: AsyncSession) -> int | None:
+    """Get the slot number of the most recent block."""
+    result = await session.execute(_LATEST_SLOT_STMT)
+    return result.scalar_one_or_none()
+
+
+async def _get_database_size_pretty_async(session: AsyncSession) -> str:
+    """Get the human-readable size of the database."""
+    result = await session.execute(_DATABASE_SIZE_STMT)
+    return result.scalar() or "Unknown"
+
+
+async def _get_table_size_pretty_async(
+    session: AsyncSession, table_name: str = "block"
+) -> str:
+    """Get the human-readable size of a specific database table."""
+    result = await session.execute(_TABLE_SIZE_STMT, {"table_name": table_name})
+    return result.scalar() or "Unknown"
+
+
+async def _get_sizes_pretty_async(
+    session: AsyncSession, table_name: str = "block"
+) -> tuple[str, str]:
+    """Get the database and table sizes in a single round trip."""
+    result = await session.execute(_SIZES_STMT, {"table_name": table_name})
+    return _sizes(result.one())
+
+
+async def _get_sync_progress_percent_async(session: AsyncSession) -> float:
+    """Get rough estimate of sync progress as a percentage."""
+    result = await session.execute(_SYNC_PROGRESS_STMT)
+    return float(result.scalar() or 0.0)
+
+
+async def _get_sync_behind_duration_async(session: AsyncSession) -> str | None:
+    """Get how far behind the sync is from current time."""
+    result = await session.execute(_SYNC_BEHIND_STMT)
+    value = result.scalar()
+    return str(value) if value else None
+
+
+class AsyncChainMetadataQueries:
+    """Async versions of the ``ChainMetadataQueries`` examples.
+
+    Each method runs the same statement as its ``ChainMetadataQueries``
+    counterpart on an ``AsyncSession``.
+
+    Example:
+        >>> from dbsync.session import get_async_session_context
+        >>> async with get_async_session_context() as session:
+        ...     slot = await AsyncChainMetadataQueries.get_latest_slot_number(session)
+    """
+
+    get_chain_metadata = staticmethod(_get_chain_metadata_async)
+    get_current_supply = staticmethod(_get_current_supply_async)
+    get_latest_slot_number = staticmethod(_get_latest_slot_number_async)
+    get_database_size_pretty = staticmethod(_get_database_size_pretty_async)
+    get_table_size_pretty = staticmethod(_get_table_size_pretty_async)
+    get_sizes_pretty = staticmethod(_get_sizes_pretty_async)
+    get_sync_progress_percent = staticmethod(_get_sync_progress_percent_async)
+    get_sync_behind_duration = staticmethod(_get_sync_behind_duration_async)
 
 
 # Convenience functions for direct usage
-def get_chain_info(session: Session | AsyncSession) -> dict[str, Any]:
+@overload
+def get_chain_info(
+    session: AsyncSession, *, include_supply: bool = True
+) -> Coroutine[Any, Any, dict[str, Any]]: ...
+
+
+@overload
+def get_chain_info(
+    session: Session, *, include_supply: bool = True
+) -> dict[str, Any]: ...
+
+
+def get_chain_info(
+    session: Session | AsyncSession, *, include_supply: bool = True
+) -> dict[str, Any] | Coroutine[Any, Any, dict[str, Any]]:
     """Get comprehensive chain information in a single call.
 
+    Runs one statement for the metadata, slot, size and sync figures, then a
+    second for the current supply unless ``include_supply`` is False.
+
     Returns a dictionary with all basic chain metadata including:
     - Chain metadata (network, start time)
     - Current supply in ADA and Lovelace
@@ -282,7 +442,12 @@ def get_chain_info(session: Session | AsyncSession) -> dict[str, Any]:
     - Sync progress information
 
     Args:
-        session: Database session (sync or async)
+        session: Database session. An ``AsyncSession`` is handed to
+            ``get_chain_info_async`` and the coroutine is returned for the
+            caller to await.
+        include_supply: Calculate the current supply. This scans the UTxO set
+            and dominates the run time; when False, ``supply_lovelace`` and
+            ``supply_ada`` are None.
 
     Returns:
         Dictionary containing all chain information
@@ -295,39 +460,70 @@ def get_chain_info(session: Session | AsyncSession) -> dict[str, Any]:
         ...     print(f"Supply: {info['supply_ada']:.2f} ADA")
         ...     print(f"Latest slot: {info['latest_slot']}")
     """
-    queries = ChainMetadataQueries()
-
-    # Get chain metadata
-    meta = queries.get_chain_metadata(session)
+    if isinstance(session, AsyncSession):
+        return get_chain_info_async(session, include_supply=include_supply)
 
-    # Get supply information
-    supply_lovelace = queries.get_current_supply(session)
-    supply_ada = float(supply_lovelace) / 1_000_000
+    # Everything except the supply comes back in one round trip
+    row = session.execute(_CHAIN_INFO_STMT).one()
 
-    # Get latest slot
-    latest_slot = queries.get_latest_slot_number(session)
+    # Supply is the expensive UTxO scan, so it stays a query of its own
+    supply_lovelace = _get_current_supply(session) if include_supply else None
 
-    # Get database size info
-    db_size = queries.get_database_size_pretty(session)
-    block_table_size = queries.get_table_size_pretty(session, "block")
+    return _chain_info(row, supply_lovelace)
 
-    # Get sync progress
-    sync_progress = queries.get_sync_progress_percent(session)
-    sync_behind = queries.get_sync_behind_duration(session)
 
+def _chain_info(row: Row, supply_lovelace: int | None) -> dict[str, Any]:
+    """Assemble the ``get_chain_info`` result from its two queries."""
     return {
-        "network": meta.network_name if meta else "Unknown",
-        "start_time": meta.start_time if meta else None,
+        "network": row.network or "Unknown",
+        "start_time": row.start_time,
         "supply_lovelace": supply_lovelace,
-        "supply_ada": supply_ada,
-        "latest_slot": latest_slot,
-        "database_size": db_size,
-        "block_table_size": block_table_size,
-        "sync_progress_percent": sync_progress,
-        "sync_behind": sync_behind,
+        "supply_ada": (
+            None if supply_lovelace is None else float(supply_lovelace) / 1_000_000
+        ),
+        "latest_slot": row.latest_slot,
+        "database_size": row.database_size or "Unknown",
+        "block_table_size": row.block_table_size or "Unknown",
+        "sync_progress_percent": float(row.sync_progress_percent or 0.0),
+        "sync_behind": str(row.sync_behind) if row.sync_behind else None,
     }
 
 
+async def get_chain_info_async(
+    session: AsyncSession, *, include_supply: bool = True
+) -> dict[str, Any]:
+    """Get comprehensive chain information from an async session.
+
+    Async counterpart of ``get_chain_info``. The supply query runs
+    concurrently with the rest on a second session bound to the same engine,
+    since one session cannot execute two statements at once.
+
+    Args:
+        session: Async database session
+        include_supply: Calculate the current supply (see ``get_chain_info``)
+
+    Returns:
+        Dictionary containing all chain information
+
+    Example:
+        >>> from dbsync.session import get_async_session_context
+        >>> async with get_async_session_context() as session:
+        ...     info = await get_chain_info_async(session)
+    """
+
+    async def chain_info_row() -> Row:
+        return (await session.execute(_CHAIN_INFO_STMT)).one()
+
+    async def current_supply() -> int | None:
+        if not include_supply:
+            return None
+        async with AsyncSession(session.bind) as supply_session:
+            return await _get_current_supply_async(supply_session)
+
+    row, supply_lovelace = await asyncio.gather(chain_info_row(), current_supply())
+    return _chain_info(row, supply_lovelace)
+
+
 if __name__ == "__main__":
     """Example usage when run directly."""
     try:
@@ -6,7 +6,19 @@ Conway era governance queries for Cardano's on-chain governance features.
 
 from typing import Any
 
-from sqlalchemy import case, desc, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    bindparam,
+    case,
+    desc,
+    func,
+    select,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
@@ -26,20 +38,38 @@ from ...models import (
     VotingProcedure,
 )
 
+# Statements are built once at import and reused so SQLAlchemy computes each
+# cache key once and keeps hitting its compiled cache. Per-call values such as
+# limits and the analysis window's start slot are bound parameters, and the
+# optional ID filters get their own prebuilt variant.
+_LIMIT = bindparam("limit", type_=Integer)
+_START_SLOT = bindparam("start_slot", type_=Integer)
 
-class GovernanceQueries:
-    """Example Conway era governance query utilities."""
 
-    @staticmethod
-    def get_governance_proposal_analysis(
-        session: Session | AsyncSession, proposal_id: int | None = None, limit: int = 20
-    ) -> dict[str, Any]:
-        """Analyze governance action proposals and their lifecycle."""
-        if isinstance(session, AsyncSession):
-            raise NotImplementedError("Async version not yet implemented")
+def _hex(column: Any) -> ColumnElement[str]:
+    """Render a bytea column as hex text in SQL."""
+    return func.encode(column, "hex")
+
+
+def _timestamp(column: Any) -> ColumnElement[str]:
+    """Render a timestamp column in SQL as ``str(datetime)`` would."""
+    return func.to_char(column, "YYYY-MM-DD HH24:MI:SS")
+
+
+# Lifecycle status of a proposal, checked from the latest stage back
+_PROPOSAL_STATUS = case(
+    (GovActionProposal.enacted_epoch.is_not(None), "Enacted"),
+    (GovActionProposal.ratified_epoch.is_not(None), "Ratified"),
+    (GovActionProposal.dropped_epoch.is_not(None), "Dropped"),
+    (GovActionProposal.expired_epoch.is_not(None), "Expired"),
+    else_="Active",
+)
 
-        # Base query for governance proposals
-        proposals_stmt = select(
+
+def _build_proposal_analysis_stmt(*criteria: ColumnElement[bool]) -> Select[Any]:
+    """Build the proposal analysis statement, filtered by ``criteria``."""
+    proposals = (
+        select(
             GovActionProposal.id_,
             GovActionProposal.tx_id,
             GovActionProposal.index,
@@ -49,118 +79,529 @@ class GovernanceQueries:
             GovActionProposal.enacted_epoch,
             GovActionProposal.dropped_epoch,
             GovActionProposal.expired_epoch,
+            _PROPOSAL_STATUS.label("status"),
             GovActionProposal.type_.label("action_type"),
             VotingAnchor.url.label("anchor_url"),
-            VotingAnchor.data_hash.label("anchor_hash"),
-            Block.time.label("proposal_time"),
+            _hex(VotingAnchor.data_hash).label("anchor_hash"),
+            _timestamp(Block.time).label("proposal_time"),
             Block.epoch_no.label("proposal_epoch"),
-        ).select_from(
+        )
+        .select_from(
             GovActionProposal.__table__.outerjoin(
                 VotingAnchor.__table__,
                 GovActionProposal.voting_anchor_id == VotingAnchor.id_,
             ).join(Block.__table__, GovActionProposal.tx_id == Block.id_)
         )
+        .where(*criteria)
+        .order_by(desc(GovActionProposal.id_))
+        .limit(_LIMIT)
+        .cte("proposals")
+    )
+
+    # Status counts per proposal type plus the grand total, from one scan of
+    # gov_action_proposal; grouping() tells the total row apart
+    counts = (
+        select(
+            func.grouping(GovActionProposal.type_).label("is_total"),
+            GovActionProposal.type_.label("action_type"),
+            func.count().label("total_proposals"),
+            func.count()
+            .filter(GovActionProposal.ratified_epoch.is_not(None))
+            .label("ratified_count"),
+            func.count()
+            .filter(GovActionProposal.enacted_epoch.is_not(None))
+            .label("enacted_count"),
+            func.count()
+            .filter(GovActionProposal.dropped_epoch.is_not(None))
+            .label("dropped_count"),
+            func.count()
+            .filter(GovActionProposal.expired_epoch.is_not(None))
+            .label("expired_count"),
+            func.sum(GovActionProposal.deposit).label("total_deposits"),
+        )
+        .group_by(func.grouping_sets(GovActionProposal.type_, tuple_()))
+        .cte("proposal_counts")
+    )
+
+    # Proposal status statistics
+    stats = (
+        select(
+            counts.c.total_proposals,
+            counts.c.ratified_count,
+            counts.c.enacted_count,
+            counts.c.dropped_count,
+            counts.c.expired_count,
+            counts.c.total_deposits,
+        )
+        .where(counts.c.is_total == 1)
+        .cte("status_stats")
+    )
+
+    # Proposal type distribution, aggregated into one JSON array
+    type_distribution = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        "action_type",
+                        counts.c.action_type,
+                        "count",
+                        counts.c.total_proposals,
+                    ),
+                    desc(counts.c.total_proposals),
+                )
+            )
+        )
+        .where(counts.c.is_total == 0)
+        .scalar_subquery()
+    )
+
+    # One round trip: every proposal row carries the statistics, and the
+    # outer join keeps a single statistics row when no proposal matches
+    return (
+        select(stats, type_distribution.label("type_distribution"), proposals)
+        .select_from(stats.outerjoin(proposals, true()))
+        .order_by(desc(proposals.c.id_))
+    )
+
+
+_PROPOSAL_ANALYSIS_STMT = _build_proposal_analysis_stmt()
+_PROPOSAL_BY_ID_ANALYSIS_STMT = _build_proposal_analysis_stmt(
+    GovActionProposal.id_ == bindparam("proposal_id")
+)
 
-        if proposal_id:
-            proposals_stmt = proposals_stmt.where(GovActionProposal.id_ == proposal_id)
 
-        proposals_stmt = proposals_stmt.order_by(desc(GovActionProposal.id_)).limit(
-            limit
+def _build_drep_registrations_stmt(*criteria: ColumnElement[bool]) -> Select[Any]:
+    """Build the DRep registrations statement, filtered by ``criteria``."""
+    return (
+        select(
+            DrepRegistration.id_,
+            DrepRegistration.tx_id,
+            DrepRegistration.cert_index,
+            DrepRegistration.deposit,
+            DrepHash.view.label("drep_id"),
+            _hex(DrepHash.raw).label("drep_hash"),
+            VotingAnchor.url.label("anchor_url"),
+            _hex(VotingAnchor.data_hash).label("anchor_hash"),
+            _timestamp(Block.time).label("registration_time"),
+            Block.epoch_no.label("registration_epoch"),
         )
+        .select_from(
+            DrepRegistration.__table__.join(
+                DrepHash.__table__, DrepRegistration.drep_hash_id == DrepHash.id_
+            )
+            .outerjoin(
+                VotingAnchor.__table__,
+                DrepRegistration.voting_anchor_id == VotingAnchor.id_,
+            )
+            .join(Block.__table__, DrepRegistration.tx_id == Block.id_)
+        )
+        .where(*criteria)
+        .order_by(desc(DrepRegistration.id_))
+        .limit(_LIMIT)
+    )
 
-        proposals = session.execute(proposals_stmt).all()
 
-        if proposal_id and not proposals:
-            return {
-                "found": False,
-                "proposal_id": proposal_id,
-                "error": "Governance proposal not found",
-            }
+_DREP_REGISTRATIONS_STMT = _build_drep_registrations_stmt()
+_DREP_REGISTRATIONS_BY_ID_STMT = _build_drep_registrations_stmt(
+    DrepHash.view == bindparam("drep_id")
+)
 
-        # Get proposal status statistics
-        status_stats = session.execute(
-            select(
-                func.count(GovActionProposal.id_).label("total_proposals"),
-                func.count(GovActionProposal.ratified_epoch).label("ratified_count"),
-                func.count(GovActionProposal.enacted_epoch).label("enacted_count"),
-                func.count(GovActionProposal.dropped_epoch).label("dropped_count"),
-                func.count(GovActionProposal.expired_epoch).label("expired_count"),
-                func.sum(GovActionProposal.deposit).label("total_deposits"),
-            )
-        ).first()
+_DREP_STATS_STMT = select(
+    func.count(func.distinct(DrepRegistration.drep_hash_id)).label("total_dreps"),
+    func.sum(DrepRegistration.deposit).label("total_deposits"),
+    func.avg(DrepRegistration.deposit).label("avg_deposit"),
+)
+
+_DREP_DELEGATION_LEADERS_STMT = (
+    select(
+        DrepHash.view.label("drep_id"),
+        func.count(DrepDistr.hash_id).label("delegator_count"),
+        func.sum(DrepDistr.amount).label("total_stake"),
+    )
+    .select_from(
+        DrepDistr.__table__.join(DrepHash.__table__, DrepDistr.hash_id == DrepHash.id_)
+    )
+    .group_by(DrepHash.view)
+    .order_by(desc(func.sum(DrepDistr.amount)))
+    .limit(10)
+)
+
+_DREP_VOTING_ACTIVITY_STMT = (
+    select(
+        DrepHash.view.label("drep_id"),
+        func.count(VotingProcedure.id_).label("vote_count"),
+        VotingProcedure.vote.label("vote_type"),
+    )
+    .select_from(
+        VotingProcedure.__table__.join(
+            DrepHash.__table__, VotingProcedure.drep_voter == DrepHash.id_
+        )
+    )
+    .group_by(DrepHash.view, VotingProcedure.vote)
+    .order_by(desc(func.count(VotingProcedure.id_)))
+    .limit(20)
+)
+
+_COMMITTEE_REGISTRATIONS_STMT = (
+    select(
+        CommitteeRegistration.id_,
+        CommitteeRegistration.tx_id,
+        CommitteeRegistration.cert_index,
+        _hex(CommitteeHash.raw).label("cold_key"),
+        _timestamp(Block.time).label("registration_time"),
+        Block.epoch_no.label("registration_epoch"),
+    )
+    .select_from(
+        CommitteeRegistration.__table__.join(
+            CommitteeHash.__table__,
+            CommitteeRegistration.cold_key_id == CommitteeHash.id_,
+        ).join(Block.__table__, CommitteeRegistration.tx_id == Block.id_)
+    )
+    .order_by(desc(CommitteeRegistration.id_))
+    .limit(_LIMIT)
+)
 
-        # Get proposal type distribution
-        type_distribution = session.execute(
-            select(
-                GovActionProposal.type_,
-                func.count(GovActionProposal.id_).label("count"),
+_COMMITTEE_DEREGISTRATIONS_STMT = (
+    select(
+        CommitteeDeRegistration.id_,
+        CommitteeDeRegistration.tx_id,
+        CommitteeDeRegistration.cert_index,
+        _hex(CommitteeHash.raw).label("cold_key"),
+        VotingAnchor.url.label("anchor_url"),
+        _timestamp(Block.time).label("deregistration_time"),
+        Block.epoch_no.label("deregistration_epoch"),
+    )
+    .select_from(
+        CommitteeDeRegistration.__table__.join(
+            CommitteeHash.__table__,
+            CommitteeDeRegistration.cold_key_id == CommitteeHash.id_,
+        )
+        .outerjoin(
+            VotingAnchor.__table__,
+            CommitteeDeRegistration.voting_anchor_id == VotingAnchor.id_,
+        )
+        .join(Block.__table__, CommitteeDeRegistration.tx_id == Block.id_)
+    )
+    .order_by(desc(CommitteeDeRegistration.id_))
+    .limit(_LIMIT)
+)
+
+_COMMITTEE_MEMBERS_STMT = (
+    select(
+        CommitteeMember.id_,
+        _hex(CommitteeHash.raw).label("cold_key"),
+        CommitteeMember.expiration_epoch,
+    )
+    .select_from(
+        CommitteeMember.__table__.join(
+            CommitteeHash.__table__,
+            CommitteeMember.committee_hash_id == CommitteeHash.id_,
+        )
+    )
+    .order_by(CommitteeMember.expiration_epoch.desc())
+    .limit(_LIMIT)
+)
+
+_COMMITTEE_VOTES_STMT = (
+    select(
+        _hex(CommitteeHash.raw).label("committee_member"),
+        func.count(VotingProcedure.id_).label("vote_count"),
+        VotingProcedure.vote.label("vote_type"),
+    )
+    .select_from(
+        VotingProcedure.__table__.join(
+            CommitteeHash.__table__,
+            VotingProcedure.committee_voter == CommitteeHash.id_,
+        )
+    )
+    .group_by(CommitteeHash.raw, VotingProcedure.vote)
+    .order_by(desc(func.count(VotingProcedure.id_)))
+    .limit(20)
+)
+
+_COMMITTEE_STMTS = (
+    _COMMITTEE_REGISTRATIONS_STMT,
+    _COMMITTEE_DEREGISTRATIONS_STMT,
+    _COMMITTEE_MEMBERS_STMT,
+    _COMMITTEE_VOTES_STMT,
+)
+
+# Every committee statement joins committee_hash, so one predicate narrows
+# them all to a single member
+_COMMITTEE_BY_MEMBER_STMTS = tuple(
+    stmt.where(CommitteeHash.raw == bindparam("cold_key")) for stmt in _COMMITTEE_STMTS
+)
+
+_COMMITTEE_STATS_STMT = select(
+    func.count(func.distinct(CommitteeMember.committee_hash_id)).label("total_members"),
+    func.count(func.distinct(CommitteeRegistration.cold_key_id)).label(
+        "total_registrations"
+    ),
+    func.count(func.distinct(CommitteeDeRegistration.cold_key_id)).label(
+        "total_deregistrations"
+    ),
+)
+
+_CHAIN_TIP_STMT = select(
+    func.max(Block.slot_no).label("latest_slot"),
+    func.max(Block.time).label("latest_time"),
+)
+
+_LATEST_SLOT_STMT = select(func.max(Block.slot_no))
+
+
+def _build_treasury_analysis_stmt() -> Select[Any]:
+    """Build the treasury analysis statement.
+
+    Withdrawals from proposals submitted inside the analysis window are
+    joined once in a shared CTE; the statistics, recent withdrawals and top
+    proposals are all derived from it.
+    """
+    withdrawals = (
+        select(
+            TreasuryWithdrawal.id_,
+            TreasuryWithdrawal.gov_action_proposal_id,
+            TreasuryWithdrawal.stake_address_id,
+            TreasuryWithdrawal.amount,
+            StakeAddress.view.label("stake_address"),
+            _timestamp(Block.time).label("withdrawal_time"),
+            Block.epoch_no.label("withdrawal_epoch"),
+            GovActionProposal.index.label("proposal_index"),
+        )
+        .select_from(
+            TreasuryWithdrawal.__table__.join(
+                StakeAddress.__table__,
+                TreasuryWithdrawal.stake_address_id == StakeAddress.id_,
             )
-            .group_by(GovActionProposal.type_)
-            .order_by(desc(func.count(GovActionProposal.id_)))
-        ).all()
+            .join(
+                GovActionProposal.__table__,
+                TreasuryWithdrawal.gov_action_proposal_id == GovActionProposal.id_,
+            )
+            .join(Block.__table__, GovActionProposal.tx_id == Block.id_)
+        )
+        .where(Block.slot_no >= _START_SLOT)
+        .cte("withdrawals")
+    )
+
+    # Treasury withdrawal statistics
+    stats = select(
+        func.count(withdrawals.c.id_).label("total_withdrawals"),
+        func.sum(withdrawals.c.amount).label("total_amount"),
+        func.avg(withdrawals.c.amount).label("avg_amount"),
+        func.max(withdrawals.c.amount).label("max_amount"),
+        func.count(func.distinct(withdrawals.c.stake_address_id)).label(
+            "unique_recipients"
+        ),
+    ).cte("withdrawal_stats")
+
+    recent = (
+        select(withdrawals)
+        .order_by(desc(withdrawals.c.id_))
+        .limit(_LIMIT)
+        .cte("recent_withdrawals")
+    )
+
+    # Treasury proposals by amount, aggregated into one JSON array
+    top = (
+        select(
+            withdrawals.c.gov_action_proposal_id.label("proposal_id"),
+            withdrawals.c.proposal_index,
+            func.sum(withdrawals.c.amount).label("total_withdrawal"),
+            func.count(withdrawals.c.id_).label("withdrawal_count"),
+            withdrawals.c.withdrawal_time.label("proposal_time"),
+            withdrawals.c.withdrawal_epoch.label("proposal_epoch"),
+        )
+        .group_by(
+            withdrawals.c.gov_action_proposal_id,
+            withdrawals.c.proposal_index,
+            withdrawals.c.withdrawal_time,
+            withdrawals.c.withdrawal_epoch,
+        )
+        .order_by(desc(func.sum(withdrawals.c.amount)))
+        .limit(10)
+        .subquery("top")
+    )
+    top_proposals = select(
+        func.json_agg(
+            aggregate_order_by(
+                func.json_build_object(
+                    "proposal_id",
+                    top.c.proposal_id,
+                    "proposal_index",
+                    top.c.proposal_index,
+                    "total_withdrawal",
+                    top.c.total_withdrawal,
+                    "withdrawal_count",
+                    top.c.withdrawal_count,
+                    "proposal_time",
+                    top.c.proposal_time,
+                    "proposal_epoch",
+                    top.c.proposal_epoch,
+                ),
+                desc(top.c.total_withdrawal),
+            )
+        )
+    ).scalar_subquery()
+
+    return (
+        select(stats, top_proposals.label("top_proposals"), recent)
+        .select_from(stats.outerjoin(recent, true()))
+        .order_by(desc(recent.c.id_))
+    )
+
+
+_TREASURY_ANALYSIS_STMT = _build_treasury_analysis_stmt()
+
+# Votes cast on proposals submitted inside the analysis window
+_WINDOW_VOTES = VotingProcedure.__table__.join(
+    GovActionProposal.__table__,
+    VotingProcedure.gov_action_proposal_id == GovActionProposal.id_,
+).join(Block.__table__, GovActionProposal.tx_id == Block.id_)
+
+_VOTING_STATS_STMT = (
+    select(
+        func.count(VotingProcedure.id_).label("total_votes"),
+        func.count(func.distinct(VotingProcedure.gov_action_proposal_id)).label(
+            "proposals_voted_on"
+        ),
+        func.count(func.distinct(VotingProcedure.drep_voter)).label(
+            "unique_drep_voters"
+        ),
+        func.count(func.distinct(VotingProcedure.committee_voter)).label(
+            "unique_committee_voters"
+        ),
+        func.count(func.distinct(VotingProcedure.pool_voter)).label(
+            "unique_pool_voters"
+        ),
+    )
+    .select_from(_WINDOW_VOTES)
+    .where(Block.slot_no >= _START_SLOT)
+)
 
-        # Process proposal data
-        proposal_list = []
-        for row in proposals:
-            # Determine proposal status
-            status = "Active"
-            if row.enacted_epoch:
-                status = "Enacted"
-            elif row.ratified_epoch:
-                status = "Ratified"
-            elif row.dropped_epoch:
-                status = "Dropped"
-            elif row.expired_epoch:
-                status = "Expired"
+_VOTE_DISTRIBUTION_STMT = (
+    select(
+        VotingProcedure.vote.label("vote_type"),
+        func.count(VotingProcedure.id_).label("count"),
+    )
+    .select_from(_WINDOW_VOTES)
+    .where(Block.slot_no >= _START_SLOT)
+    .group_by(VotingProcedure.vote)
+    .order_by(desc(func.count(VotingProcedure.id_)))
+)
+
+_ACTIVE_DREP_VOTERS_STMT = (
+    select(
+        DrepHash.view.label("drep_id"),
+        func.count(VotingProcedure.id_).label("vote_count"),
+    )
+    .select_from(
+        _WINDOW_VOTES.join(
+            DrepHash.__table__, VotingProcedure.drep_voter == DrepHash.id_
+        )
+    )
+    .where(Block.slot_no >= _START_SLOT)
+    .group_by(DrepHash.view)
+    .order_by(desc(func.count(VotingProcedure.id_)))
+    .limit(10)
+)
+
+_PROPOSAL_VOTING_STMT = (
+    select(
+        GovActionProposal.id_.label("proposal_id"),
+        GovActionProposal.index.label("proposal_index"),
+        GovActionProposal.type_.label("action_type"),
+        func.count(VotingProcedure.id_).label("total_votes"),
+        func.count(case((VotingProcedure.vote == "Yes", 1))).label("yes_votes"),
+        func.count(case((VotingProcedure.vote == "No", 1))).label("no_votes"),
+        func.count(case((VotingProcedure.vote == "Abstain", 1))).label("abstain_votes"),
+    )
+    .select_from(_WINDOW_VOTES)
+    .where(Block.slot_no >= _START_SLOT)
+    .group_by(GovActionProposal.id_, GovActionProposal.index, GovActionProposal.type_)
+    .order_by(desc(func.count(VotingProcedure.id_)))
+    .limit(_LIMIT)
+)
+
+
+class GovernanceQueries:
+    """Example Conway era governance query utilities."""
+
+    @staticmethod
+    def get_governance_proposal_analysis(
+        session: Session | AsyncSession, proposal_id: int | None = None, limit: int = 20
+    ) -> dict[str, Any]:
+        """Analyze governance action proposals and their lifecycle."""
+        if isinstance(session, AsyncSession):
+            raise NotImplementedError("Async version not yet implemented")
 
+        stmt = _PROPOSAL_BY_ID_ANALYSIS_STMT if proposal_id else _PROPOSAL_ANALYSIS_STMT
+        rows = session.execute(
+            stmt,
+            {"proposal_id": proposal_id, "limit": limit},
+            execution_options={"yield_per": 500},
+        ).mappings()
+
+        # Process proposal data as it streams in; every row repeats the
+        # statistics, and a lone statistics row has no proposal columns
+        status_stats: Any = None
+        proposal_list = []
+        for row in rows:
+            status_stats = row
+            if row["id_"] is None:
+                continue
             proposal_list.append(
                 {
-                    "id": row.id_,
-                    "tx_id": row.tx_id,
-                    "index": row.index,
-                    "action_type": row.action_type,
-                    "status": status,
-                    "deposit_lovelace": int(row.deposit or 0),
-                    "return_address": row.return_address,
-                    "proposal_time": (
-                        str(row.proposal_time) if row.proposal_time else None
-                    ),
-                    "proposal_epoch": row.proposal_epoch,
-                    "ratified_epoch": row.ratified_epoch,
-                    "enacted_epoch": row.enacted_epoch,
-                    "dropped_epoch": row.dropped_epoch,
-                    "expired_epoch": row.expired_epoch,
-                    "anchor_url": row.anchor_url,
-                    "anchor_hash": row.anchor_hash.hex() if row.anchor_hash else None,
+                    "id": row["id_"],
+                    "tx_id": row["tx_id"],
+                    "index": row["index"],
+                    "action_type": row["action_type"],
+                    "status": row["status"],
+                    "deposit_lovelace": int(row["deposit"] or 0),
+                    "return_address": row["return_address"],
+                    "proposal_time": row["proposal_time"],
+                    "proposal_epoch": row["proposal_epoch"],
+                    "ratified_epoch": row["ratified_epoch"],
+                    "enacted_epoch": row["enacted_epoch"],
+                    "dropped_epoch": row["dropped_epoch"],
+                    "expired_epoch": row["expired_epoch"],
+                    "anchor_url": row["anchor_url"],
+                    "anchor_hash": row["anchor_hash"],
                 }
             )
 
+        if proposal_id and not proposal_list:
+            return {
+                "found": False,
+                "proposal_id": proposal_id,
+                "error": "Governance proposal not found",
+            }
+
+        total_proposals = max(status_stats["total_proposals"] or 1, 1)
         return {
             "found": True,
             "proposal_id": proposal_id,
             "proposals_analyzed": len(proposal_list),
             "proposals": proposal_list,
             "statistics": {
-                "total_proposals": int(status_stats.total_proposals or 0),
-                "ratified_count": int(status_stats.ratified_count or 0),
-                "enacted_count": int(status_stats.enacted_count or 0),
-                "dropped_count": int(status_stats.dropped_count or 0),
-                "expired_count": int(status_stats.expired_count or 0),
-                "total_deposits_lovelace": int(status_stats.total_deposits or 0),
-                "ratification_rate": (status_stats.ratified_count or 0)
-                / max(status_stats.total_proposals or 1, 1),
-                "enactment_rate": (status_stats.enacted_count or 0)
-                / max(status_stats.total_proposals or 1, 1),
+                "total_proposals": int(status_stats["total_proposals"] or 0),
+                "ratified_count": int(status_stats["ratified_count"] or 0),
+                "enacted_count": int(status_stats["enacted_count"] or 0),
+                "dropped_count": int(status_stats["dropped_count"] or 0),
+                "expired_count": int(status_stats["expired_count"] or 0),
+                "total_deposits_lovelace": int(status_stats["total_deposits"] or 0),
+                "ratification_rate": (status_stats["ratified_count"] or 0)
+                / total_proposals,
+                "enactment_rate": (status_stats["enacted_count"] or 0)
+                / total_proposals,
             },
             "type_distribution": [
                 {
-                    "action_type": row.type_,
-                    "count": int(row.count),
-                    "percentage": int(row.count)
-                    / max(status_stats.total_proposals or 1, 1)
-                    * 100,
+                    "action_type": row["action_type"],
+                    "count": int(row["count"]),
+                    "percentage": int(row["count"]) / total_proposals * 100,
                 }
-                for row in type_distribution
+                for row in status_stats["type_distribution"] or []
             ],
         }
 
@@ -172,35 +613,10 @@ class GovernanceQueries:
         if isinstance(session, AsyncSession):
             raise NotImplementedError("Async version not yet implemented")
 
-        # Base query for DRep registrations
-        drep_stmt = select(
-            DrepRegistration.id_,
-            DrepRegistration.tx_id,
-            DrepRegistration.cert_index,
-            DrepRegistration.deposit,
-            DrepHash.view.label("drep_id"),
-            DrepHash.raw.label("drep_hash"),
-            VotingAnchor.url.label("anchor_url"),
-            VotingAnchor.data_hash.label("anchor_hash"),
-            Block.time.label("registration_time"),
-            Block.epoch_no.label("registration_epoch"),
-        ).select_from(
-            DrepRegistration.__table__.join(
-                DrepHash.__table__, DrepRegistration.drep_hash_id == DrepHash.id_
-            )
-            .outerjoin(
-                VotingAnchor.__table__,
-                DrepRegistration.voting_anchor_id == VotingAnchor.id_,
-            )
-            .join(Block.__table__, DrepRegistration.tx_id == Block.id_)
-        )
-
-        if drep_id:
-            drep_stmt = drep_stmt.where(DrepHash.view == drep_id)
-
-        drep_stmt = drep_stmt.order_by(desc(DrepRegistration.id_)).limit(limit)
-
-        drep_registrations = session.execute(drep_stmt).all()
+        stmt = _DREP_REGISTRATIONS_BY_ID_STMT if drep_id else _DREP_REGISTRATIONS_STMT
+        drep_registrations = session.execute(
+            stmt, {"drep_id": drep_id, "limit": limit}
+        ).all()
 
         if drep_id and not drep_registrations:
             return {
@@ -210,49 +626,13 @@ class GovernanceQueries:
             }
 
         # Get DRep statistics
-        drep_stats = session.execute(
-            select(
-                func.count(func.distinct(DrepRegistration.drep_hash_id)).label(
-                    "total_dreps"
-                ),
-                func.sum(DrepRegistration.deposit).label("total_deposits"),
-                func.avg(DrepRegistration.deposit).label("avg_deposit"),
-            )
-        ).first()
+        drep_stats = session.execute(_DREP_STATS_STMT).first()
 
         # Get delegation distribution for DReps
-        delegation_stats = session.execute(
-            select(
-                DrepHash.view.label("drep_id"),
-                func.count(DrepDistr.hash_id).label("delegator_count"),
-                func.sum(DrepDistr.amount).label("total_stake"),
-            )
-            .select_from(
-                DrepDistr.__table__.join(
-                    DrepHash.__table__, DrepDistr.hash_id == DrepHash.id_
-                )
-            )
-            .group_by(DrepHash.view)
-            .order_by(desc(func.sum(DrepDistr.amount)))
-            .limit(10)
-        ).all()
+        delegation_stats = session.execute(_DREP_DELEGATION_LEADERS_STMT).all()
 
         # Get voting activity
-        voting_activity = session.execute(
-            select(
-                DrepHash.view.label("drep_id"),
-                func.count(VotingProcedure.id_).label("vote_count"),
-                VotingProcedure.vote.label("vote_type"),
-            )
-            .select_from(
-                VotingProcedure.__table__.join(
-                    DrepHash.__table__, VotingProcedure.drep_voter == DrepHash.id_
-                )
-            )
-            .group_by(DrepHash.view, VotingProcedure.vote)
-            .order_by(desc(func.count(VotingProcedure.id_)))
-            .limit(20)
-        ).all()
+        voting_activity = session.execute(_DREP_VOTING_ACTIVITY_STMT).all()
 
         # Process DRep data
         drep_list = []
@@ -261,14 +641,12 @@ class GovernanceQueries:
                 {
                     "id": row.id_,
                     "drep_id": row.drep_id,
-                    "drep_hash": row.drep_hash.hex() if row.drep_hash else None,
+                    "drep_hash": row.drep_hash,
                     "deposit_lovelace": int(row.deposit or 0),
-                    "registration_time": (
-                        str(row.registration_time) if row.registration_time else None
-                    ),
+                    "registration_time": row.registration_time,
                     "registration_epoch": row.registration_epoch,
                     "anchor_url": row.anchor_url,
-                    "anchor_hash": row.anchor_hash.hex() if row.anchor_hash else None,
+                    "anchor_hash": row.anchor_hash,
                 }
             )
 
@@ -310,142 +688,47 @@ class GovernanceQueries:
         if isinstance(session, AsyncSession):
             raise NotImplementedError("Async version not yet implemented")
 
-        # Get committee registrations
-        committee_registrations = session.execute(
-            select(
-                CommitteeRegistration.id_,
-                CommitteeRegistration.tx_id,
-                CommitteeRegistration.cert_index,
-                CommitteeHash.raw.label("cold_key"),
-                Block.time.label("registration_time"),
-                Block.epoch_no.label("registration_epoch"),
-            )
-            .select_from(
-                CommitteeRegistration.__table__.join(
-                    CommitteeHash.__table__,
-                    CommitteeRegistration.cold_key_id == CommitteeHash.id_,
-                ).join(Block.__table__, CommitteeRegistration.tx_id == Block.id_)
-            )
-            .order_by(desc(CommitteeRegistration.id_))
-            .limit(limit)
-        ).all()
-
-        # Get committee deregistrations
-        committee_deregistrations = session.execute(
-            select(
-                CommitteeDeRegistration.id_,
-                CommitteeDeRegistration.tx_id,
-                CommitteeDeRegistration.cert_index,
-                CommitteeHash.raw.label("cold_key"),
-                VotingAnchor.url.label("anchor_url"),
-                Block.time.label("deregistration_time"),
-                Block.epoch_no.label("deregistration_epoch"),
-            )
-            .select_from(
-                CommitteeDeRegistration.__table__.join(
-                    CommitteeHash.__table__,
-                    CommitteeDeRegistration.cold_key_id == CommitteeHash.id_,
-                )
-                .outerjoin(
-                    VotingAnchor.__table__,
-                    CommitteeDeRegistration.voting_anchor_id == VotingAnchor.id_,
-                )
-                .join(Block.__table__, CommitteeDeRegistration.tx_id == Block.id_)
-            )
-            .order_by(desc(CommitteeDeRegistration.id_))
-            .limit(limit)
-        ).all()
-
-        # Get committee member information
-        committee_members = session.execute(
-            select(
-                CommitteeMember.id_,
-                CommitteeHash.raw.label("cold_key"),
-                CommitteeMember.expiration_epoch,
-            )
-            .select_from(
-                CommitteeMember.__table__.join(
-                    CommitteeHash.__table__,
-                    CommitteeMember.committee_hash_id == CommitteeHash.id_,
-                )
-            )
-            .order_by(CommitteeMember.expiration_epoch.desc())
-            .limit(limit)
-        ).all()
-
-        # Get committee voting activity
-        committee_votes = session.execute(
-            select(
-                CommitteeHash.raw.label("committee_member"),
-                func.count(VotingProcedure.id_).label("vote_count"),
-                VotingProcedure.vote.label("vote_type"),
-            )
-            .select_from(
-                VotingProcedure.__table__.join(
-                    CommitteeHash.__table__,
-                    VotingProcedure.committee_voter == CommitteeHash.id_,
-                )
-            )
-            .group_by(CommitteeHash.raw, VotingProcedure.vote)
-            .order_by(desc(func.count(VotingProcedure.id_)))
-            .limit(20)
-        ).all()
-
-        # Get overall committee statistics
-        committee_stats = session.execute(
-            select(
-                func.count(func.distinct(CommitteeMember.committee_hash_id)).label(
-                    "total_members"
-                ),
-                func.count(func.distinct(CommitteeRegistration.cold_key_id)).label(
-                    "total_registrations"
-                ),
-                func.count(func.distinct(CommitteeDeRegistration.cold_key_id)).label(
-                    "total_deregistrations"
-                ),
-            )
-        ).first()
+        params: dict[str, Any] = {"limit": limit}
+        statements = _COMMITTEE_STMTS
 
         # Filter by specific committee member if requested
         if committee_member:
             # Convert hex string to bytes for comparison
             try:
-                committee_member_bytes = bytes.fromhex(committee_member)
-                committee_registrations = [
-                    r
-                    for r in committee_registrations
-                    if r.cold_key == committee_member_bytes
-                ]
-                committee_deregistrations = [
-                    r
-                    for r in committee_deregistrations
-                    if r.cold_key == committee_member_bytes
-                ]
-                committee_members = [
-                    m for m in committee_members if m.cold_key == committee_member_bytes
-                ]
-                committee_votes = [
-                    v
-                    for v in committee_votes
-                    if v.committee_member == committee_member_bytes
-                ]
+                params["cold_key"] = bytes.fromhex(committee_member)
             except ValueError:
                 return {
                     "found": False,
                     "committee_member": committee_member,
                     "error": "Invalid committee member format - expected hex string",
                 }
+            statements = _COMMITTEE_BY_MEMBER_STMTS
 
-            if not (
-                committee_registrations
-                or committee_deregistrations
-                or committee_members
-            ):
-                return {
-                    "found": False,
-                    "committee_member": committee_member,
-                    "error": "Committee member not found",
-                }
+        registrations_stmt, deregistrations_stmt, members_stmt, votes_stmt = statements
+
+        # Get committee registrations
+        committee_registrations = session.execute(registrations_stmt, params).all()
+
+        # Get committee deregistrations
+        committee_deregistrations = session.execute(deregistrations_stmt, params).all()
+
+        # Get committee member information
+        committee_members = session.execute(members_stmt, params).all()
+
+        if committee_member and not (
+            committee_registrations or committee_deregistrations or committee_members
+        ):
+            return {
+                "found": False,
+                "committee_member": committee_member,
+                "error": "Committee member not found",
+            }
+
+        # Get committee voting activity
+        committee_votes = session.execute(votes_stmt, params).all()
+
+        # Get overall committee statistics, across every member
+        committee_stats = session.execute(_COMMITTEE_STATS_STMT).first()
 
         return {
             "found": True,
@@ -465,11 +748,9 @@ class GovernanceQueries:
             "registrations": [
                 {
                     "id": row.id_,
-                    "cold_key": row.cold_key.hex() if row.cold_key else None,
+                    "cold_key": row.cold_key,
                     "anchor_url": None,  # CommitteeRegistration doesn't support voting anchors
-                    "registration_time": (
-                        str(row.registration_time) if row.registration_time else None
-                    ),
+                    "registration_time": row.registration_time,
                     "registration_epoch": row.registration_epoch,
                 }
                 for row in committee_registrations
@@ -477,13 +758,9 @@ class GovernanceQueries:
             "deregistrations": [
                 {
                     "id": row.id_,
-                    "cold_key": row.cold_key.hex() if row.cold_key else None,
+                    "cold_key": row.cold_key,
                     "anchor_url": row.anchor_url,
-                    "deregistration_time": (
-                        str(row.deregistration_time)
-                        if row.deregistration_time
-                        else None
-                    ),
+                    "deregistration_time": row.deregistration_time,
                     "deregistration_epoch": row.deregistration_epoch,
                 }
                 for row in committee_deregistrations
@@ -491,20 +768,14 @@ class GovernanceQueries:
             "current_members": [
                 {
                     "id": row.id_,
-                    "cold_key": row.cold_key.hex() if row.cold_key else None,
+                    "cold_key": row.cold_key,
                     "expiration_epoch": row.expiration_epoch,
                 }
                 for row in committee_members
             ],
             "voting_activity": [
                 {
-                    "committee_member": (
-                        row.committee_member.hex()
-                        if isinstance(row.committee_member, bytes)
-                        else str(row.committee_member)
-                        if row.committee_member
-                        else None
-                    ),
+                    "committee_member": row.committee_member,
                     "vote_count": int(row.vote_count),
                     "vote_type": row.vote_type,
                 }
@@ -521,96 +792,26 @@ class GovernanceQueries:
             raise NotImplementedError("Async version not yet implemented")
 
         # Get latest block for date filtering
-        latest_block = session.execute(
-            select(Block.time).order_by(desc(Block.time)).limit(1)
-        ).scalar()
+        tip = session.execute(_CHAIN_TIP_STMT).first()
 
-        if not latest_block:
+        if not tip or not tip.latest_time:
             return {
                 "found": False,
                 "error": "No block data available",
             }
 
         # Calculate date range using slot approximation
-        latest_slot = session.execute(select(func.max(Block.slot_no))).scalar() or 0
+        latest_slot = tip.latest_slot or 0
 
         slots_per_day = 4320  # Approximate slots per day
         start_slot = latest_slot - (days * slots_per_day)
+        params = {"start_slot": start_slot, "limit": limit}
 
-        # Get treasury withdrawals
-        treasury_withdrawals = session.execute(
-            select(
-                TreasuryWithdrawal.id_,
-                TreasuryWithdrawal.gov_action_proposal_id,
-                TreasuryWithdrawal.stake_address_id,
-                TreasuryWithdrawal.amount,
-                StakeAddress.view.label("stake_address"),
-                Block.time.label("withdrawal_time"),
-                Block.epoch_no.label("withdrawal_epoch"),
-                GovActionProposal.index.label("proposal_index"),
-            )
-            .select_from(
-                TreasuryWithdrawal.__table__.join(
-                    StakeAddress.__table__,
-                    TreasuryWithdrawal.stake_address_id == StakeAddress.id_,
-                )
-                .join(
-                    GovActionProposal.__table__,
-                    TreasuryWithdrawal.gov_action_proposal_id == GovActionProposal.id_,
-                )
-                .join(Block.__table__, GovActionProposal.tx_id == Block.id_)
-            )
-            .where(Block.slot_no >= start_slot)
-            .order_by(desc(TreasuryWithdrawal.id_))
-            .limit(limit)
-        ).all()
-
-        # Get treasury withdrawal statistics
-        withdrawal_stats = session.execute(
-            select(
-                func.count(TreasuryWithdrawal.id_).label("total_withdrawals"),
-                func.sum(TreasuryWithdrawal.amount).label("total_amount"),
-                func.avg(TreasuryWithdrawal.amount).label("avg_amount"),
-                func.max(TreasuryWithdrawal.amount).label("max_amount"),
-                func.count(func.distinct(TreasuryWithdrawal.stake_address_id)).label(
-                    "unique_recipients"
-                ),
-            )
-            .select_from(
-                TreasuryWithdrawal.__table__.join(
-                    GovActionProposal.__table__,
-                    TreasuryWithdrawal.gov_action_proposal_id == GovActionProposal.id_,
-                ).join(Block.__table__, GovActionProposal.tx_id == Block.id_)
-            )
-            .where(Block.slot_no >= start_slot)
-        ).first()
-
-        # Get treasury proposals by amount
-        treasury_proposals = session.execute(
-            select(
-                GovActionProposal.id_,
-                GovActionProposal.index,
-                func.sum(TreasuryWithdrawal.amount).label("total_withdrawal"),
-                func.count(TreasuryWithdrawal.id_).label("withdrawal_count"),
-                Block.time.label("proposal_time"),
-                Block.epoch_no.label("proposal_epoch"),
-            )
-            .select_from(
-                GovActionProposal.__table__.join(
-                    TreasuryWithdrawal.__table__,
-                    GovActionProposal.id_ == TreasuryWithdrawal.gov_action_proposal_id,
-                ).join(Block.__table__, GovActionProposal.tx_id == Block.id_)
-            )
-            .where(Block.slot_no >= start_slot)
-            .group_by(
-                GovActionProposal.id_,
-                GovActionProposal.index,
-                Block.time,
-                Block.epoch_no,
-            )
-            .order_by(desc(func.sum(TreasuryWithdrawal.amount)))
-            .limit(10)
-        ).all()
+        # One round trip: every recent withdrawal row carries the statistics
+        # and the top proposals
+        rows = session.execute(_TREASURY_ANALYSIS_STMT, params).all()
+        withdrawal_stats = rows[0]
+        treasury_withdrawals = [row for row in rows if row.id_ is not None]
 
         return {
             "found": True,
@@ -629,9 +830,7 @@ class GovernanceQueries:
                     "id": row.id_,
                     "stake_address": row.stake_address,
                     "amount_lovelace": int(row.amount or 0),
-                    "withdrawal_time": (
-                        str(row.withdrawal_time) if row.withdrawal_time else None
-                    ),
+                    "withdrawal_time": row.withdrawal_time,
                     "withdrawal_epoch": row.withdrawal_epoch,
                     "proposal_index": row.proposal_index,
                 }
@@ -639,16 +838,14 @@ class GovernanceQueries:
             ],
             "top_proposals": [
                 {
-                    "proposal_id": row.id_,
-                    "proposal_index": row.index,
-                    "total_withdrawal_lovelace": int(row.total_withdrawal or 0),
-                    "withdrawal_count": int(row.withdrawal_count),
-                    "proposal_time": (
-                        str(row.proposal_time) if row.proposal_time else None
-                    ),
-                    "proposal_epoch": row.proposal_epoch,
+                    "proposal_id": row["proposal_id"],
+                    "proposal_index": row["proposal_index"],
+                    "total_withdrawal_lovelace": int(row["total_withdrawal"] or 0),
+                    "withdrawal_count": int(row["withdrawal_count"]),
+                    "proposal_time": row["proposal_time"],
+                    "proposal_epoch": row["proposal_epoch"],
                 }
-                for row in treasury_proposals
+                for row in withdrawal_stats.top_proposals or []
             ],
         }
 
@@ -661,102 +858,23 @@ class GovernanceQueries:
             raise NotImplementedError("Async version not yet implemented")
 
         # Get latest block for date filtering
-        latest_slot = session.execute(select(func.max(Block.slot_no))).scalar() or 0
+        latest_slot = session.execute(_LATEST_SLOT_STMT).scalar() or 0
 
         slots_per_day = 4320
         start_slot = latest_slot - (days * slots_per_day)
+        params = {"start_slot": start_slot, "limit": limit}
 
         # Get voting procedure statistics
-        voting_stats = session.execute(
-            select(
-                func.count(VotingProcedure.id_).label("total_votes"),
-                func.count(func.distinct(VotingProcedure.gov_action_proposal_id)).label(
-                    "proposals_voted_on"
-                ),
-                func.count(func.distinct(VotingProcedure.drep_voter)).label(
-                    "unique_drep_voters"
-                ),
-                func.count(func.distinct(VotingProcedure.committee_voter)).label(
-                    "unique_committee_voters"
-                ),
-                func.count(func.distinct(VotingProcedure.pool_voter)).label(
-                    "unique_pool_voters"
-                ),
-            )
-            .select_from(
-                VotingProcedure.__table__.join(
-                    GovActionProposal.__table__,
-                    VotingProcedure.gov_action_proposal_id == GovActionProposal.id_,
-                ).join(Block.__table__, GovActionProposal.tx_id == Block.id_)
-            )
-            .where(Block.slot_no >= start_slot)
-        ).first()
+        voting_stats = session.execute(_VOTING_STATS_STMT, params).first()
 
         # Get vote type distribution
-        vote_distribution = session.execute(
-            select(
-                VotingProcedure.vote.label("vote_type"),
-                func.count(VotingProcedure.id_).label("count"),
-            )
-            .select_from(
-                VotingProcedure.__table__.join(
-                    GovActionProposal.__table__,
-                    VotingProcedure.gov_action_proposal_id == GovActionProposal.id_,
-                ).join(Block.__table__, GovActionProposal.tx_id == Block.id_)
-            )
-            .where(Block.slot_no >= start_slot)
-            .group_by(VotingProcedure.vote)
-            .order_by(desc(func.count(VotingProcedure.id_)))
-        ).all()
+        vote_distribution = session.execute(_VOTE_DISTRIBUTION_STMT, params).all()
 
         # Get most active voters
-        active_drep_voters = session.execute(
-            select(
-                DrepHash.view.label("drep_id"),
-                func.count(VotingProcedure.id_).label("vote_count"),
-            )
-            .select_from(
-                VotingProcedure.__table__.join(
-                    DrepHash.__table__, VotingProcedure.drep_voter == DrepHash.id_
-                )
-                .join(
-                    GovActionProposal.__table__,
-                    VotingProcedure.gov_action_proposal_id == GovActionProposal.id_,
-                )
-                .join(Block.__table__, GovActionProposal.tx_id == Block.id_)
-            )
-            .where(Block.slot_no >= start_slot)
-            .group_by(DrepHash.view)
-            .order_by(desc(func.count(VotingProcedure.id_)))
-            .limit(10)
-        ).all()
+        active_drep_voters = session.execute(_ACTIVE_DREP_VOTERS_STMT, params).all()
 
         # Get proposal voting summary
-        proposal_voting = session.execute(
-            select(
-                GovActionProposal.id_.label("proposal_id"),
-                GovActionProposal.index.label("proposal_index"),
-                GovActionProposal.type_.label("action_type"),
-                func.count(VotingProcedure.id_).label("total_votes"),
-                func.count(case((VotingProcedure.vote == "Yes", 1))).label("yes_votes"),
-                func.count(case((VotingProcedure.vote == "No", 1))).label("no_votes"),
-                func.count(case((VotingProcedure.vote == "Abstain", 1))).label(
-                    "abstain_votes"
-                ),
-            )
-            .select_from(
-                GovActionProposal.__table__.join(
-                    VotingProcedure.__table__,
-                    GovActionProposal.id_ == VotingProcedure.gov_action_proposal_id,
-                ).join(Block.__table__, GovActionProposal.tx_id == Block.id_)
-            )
-            .where(Block.slot_no >= start_slot)
-            .group_by(
-                GovActionProposal.id_, GovActionProposal.index, GovActionProposal.type_
-            )
-            .order_by(desc(func.count(VotingProcedure.id_)))
-            .limit(limit)
-        ).all()
+        proposal_voting = session.execute(_PROPOSAL_VOTING_STMT, params).all()
 
         return {
             "found": True,
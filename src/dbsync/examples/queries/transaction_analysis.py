@@ -574,6 +574,11 @@ def get_comprehensive_transaction_analysis(
     - Size distribution
     - Large transaction analysis
 
+    Each metric is fetched with its own query on the given session, so a call
+    costs four database round-trips. Callers only rely on the returned keys;
+    the sub-queries may be folded into a single statement (for example a
+    ``WITH`` query yielding one row per metric) without changing this result.
+
     Args:
         session: Database session (sync or async)
         days: Number of days to analyze
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
+from xml.sax.saxutils import XMLGenerator
 
 from .analyzer import CoverageAnalyzer, CoverageQualityMetrics
 from .reporter import CoverageReporter
@@ -310,28 +311,42 @@ class CICoverageRunner:
             output_file: Path to output XML file
         """
         gate_results = results.get("quality_gates", {}).get("results", [])
-
-        xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<testsuite name="Coverage Analysis" tests="{len(gate_results)}" failures="{len([r for r in gate_results if r["status"] == "FAIL"])}" time="0">
-"""
-
-        for gate_result in gate_results:
-            test_name = f"QualityGate.{gate_result['name']}"
-
-            if gate_result["status"] == "PASS":
-                xml_content += (
-                    f'    <testcase name="{test_name}" classname="CoverageAnalysis"/>\n'
+        failures = sum(1 for r in gate_results if r["status"] == "FAIL")
+
+        # Stream elements straight to disk instead of building the document
+        with open(output_file, "wb") as f:
+            xml = XMLGenerator(f, encoding="utf-8", short_empty_elements=True)
+            xml.startDocument()
+            xml.startElement(
+                "testsuite",
+                {
+                    "name": "Coverage Analysis",
+                    "tests": str(len(gate_results)),
+                    "failures": str(failures),
+                    "time": "0",
+                },
+            )
+            xml.ignorableWhitespace("\n")
+
+            for gate_result in gate_results:
+                xml.ignorableWhitespace("    ")
+                xml.startElement(
+                    "testcase",
+                    {
+                        "name": f"QualityGate.{gate_result['name']}",
+                        "classname": "CoverageAnalysis",
+                    },
                 )
-            else:
-                xml_content += f"""    <testcase name="{test_name}" classname="CoverageAnalysis">
-        <failure message="{gate_result["message"]}">{gate_result["message"]}</failure>
-    </testcase>
-"""
-
-        xml_content += "</testsuite>\n"
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(xml_content)
+                if gate_result["status"] != "PASS":
+                    xml.startElement("failure", {"message": gate_result["message"]})
+                    xml.characters(gate_result["message"])
+                    xml.endElement("failure")
+                xml.endElement("testcase")
+                xml.ignorableWhitespace("\n")
+
+            xml.endElement("testsuite")
+            xml.ignorableWhitespace("\n")
+            xml.endDocument()
 
     def set_quality_gates(self, gates: list[QualityGate]) -> None:
         """Set custom quality gates.
@@ -98,14 +98,22 @@ class SchemaValidator:
             response = requests.get(self.OFFICIAL_SCHEMA_URL, timeout=30)
             response.raise_for_status()
 
-            schema_content = response.text
-            self.official_schema = self._parse_schema_markdown(schema_content)
+            self.load_official_schema(response.text)
             return True
 
         except Exception as e:
             print(f"Error fetching official schema: {e}")
             return False
 
+    def load_official_schema(self, content: str) -> dict[str, TableDefinition]:
+        """Use an already downloaded official schema document.
+
+        Lets callers that fetch or cache the markdown themselves skip
+        ``fetch_official_schema``.
+        """
+        self.official_schema = self._parse_schema_markdown(content)
+        return self.official_schema
+
     def _parse_schema_markdown(self, content: str) -> dict[str, TableDefinition]:
         """Parse the schema markdown file to extract table definitions."""
         tables = {}
@@ -258,6 +258,18 @@ class TestSchemaValidator:
         assert len(validator.official_schema) == 1
         assert "test_table" in validator.official_schema
 
+    def test_load_official_schema(self):
+        """Test using a schema document fetched by the caller."""
+        validator = SchemaValidator()
+
+        tables = validator.load_official_schema(
+            "### `block`\n\n| `id` | `bigint` | NOT NULL | PRIMARY KEY |\n"
+        )
+
+        assert validator.official_schema is tables
+        assert list(tables) == ["block"]
+        assert tables["block"].fields[0].name == "id"
+
     @patch("requests.get")
     def test_fetch_official_schema_failure(self, mock_get):
         """Test schema fetching failure."""
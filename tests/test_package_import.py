@@ -38,6 +38,18 @@ def test_submodule_imports() -> None:
             pytest.fail(f"Failed to import {module_name}: {e}")
 
 
+@pytest.mark.unit
+def test_lazy_submodule_access() -> None:
+    """Test that submodules are reachable as package attributes."""
+    for name in ("config", "examples", "session", "utils"):
+        module = getattr(dbsync, name)
+        assert module.__name__ == f"dbsync.{name}"
+        assert name in dir(dbsync)
+
+    with pytest.raises(AttributeError):
+        _ = dbsync.not_a_submodule
+
+
 @pytest.mark.unit
 def test_session_imports() -> None:
     """Test that session modules can be imported."""
@@ -6,9 +6,10 @@ to ensure they work correctly and return expected data types.
 
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
-import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 # Add the src directory to path for importing the main package
@@ -17,7 +18,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 # Add the examples directory to path for importing examples
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from dbsync.examples.queries.chain_metadata import ChainMetadataQueries, get_chain_info
+from dbsync.examples.queries import chain_metadata
+from dbsync.examples.queries.chain_metadata import (
+    _CHAIN_INFO_STMT,
+    AsyncChainMetadataQueries,
+    ChainMetadataQueries,
+    get_chain_info,
+    get_chain_info_async,
+)
 from dbsync.models import ChainMeta
 
 # Lovelace is just an int in the application layer
@@ -94,6 +102,19 @@ class TestChainMetadataQueries:
         assert result == 0
         mock_session.execute.assert_called_once()
 
+    def test_get_current_supply_uses_anti_join(self):
+        """Test that spent outputs are excluded with a correlated NOT EXISTS."""
+        mock_session = Mock(spec=Session)
+        mock_session.execute.return_value.scalar.return_value = 0
+
+        ChainMetadataQueries.get_current_supply(mock_session)
+
+        stmt = mock_session.execute.call_args.args[0]
+        sql = " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+        assert "WHERE NOT (EXISTS (SELECT 1 FROM tx_in WHERE" in sql
+        assert "tx_in.tx_out_index = tx_out.index" in sql
+        assert " IN " not in sql
+
     def test_get_latest_slot_number_success(self):
         """Test successful latest slot number retrieval."""
         # Mock session and result
@@ -184,6 +205,17 @@ class TestChainMetadataQueries:
         assert result == "50 GB"
         mock_session.execute.assert_called_once()
 
+    def test_get_sizes_pretty(self):
+        """Test that both sizes come from one statement."""
+        mock_session = Mock(spec=Session)
+        mock_session.execute.return_value.one.return_value = ("116 GB", None)
+
+        result = ChainMetadataQueries.get_sizes_pretty(mock_session, "tx_out")
+
+        assert result == ("116 GB", "Unknown")
+        mock_session.execute.assert_called_once()
+        assert mock_session.execute.call_args.args[1] == {"table_name": "tx_out"}
+
     def test_get_sync_progress_percent_success(self):
         """Test successful sync progress calculation."""
         # Mock session and result
@@ -250,51 +282,33 @@ class TestChainMetadataQueries:
 class TestGetChainInfo:
     """Test cases for get_chain_info convenience function."""
 
-    @patch.object(ChainMetadataQueries, "get_chain_metadata")
-    @patch.object(ChainMetadataQueries, "get_current_supply")
-    @patch.object(ChainMetadataQueries, "get_latest_slot_number")
-    @patch.object(ChainMetadataQueries, "get_database_size_pretty")
-    @patch.object(ChainMetadataQueries, "get_table_size_pretty")
-    @patch.object(ChainMetadataQueries, "get_sync_progress_percent")
-    @patch.object(ChainMetadataQueries, "get_sync_behind_duration")
-    def test_get_chain_info_success(
-        self,
-        mock_sync_behind,
-        mock_sync_progress,
-        mock_table_size,
-        mock_db_size,
-        mock_latest_slot,
-        mock_supply,
-        mock_metadata,
-    ):
-        """Test successful comprehensive chain info retrieval."""
-        # Mock all the individual query results
-        mock_meta = Mock(spec=ChainMeta)
-        mock_meta.network_name = "mainnet"
-        mock_meta.start_time = "2017-09-23 21:44:51"
+    @staticmethod
+    def _session(**row):
+        """Create a session whose combined chain info query returns ``row``."""
+        mock_session = Mock(spec=Session)
+        mock_session.execute.return_value.one.return_value = SimpleNamespace(**row)
+        return mock_session
 
-        mock_metadata.return_value = mock_meta
+    @patch.object(chain_metadata, "_get_current_supply")
+    def test_get_chain_info_success(self, mock_supply):
+        """Test successful comprehensive chain info retrieval."""
         mock_supply.return_value = 45000000000000000
-        mock_latest_slot.return_value = 12345678
-        mock_db_size.return_value = "116 GB"
-        mock_table_size.return_value = "2760 MB"
-        mock_sync_progress.return_value = 99.8
-        mock_sync_behind.return_value = "4 days 20:59:39"
-
-        # Mock session
-        mock_session = Mock(spec=Session)
+        mock_session = self._session(
+            network="mainnet",
+            start_time="2017-09-23 21:44:51",
+            latest_slot=12345678,
+            database_size="116 GB",
+            block_table_size="2760 MB",
+            sync_progress_percent=99.8,
+            sync_behind="4 days 20:59:39",
+        )
 
         # Test the function
         result = get_chain_info(mock_session)
 
-        # Verify all methods were called
-        mock_metadata.assert_called_once_with(mock_session)
+        # Metadata, slot, sizes and sync figures share one statement
+        mock_session.execute.assert_called_once()
         mock_supply.assert_called_once_with(mock_session)
-        mock_latest_slot.assert_called_once_with(mock_session)
-        mock_db_size.assert_called_once_with(mock_session)
-        mock_table_size.assert_called_once_with(mock_session, "block")
-        mock_sync_progress.assert_called_once_with(mock_session)
-        mock_sync_behind.assert_called_once_with(mock_session)
 
         # Verify result structure
         expected_keys = {
@@ -321,35 +335,19 @@ class TestGetChainInfo:
         assert result["sync_progress_percent"] == 99.8
         assert result["sync_behind"] == "4 days 20:59:39"
 
-    @patch.object(ChainMetadataQueries, "get_chain_metadata")
-    @patch.object(ChainMetadataQueries, "get_current_supply")
-    @patch.object(ChainMetadataQueries, "get_latest_slot_number")
-    @patch.object(ChainMetadataQueries, "get_database_size_pretty")
-    @patch.object(ChainMetadataQueries, "get_table_size_pretty")
-    @patch.object(ChainMetadataQueries, "get_sync_progress_percent")
-    @patch.object(ChainMetadataQueries, "get_sync_behind_duration")
-    def test_get_chain_info_no_metadata(
-        self,
-        mock_sync_behind,
-        mock_sync_progress,
-        mock_table_size,
-        mock_db_size,
-        mock_latest_slot,
-        mock_supply,
-        mock_metadata,
-    ):
+    @patch.object(chain_metadata, "_get_current_supply")
+    def test_get_chain_info_no_metadata(self, mock_supply):
         """Test chain info retrieval when no metadata is available."""
-        # Mock all the individual query results (no metadata)
-        mock_metadata.return_value = None
         mock_supply.return_value = 0
-        mock_latest_slot.return_value = None
-        mock_db_size.return_value = "Unknown"
-        mock_table_size.return_value = "Unknown"
-        mock_sync_progress.return_value = 0.0
-        mock_sync_behind.return_value = None
-
-        # Mock session
-        mock_session = Mock(spec=Session)
+        mock_session = self._session(
+            network=None,
+            start_time=None,
+            latest_slot=None,
+            database_size=None,
+            block_table_size=None,
+            sync_progress_percent=None,
+            sync_behind=None,
+        )
 
         # Test the function
         result = get_chain_info(mock_session)
@@ -364,34 +362,137 @@ class TestGetChainInfo:
         assert result["sync_progress_percent"] == 0.0
         assert result["sync_behind"] is None
 
+    @patch.object(chain_metadata, "_get_current_supply")
+    def test_get_chain_info_without_supply(self, mock_supply):
+        """Test that the supply query is skipped when not requested."""
+        mock_session = self._session(
+            network="mainnet",
+            start_time=None,
+            latest_slot=12345678,
+            database_size="116 GB",
+            block_table_size="2760 MB",
+            sync_progress_percent=99.8,
+            sync_behind=None,
+        )
+
+        result = get_chain_info(mock_session, include_supply=False)
+
+        mock_supply.assert_not_called()
+        assert result["supply_lovelace"] is None
+        assert result["supply_ada"] is None
+        assert result["latest_slot"] == 12345678
 
-class TestAsyncNotImplemented:
-    """Test that async versions raise NotImplementedError."""
-
-    def test_async_methods_not_implemented(self):
-        """Test that all async versions raise NotImplementedError."""
-        from sqlalchemy.ext.asyncio import AsyncSession
-
-        mock_async_session = Mock(spec=AsyncSession)
-
-        # Test all methods raise NotImplementedError for async sessions
-        with pytest.raises(NotImplementedError):
-            ChainMetadataQueries.get_chain_metadata(mock_async_session)
+    def test_chain_info_statement(self):
+        """Test that the combined statement selects every chain info column."""
+        stmt = _CHAIN_INFO_STMT
 
-        with pytest.raises(NotImplementedError):
-            ChainMetadataQueries.get_current_supply(mock_async_session)
+        assert list(stmt.selected_columns.keys()) == [
+            "network",
+            "start_time",
+            "latest_slot",
+            "database_size",
+            "block_table_size",
+            "sync_progress_percent",
+            "sync_behind",
+        ]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "pg_total_relation_size" in sql
+        assert "tx_out" not in sql
 
-        with pytest.raises(NotImplementedError):
-            ChainMetadataQueries.get_latest_slot_number(mock_async_session)
 
-        with pytest.raises(NotImplementedError):
-            ChainMetadataQueries.get_database_size_pretty(mock_async_session)
+class TestAsyncDispatch:
+    """Test that get_chain_info hands async sessions to the async version."""
 
-        with pytest.raises(NotImplementedError):
-            ChainMetadataQueries.get_table_size_pretty(mock_async_session, "block")
+    async def test_get_chain_info_returns_awaitable(self):
+        """Test that an async session yields a coroutine of the async result."""
+        from sqlalchemy.ext.asyncio import AsyncSession
 
-        with pytest.raises(NotImplementedError):
-            ChainMetadataQueries.get_sync_progress_percent(mock_async_session)
+        mock_async_session = Mock(spec=AsyncSession)
+        info = {"network": "mainnet"}
+
+        with patch.object(
+            chain_metadata, "get_chain_info_async", AsyncMock(return_value=info)
+        ) as info_async:
+            assert (
+                await get_chain_info(mock_async_session, include_supply=False) is info
+            )
+
+        info_async.assert_called_once_with(mock_async_session, include_supply=False)
+        mock_async_session.execute.assert_not_called()
+
+
+class TestAsyncChainMetadataQueries:
+    """Test cases for the async chain metadata queries."""
+
+    @staticmethod
+    def _session(result):
+        """Create an async session whose statements return ``result``."""
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = result
+        return mock_session
+
+    async def test_get_current_supply(self):
+        """Test that the async supply query converts its result."""
+        mock_session = self._session(Mock(**{"scalar.return_value": 45}))
+
+        assert await AsyncChainMetadataQueries.get_current_supply(mock_session) == 45
+        mock_session.execute.assert_awaited_once()
+
+    async def test_get_table_size_pretty_no_data(self):
+        """Test that a missing table size is reported as unknown."""
+        mock_session = self._session(Mock(**{"scalar.return_value": None}))
+
+        size = await AsyncChainMetadataQueries.get_table_size_pretty(
+            mock_session, "tx_out"
+        )
+
+        assert size == "Unknown"
+        assert mock_session.execute.await_args.args[1] == {"table_name": "tx_out"}
+
+    async def test_get_chain_info_async(self):
+        """Test that the supply runs on its own session alongside the rest."""
+        row = SimpleNamespace(
+            network="mainnet",
+            start_time=None,
+            latest_slot=12345678,
+            database_size="116 GB",
+            block_table_size="2760 MB",
+            sync_progress_percent=99.8,
+            sync_behind=None,
+        )
+        mock_session = self._session(Mock(**{"one.return_value": row}))
+        supply = AsyncMock(return_value=45000000000000000)
+
+        with (
+            patch.object(chain_metadata, "AsyncSession") as session_cls,
+            patch.object(chain_metadata, "_get_current_supply_async", supply),
+        ):
+            result = await get_chain_info_async(mock_session)
+
+        session_cls.assert_called_once_with(mock_session.bind)
+        supply.assert_awaited_once_with(
+            session_cls.return_value.__aenter__.return_value
+        )
+        assert result["network"] == "mainnet"
+        assert result["supply_ada"] == 45000000000.0
+        assert result["latest_slot"] == 12345678
 
-        with pytest.raises(NotImplementedError):
-            ChainMetadataQueries.get_sync_behind_duration(mock_async_session)
+    async def test_get_chain_info_async_without_supply(self):
+        """Test that no second session is opened when supply is skipped."""
+        row = SimpleNamespace(
+            network=None,
+            start_time=None,
+            latest_slot=None,
+            database_size=None,
+            block_table_size=None,
+            sync_progress_percent=None,
+            sync_behind=None,
+        )
+        mock_session = self._session(Mock(**{"one.return_value": row}))
+
+        with patch.object(chain_metadata, "AsyncSession") as session_cls:
+            result = await get_chain_info_async(mock_session, include_supply=False)
+
+        session_cls.assert_not_called()
+        assert result["supply_lovelace"] is None
+        assert result["network"] == "Unknown"
@@ -0,0 +1,97 @@
+"""Tests for the query command result cache."""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from dbsync.cli import _cache
+from dbsync.cli._cache import cache_dir, cached
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+class TestCached:
+    """Test caching analysis results on disk."""
+
+    def test_hit_returns_stored_result(self):
+        """Test that a second call with the same key skips the computation."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"total": Decimal("1.5"), "at": datetime(2024, 1, 1)}
+
+        first = cached("governance", {"days": 30}, ("db", 100), compute)
+        second = cached("governance", {"days": 30}, ("db", 100), compute)
+
+        assert first == second == {"total": Decimal("1.5"), "at": datetime(2024, 1, 1)}
+        assert len(calls) == 1
+
+    def test_entries_are_json(self):
+        """Test that entries are plain JSON that rebuild the original types."""
+        result = {
+            "total": Decimal("1.5"),
+            "at": datetime(2024, 1, 1),
+            "on": date(2024, 1, 2),
+        }
+        cached("governance", {}, None, lambda: result)
+        (entry,) = cache_dir().iterdir()
+
+        assert entry.suffix == ".json"
+        assert json.loads(entry.read_text())["total"] == {"$decimal": "1.5"}
+        assert cached("governance", {}, None, lambda: None) == result
+
+    def test_unencodable_result_is_not_cached(self):
+        """Test that a result JSON cannot hold is returned without caching."""
+        result = {"value": object()}
+
+        assert cached("governance", {}, None, lambda: result) is result
+        assert not cache_dir().exists() or list(cache_dir().iterdir()) == []
+
+    def test_new_tip_or_arguments_miss(self):
+        """Test that a new block or different arguments recompute the result."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        cached("multi-asset", {"days": 30}, ("db", 100), compute)
+        cached("multi-asset", {"days": 30}, ("db", 101), compute)
+        cached("multi-asset", {"days": 7}, ("db", 101), compute)
+
+        assert len(calls) == 3
+
+    def test_corrupt_entry_is_recomputed(self):
+        """Test that an unreadable entry is replaced."""
+        cached("governance", {}, None, lambda: 1)
+        (entry,) = cache_dir().iterdir()
+        entry.write_bytes(b"not json")
+
+        assert cached("governance", {}, None, lambda: 2) == 2
+        assert cached("governance", {}, None, lambda: 3) == 2
+
+    def test_cache_dir_uses_xdg_cache_home(self, cache_home):
+        """Test that XDG_CACHE_HOME selects the cache location."""
+        assert cache_dir() == cache_home / "dbsync-py"
+
+    def test_unwritable_cache_still_returns_result(self, cache_home):
+        """Test that a cache directory that cannot be created is ignored."""
+        (cache_home / "dbsync-py").write_text("not a directory")
+
+        assert cached("governance", {}, None, lambda: 42) == 42
+
+    def test_failed_write_removes_temporary_file(self):
+        """Test that an interrupted write leaves nothing behind."""
+        with patch.object(_cache.os, "replace", side_effect=OSError("disk full")):
+            assert cached("governance", {}, None, lambda: 42) == 42
+
+        assert list(cache_dir().iterdir()) == []
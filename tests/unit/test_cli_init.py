@@ -0,0 +1,24 @@
+"""Tests for the CLI package entry point."""
+
+import importlib
+
+import click
+
+
+class TestCliEntryPoint:
+    """Test resolving ``dbsync.cli.main``."""
+
+    def test_main_is_the_click_group(self):
+        """Test that main is the group even after its module is imported."""
+        import dbsync.cli.main  # noqa: F401
+        from dbsync.cli import main
+
+        assert isinstance(main, click.Group)
+
+    def test_main_module_is_importable(self):
+        """Test that the module defining the group stays public."""
+        from dbsync.cli import main
+
+        module = importlib.import_module("dbsync.cli.main")
+
+        assert module.main is main
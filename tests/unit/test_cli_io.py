@@ -0,0 +1,111 @@
+"""Tests for the CLI output helpers."""
+
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from dbsync.cli import _io
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_io, "orjson", None)
+    return request.param
+
+
+class TestJsonOutput:
+    """Test JSON serialization for CLI reports."""
+
+    def test_write_json_matches_stdlib(self, encoder):
+        """Test that written JSON decodes to the same data as the stdlib's."""
+        data = {
+            "when": datetime(2024, 1, 2, 3, 4, 5),
+            "amount": Decimal("1.5"),
+            "counts": {1: 2},
+            "name": "Café",
+        }
+        fp = io.StringIO()
+
+        _io.write_json(fp, data, default=str)
+
+        assert fp.getvalue().endswith("}\n")
+        assert json.loads(fp.getvalue()) == json.loads(
+            json.dumps(data, indent=2, default=str)
+        )
+
+    def test_large_integers_fall_back(self, encoder):
+        """Test that integers wider than 64 bits are still encoded."""
+        fp = io.StringIO()
+
+        _io.write_json(fp, {"supply": 2**70})
+
+        assert json.loads(fp.getvalue()) == {"supply": 2**70}
+
+    def test_encoders_write_identical_output(self, monkeypatch):
+        """Test that orjson and the stdlib fallback produce the same text."""
+        pytest.importorskip("orjson")
+        data = {
+            "name": "Café ✅",
+            "ratio": float("nan"),
+            "limits": [float("inf"), -float("inf"), 0.5],
+            "at": datetime(2024, 1, 2),
+        }
+        with_orjson = io.StringIO()
+        _io.write_json(with_orjson, data, default=_io.json_default)
+        monkeypatch.setattr(_io, "orjson", None)
+        with_stdlib = io.StringIO()
+
+        _io.write_json(with_stdlib, data, default=_io.json_default)
+
+        assert with_stdlib.getvalue() == with_orjson.getvalue()
+        assert '"Café ✅"' in with_stdlib.getvalue()
+        assert json.loads(with_stdlib.getvalue())["ratio"] is None
+
+    def test_output_is_indented(self, encoder):
+        """Test that output is indented by two spaces."""
+        fp = io.StringIO()
+
+        _io.write_json(fp, {"a": 1})
+
+        assert fp.getvalue() == '{\n  "a": 1\n}\n'
+
+
+class TestJsonDefault:
+    """Test the fallback encoder for query results."""
+
+    def test_dates_use_iso_format(self):
+        """Test that dates and times are written in ISO 8601 form."""
+        assert _io.json_default(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02T03:04:05"
+        assert _io.json_default(datetime(2024, 1, 2).date()) == "2024-01-02"
+
+    def test_other_values_use_str(self):
+        """Test that other values fall back to str."""
+        assert _io.json_default(Decimal("1.50")) == "1.50"
+
+    def test_write_json_with_json_default(self, encoder):
+        """Test that both encoders render datetimes the same way."""
+        fp = io.StringIO()
+
+        _io.write_json(fp, {"at": datetime(2024, 1, 2)}, default=_io.json_default)
+
+        assert json.loads(fp.getvalue()) == {"at": "2024-01-02T00:00:00"}
+
+
+class TestOpenOutput:
+    """Test opening report files."""
+
+    def test_writes_utf8_without_newline_translation(self, tmp_path):
+        """Test that emoji and line endings are written unchanged."""
+        path = tmp_path / "report.txt"
+
+        with _io.open_output(str(path)) as fp:
+            fp.write("✅ ok\n")
+
+        assert path.read_bytes() == "✅ ok\n".encode()
@@ -0,0 +1,47 @@
+"""Tests for the query command helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dbsync.cli import query
+
+
+@pytest.fixture
+def chain_queries():
+    """Patch ChainMetadataQueries with canned results."""
+    with patch(
+        "dbsync.examples.queries.chain_metadata.ChainMetadataQueries"
+    ) as queries:
+        queries.get_chain_metadata.return_value = None
+        queries.get_current_supply.return_value = 5_000_000
+        queries.get_latest_slot_number.return_value = 42
+        queries.get_sizes_pretty.return_value = ("116 GB", "2760 MB")
+        yield queries
+
+
+class TestIndividualResults:
+    """Test running the individual chain metadata queries."""
+
+    @pytest.mark.parametrize("sequential", [False, True])
+    def test_collects_every_query(self, chain_queries, sequential):
+        """Test that both execution modes gather the same results."""
+        results = query._get_individual_results(MagicMock(), False, sequential)
+
+        assert results["total_queries"] == 6
+        assert results["queries"]["current_supply"] == {
+            "lovelace": 5_000_000,
+            "ada": 5.0,
+        }
+        assert results["queries"]["latest_slot"] == 42
+        assert results["queries"]["database_size"] == "116 GB"
+        assert results["queries"]["block_table_size"] == "2760 MB"
+        assert results["queries"]["chain_metadata"]["network"] == "Unknown"
+
+    def test_sequential_uses_given_session(self, chain_queries):
+        """Test that sequential mode runs every query on the caller's session."""
+        session = MagicMock()
+
+        query._get_individual_results(session, False, sequential=True)
+
+        chain_queries.get_sizes_pretty.assert_called_once_with(session, "block")
@@ -0,0 +1,176 @@
+"""Tests for the query command text formatters.
+
+These tests render sample analysis results without requiring a database.
+"""
+
+import pytest
+
+from dbsync.cli.query_text import (
+    format_chain_metadata_output,
+    format_governance_output,
+    format_multi_asset_output,
+    format_pool_management_output,
+)
+
+
+@pytest.fixture
+def pool_results():
+    """Provide a found pool analysis without a delegation summary."""
+    return {
+        "found": True,
+        "pool_id": "pool1abc",
+        "analysis_epochs": 5,
+        "summary": {
+            "status": "active",
+            "total_blocks": 42,
+            "total_delegators": 1000,
+            "total_stake_ada": 1_000_000.0,
+            "total_rewards_ada": 5000.5,
+        },
+        "registration_info": {
+            "pledge_ada": 100_000,
+            "margin_percent": 1.5,
+            "fixed_cost_ada": 340,
+            "metadata": {"ticker": "ABC", "name": "Abc Pool"},
+        },
+        "block_production": {"epochs_analyzed": 5, "epoch_range": "400-405"},
+        "rewards_analysis": {"epochs_analyzed": 4},
+        "operational_status": {
+            "current_epoch": 405,
+            "pool_hash": "abcdef0123456789abcdef",
+        },
+    }
+
+
+class TestChainMetadataOutput:
+    """Test the chain metadata text report."""
+
+    def test_individual_results(self):
+        """Test the numbered sections for individual query results."""
+        output = format_chain_metadata_output(
+            {
+                "type": "individual_results",
+                "total_queries": 7,
+                "queries": {
+                    "chain_metadata": {"network": "mainnet", "start_time": None},
+                    "current_supply": {"lovelace": 5_000_000, "ada": 5.0},
+                    "latest_slot": None,
+                    "database_size": "1 GB",
+                    "block_table_size": "2 GB",
+                    "sync_progress_percent": 99.5,
+                    "sync_behind": None,
+                },
+            }
+        )
+
+        assert "1. Chain Metadata:\n   Network: mainnet\n\n2." in output
+        assert "Total: 5,000,000 Lovelace" in output
+        assert "Latest slot: Unknown" in output
+        assert "Behind by: Unknown" in output
+        assert "Total queries executed: 7" in output
+
+    def test_summary_results(self):
+        """Test the single block for summary results."""
+        output = format_chain_metadata_output(
+            {
+                "type": "summary_results",
+                "chain_info": {
+                    "network": "preprod",
+                    "start_time": "2022-06-01",
+                    "supply_ada": 1234.5,
+                    "supply_lovelace": 1_234_500_000,
+                    "latest_slot": 99,
+                    "database_size": "1 GB",
+                    "block_table_size": "2 GB",
+                    "sync_progress_percent": 50.0,
+                    "sync_behind": None,
+                },
+            }
+        )
+
+        assert "Network: preprod\nStart time: 2022-06-01\n" in output
+        assert "Supply: 1,234.50 ADA (1,234,500,000 Lovelace)" in output
+        assert "Sync status: Up to date" in output
+        assert output.endswith("Source: dbsync.examples.queries.chain_metadata")
+
+
+class TestPoolManagementOutput:
+    """Test the pool management text report."""
+
+    def test_formats_without_delegation_summary(self, pool_results):
+        """Test that a missing delegation summary does not abort the report."""
+        output = format_pool_management_output(pool_results)
+
+        assert "Ticker: ABC" in output
+        assert "Average per epoch: 8.40" in output
+        assert "Pool hash: abcdef0123456789..." in output
+        assert output.endswith("Source: dbsync.examples.queries.pool_management")
+
+    def test_pool_not_found(self):
+        """Test the report for an unknown pool."""
+        output = format_pool_management_output({"found": False, "pool_id": "pool1zzz"})
+
+        assert "❌ Pool pool1zzz not found" in output
+        assert output.endswith("Error: Unknown error")
+
+
+class TestMultiAssetOutput:
+    """Test the multi-asset text report."""
+
+    def test_limits_and_unnamed_assets(self):
+        """Test that lists are truncated and unnamed assets labelled."""
+        output = format_multi_asset_output(
+            {
+                "found": True,
+                "analysis_period_days": 30,
+                "summary": {"total_assets": 1234},
+                "portfolio_analysis": {
+                    "found": True,
+                    "portfolio": [
+                        {"asset_name": None, "total_quantity": i, "holder_count": i}
+                        for i in range(8)
+                    ],
+                },
+            }
+        )
+
+        assert "   Total assets: 1,234\n   Total policies: 0\n" in output
+        assert "   5. Unnamed - 4 tokens, 4 holders\n" in output
+        assert "   6. " not in output
+        assert output.endswith("=\n✅ Analysis completed")
+
+
+class TestGovernanceOutput:
+    """Test the governance text report."""
+
+    def test_sections_present_only_when_found(self):
+        """Test that sections without data are left out."""
+        output = format_governance_output(
+            {
+                "found": True,
+                "analysis_parameters": {"analysis_period_days": 7},
+                "proposal_analysis": {
+                    "found": True,
+                    "proposals": [
+                        {
+                            "index": 0,
+                            "action_type": "InfoAction",
+                            "status": "active",
+                            "deposit_lovelace": 100_000_000_000,
+                        }
+                    ],
+                },
+                "treasury_analysis": {"found": False},
+            }
+        )
+
+        assert (
+            "   1. #0 (InfoAction) - active\n      Deposit: 100,000,000,000 lovelace\n"
+        ) in output
+        assert "Treasury Activity" not in output
+
+    def test_analysis_failed(self):
+        """Test the report for a failed analysis."""
+        output = format_governance_output({"found": False, "error": "boom"})
+
+        assert output.endswith("❌ Analysis failed\nError: boom")
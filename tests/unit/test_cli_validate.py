@@ -0,0 +1,166 @@
+"""Tests for the validate command helpers."""
+
+import io
+import json
+import os
+import sys
+import time
+from unittest.mock import Mock, patch
+
+import click
+import pytest
+
+from dbsync.cli import validate
+from dbsync.cli._cache import cache_dir
+
+URL = "https://example.com/schema.md"
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+
+@pytest.fixture
+def cached_schema():
+    """Store a schema document in the cache."""
+    path = cache_dir() / "official_schema.md"
+    path.parent.mkdir(parents=True)
+    path.write_text("### `block`\n", encoding="utf-8")
+    return path
+
+
+class TestOfficialSchemaCache:
+    """Test reuse of the downloaded official schema."""
+
+    @patch.object(validate, "_http_session")
+    def test_download_is_cached(self, mock_session):
+        """Test that a downloaded schema is stored for the next run."""
+        mock_session.return_value.get.return_value = Mock(text="### `tx`\n")
+
+        assert validate._official_schema_markdown(URL, True) == "### `tx`\n"
+        assert (cache_dir() / "official_schema.md").read_text() == "### `tx`\n"
+        mock_session.return_value.get.assert_called_once_with(URL, timeout=30)
+
+    @patch.object(validate, "_http_session")
+    def test_fresh_cache_skips_download(self, mock_session, cached_schema):
+        """Test that a fresh cached copy is used without a request."""
+        assert validate._official_schema_markdown(URL, True) == "### `block`\n"
+        mock_session.return_value.get.assert_not_called()
+
+    @patch.object(validate, "_http_session")
+    def test_stale_cache_is_refreshed(self, mock_session, cached_schema):
+        """Test that an expired cached copy is downloaded again."""
+        mock_session.return_value.get.return_value = Mock(text="### `tx`\n")
+        expired = time.time() - validate._SCHEMA_CACHE_TTL - 1
+        os.utime(cached_schema, (expired, expired))
+
+        assert validate._official_schema_markdown(URL, True) == "### `tx`\n"
+
+    @patch.object(validate, "_http_session")
+    def test_no_cache_forces_download(self, mock_session, cached_schema):
+        """Test that disabling the cache always downloads."""
+        mock_session.return_value.get.return_value = Mock(text="### `tx`\n")
+
+        assert validate._official_schema_markdown(URL, False) == "### `tx`\n"
+        mock_session.return_value.get.assert_called_once()
+
+
+class TestLoadSchemaValidator:
+    """Test loading the validator from the tests directory."""
+
+    def test_loads_without_touching_sys_path(self):
+        """Test that the module is loaded by file path."""
+        path = list(sys.path)
+
+        module = validate._load_schema_validator()
+
+        assert sys.path == path
+        assert module.SchemaValidator.OFFICIAL_SCHEMA_URL.startswith("https://")
+
+    def test_missing_validator(self, monkeypatch, tmp_path):
+        """Test the error when the source tree is not available."""
+        monkeypatch.setattr(validate, "_SCHEMA_VALIDATOR_PATH", tmp_path / "x.py")
+        monkeypatch.delitem(sys.modules, "schema_validation.schema_validator", False)
+        validate._load_schema_validator.cache_clear()
+
+        try:
+            with pytest.raises(click.ClickException, match="source checkout"):
+                validate._load_schema_validator()
+        finally:
+            validate._load_schema_validator.cache_clear()
+
+
+class TestHttpSession:
+    """Test the shared HTTP session."""
+
+    def test_session_is_reused(self):
+        """Test that every download in the process shares one session."""
+        validate._http_session.cache_clear()
+        try:
+            assert validate._http_session() is validate._http_session()
+        finally:
+            validate._http_session.cache_clear()
+
+
+class TestReports:
+    """Test the validation report generators."""
+
+    @pytest.fixture
+    def results(self):
+        """Provide a mix of valid and invalid results out of name order."""
+        result_cls = validate._load_schema_validator().ValidationResult
+        return {
+            "tx": result_cls("tx"),
+            "block": result_cls("block", is_valid=False, missing_fields=["hash"]),
+            "epoch": result_cls("epoch"),
+            "address": result_cls("address", is_valid=False, errors=["boom"]),
+        }
+
+    def test_text_report_sorts_tables(self, results):
+        """Test that valid and invalid tables are listed by name."""
+        output = validate._generate_text_output(results, False, False, False)
+
+        assert "Valid Tables: 2\nInvalid Tables: 2\nCoverage: 50.0%" in output
+        assert "✅ epoch\n✅ tx\n" in output
+        assert output.index("❌ address") < output.index("❌ block")
+        assert "   Missing fields: hash" in output
+
+    def test_json_errors_keep_result_order(self, results):
+        """Test that the errors-only JSON report lists invalid tables only."""
+        output = validate._generate_json_output(results, False, True)
+
+        assert output["summary"]["valid_tables"] == 2
+        assert list(output["validation_errors"]) == ["block", "address"]
+
+    def test_coverage_only(self, results):
+        """Test that coverage-only reports hold just the statistics."""
+        text = validate._generate_text_output(results, True, False, False)
+        data = validate._generate_json_output(results, True, False)
+
+        assert text.startswith("COVERAGE STATISTICS\n")
+        assert text.endswith("Coverage: 50.0%\n")
+        assert data == {
+            "summary": {
+                "total_tables": 4,
+                "valid_tables": 2,
+                "invalid_tables": 2,
+                "coverage_percentage": 50.0,
+            }
+        }
+
+    @pytest.mark.parametrize(
+        ("errors_only", "tables"),
+        [(True, ["block", "address"]), (False, ["tx", "block", "epoch", "address"])],
+    )
+    def test_ndjson_one_table_per_line(self, results, errors_only, tables):
+        """Test that NDJSON output is a summary line then one line per table."""
+        fp = io.StringIO()
+
+        validate._write_ndjson(fp, results, False, errors_only)
+
+        records = [json.loads(line) for line in fp.getvalue().splitlines()]
+        assert records[0]["summary"]["invalid_tables"] == 2
+        assert [record["table"] for record in records[1:]] == tables
+        assert records[1]["missing_fields"] == (["hash"] if errors_only else [])
@@ -0,0 +1,275 @@
+"""Tests for database configuration helpers.
+
+These tests exercise configuration loading without requiring a database.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from dbsync.config import (
+    DatabaseConfig,
+    _ensure_env_loaded,
+    get_async_database_url,
+    get_config,
+    get_database_url,
+    get_default_async_mode,
+    get_version,
+    reset_default_config,
+    validate_database_url,
+)
+
+
+@pytest.fixture
+def clean_config(monkeypatch):
+    """Provide a pristine environment and an empty config cache."""
+    for key in (
+        "DBSYNC_DATABASE_URL",
+        "DBSYNC_HOST",
+        "DBSYNC_PORT",
+        "DBSYNC_DB_NAME",
+        "DBSYNC_USER",
+        "DBSYNC_PASS",
+    ):
+        monkeypatch.delenv(key, raising=False)
+    # Keep a developer's local .env file from leaking into the environment
+    monkeypatch.setattr("dbsync.config._env_loaded", True)
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
+class TestGetConfig:
+    """Test the cached default configuration accessor."""
+
+    def test_returns_database_config(self, clean_config):
+        """Test that the default configuration is a DatabaseConfig."""
+        assert isinstance(get_config(), DatabaseConfig)
+
+    def test_is_cached(self, clean_config):
+        """Test that repeated calls reuse the same instance."""
+        assert get_config() is get_config()
+
+    def test_cache_clear_picks_up_environment(self, clean_config, monkeypatch):
+        """Test that clearing the cache re-reads the environment."""
+        monkeypatch.setenv("DBSYNC_HOST", "first.example")
+        assert get_config().host == "first.example"
+
+        monkeypatch.setenv("DBSYNC_HOST", "second.example")
+        assert get_config().host == "first.example"
+
+        get_config.cache_clear()
+        assert get_config().host == "second.example"
+
+    def test_database_urls_use_default_config(self, clean_config, monkeypatch):
+        """Test that URL helpers fall back to the cached configuration."""
+        monkeypatch.setenv("DBSYNC_HOST", "db.example")
+        monkeypatch.setenv("DBSYNC_DB_NAME", "mainnet")
+
+        assert get_database_url() == "postgresql+psycopg://db.example/mainnet"
+        assert get_async_database_url() == "postgresql+asyncpg://db.example/mainnet"
+
+    def test_database_urls_are_cached(self, clean_config, monkeypatch):
+        """Test that repeated calls reuse the rendered URL until a reset."""
+        monkeypatch.setenv("DBSYNC_HOST", "first.example")
+        url = get_database_url()
+
+        monkeypatch.setenv("DBSYNC_HOST", "second.example")
+        assert get_database_url() is url
+        assert get_async_database_url() is get_async_database_url()
+
+        reset_default_config()
+        assert get_database_url() == "postgresql+psycopg://second.example/cexplorer"
+
+    def test_reset_default_config(self, clean_config, monkeypatch):
+        """Test that resetting the default configuration re-reads the environment."""
+        monkeypatch.setenv("DBSYNC_HOST", "first.example")
+        first = get_config()
+
+        monkeypatch.setenv("DBSYNC_HOST", "second.example")
+        reset_default_config()
+
+        assert get_config() is not first
+        assert get_config().host == "second.example"
+
+
+class TestDatabaseConfig:
+    """Test building URLs from a configuration."""
+
+    def test_reads_environment(self, clean_config, monkeypatch):
+        """Test that unset parameters come from the environment."""
+        monkeypatch.setenv("DBSYNC_PORT", "6543")
+        monkeypatch.setenv("DBSYNC_USER", "reader")
+
+        config = DatabaseConfig(host="h")
+
+        assert (config.host, config.port, config.database) == ("h", 6543, "cexplorer")
+        assert (config.username, config.password) == ("reader", None)
+
+    def test_to_url(self, clean_config):
+        """Test that credentials and a non-default port are included."""
+        config = DatabaseConfig(
+            host="h", port=5433, database="db", username="u", password="p"
+        )
+
+        assert config.to_url() == "postgresql+psycopg://u:p@h:5433/db"
+        assert config.to_url(async_driver=True) == "postgresql+asyncpg://u:p@h:5433/db"
+
+    def test_to_url_is_cached(self, clean_config):
+        """Test that each driver's URL is rendered once per instance."""
+        config = DatabaseConfig(host="h", database="db")
+
+        assert config.to_url() is config.to_url()
+        assert config.to_url(async_driver=True) is config.to_url(async_driver=True)
+
+
+class TestGetVersion:
+    """Test the package version lookup."""
+
+    def test_is_cached(self):
+        """Test that package metadata is read only once."""
+        get_version.cache_clear()
+        try:
+            with patch("importlib.metadata.version", return_value="9.9.9") as version:
+                assert get_version() == "9.9.9"
+                assert get_version() == "9.9.9"
+            version.assert_called_once_with("dbsync-py")
+        finally:
+            get_version.cache_clear()
+
+    def test_fallback_without_metadata(self):
+        """Test the fallback version when the package is not installed."""
+        from importlib.metadata import PackageNotFoundError
+
+        get_version.cache_clear()
+        try:
+            with patch("importlib.metadata.version", side_effect=PackageNotFoundError):
+                assert get_version() == "0.1.0"
+        finally:
+            get_version.cache_clear()
+
+
+class TestAsyncDatabaseUrl:
+    """Test conversion of explicit URLs to the async driver."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("postgresql://u:p@h/db", "postgresql+asyncpg://u:p@h/db"),
+            ("postgresql+psycopg://h:5433/db", "postgresql+asyncpg://h:5433/db"),
+            (
+                "postgres://h/db?sslmode=require",
+                "postgresql+asyncpg://h/db?sslmode=require",
+            ),
+            ("postgres+psycopg://h/db", "postgresql+asyncpg://h/db"),
+            ("postgresql+asyncpg://h/db", "postgresql+asyncpg://h/db"),
+            ("postgres+asyncpg://h/db", "postgres+asyncpg://h/db"),
+            ("POSTGRESQL://h/db", "postgresql+asyncpg://h/db"),
+        ],
+    )
+    def test_scheme_is_rewritten(self, url, expected):
+        """Test that every accepted scheme maps to its asyncpg equivalent."""
+        assert get_async_database_url(url) == expected
+
+    def test_environment_url_is_rewritten(self, clean_config, monkeypatch):
+        """Test that DBSYNC_DATABASE_URL is converted like an explicit URL."""
+        monkeypatch.setenv("DBSYNC_DATABASE_URL", "postgres://u@h:5433/db")
+
+        assert get_async_database_url() == "postgresql+asyncpg://u@h:5433/db"
+        assert get_database_url() == "postgres://u@h:5433/db"
+
+
+class TestValidateDatabaseUrl:
+    """Test database URL validation."""
+
+    def test_valid_url_is_cached(self):
+        """Test that repeated validation of one URL is served from the cache."""
+        validate_database_url.cache_clear()
+        url = "postgresql://h/db"
+
+        assert validate_database_url(url) == url
+        assert validate_database_url(url) == url
+        assert validate_database_url.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        "url", ["", "mysql://h/db", "postgresql:///db", "postgresql://h/"]
+    )
+    def test_invalid_url_raises_every_time(self, url):
+        """Test that invalid URLs are rejected on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                validate_database_url(url)
+
+
+class TestEnsureEnvLoaded:
+    """Test loading the .env file."""
+
+    @pytest.fixture
+    def unloaded(self, clean_config, monkeypatch, tmp_path):
+        """Start from an unloaded state in a directory holding a .env file."""
+        monkeypatch.setattr("dbsync.config._env_loaded", False)
+        monkeypatch.delenv("DBSYNC_SKIP_DOTENV", raising=False)
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".env").write_text("DBSYNC_DB_NAME=from_dotenv\n")
+        # Register the variable with monkeypatch so a loaded value is undone
+        monkeypatch.setenv("DBSYNC_DB_NAME", "unset")
+        monkeypatch.delenv("DBSYNC_DB_NAME")
+
+    def test_loads_dotenv_from_cwd(self, unloaded):
+        """Test that the .env file in the working directory is loaded."""
+        _ensure_env_loaded()
+
+        assert os.environ["DBSYNC_DB_NAME"] == "from_dotenv"
+
+    def test_skipped_when_requested(self, unloaded, monkeypatch):
+        """Test that DBSYNC_SKIP_DOTENV=1 ignores the .env file."""
+        monkeypatch.setenv("DBSYNC_SKIP_DOTENV", "1")
+
+        with patch("dotenv.load_dotenv") as load_dotenv:
+            _ensure_env_loaded()
+
+        load_dotenv.assert_not_called()
+        assert "DBSYNC_DB_NAME" not in os.environ
+
+    def test_fills_in_around_exported_host(self, unloaded, monkeypatch, tmp_path):
+        """Test that an exported host still picks up credentials from .env."""
+        (tmp_path / ".env").write_text("DBSYNC_HOST=dotenv_host\nDBSYNC_USER=alice\n")
+        monkeypatch.setenv("DBSYNC_HOST", "exported_host")
+        monkeypatch.setenv("DBSYNC_USER", "unset")
+        monkeypatch.delenv("DBSYNC_USER")
+
+        config = DatabaseConfig()
+
+        assert config.host == "exported_host"
+        assert config.username == "alice"
+
+    def test_fills_in_around_exported_url(self, unloaded, monkeypatch, tmp_path):
+        """Test that an exported URL still picks up other settings from .env."""
+        (tmp_path / ".env").write_text("DBSYNC_DEFAULT_ASYNC_MODE=true\n")
+        monkeypatch.setenv("DBSYNC_DATABASE_URL", "postgresql://h/db")
+        monkeypatch.setenv("DBSYNC_DEFAULT_ASYNC_MODE", "unset")
+        monkeypatch.delenv("DBSYNC_DEFAULT_ASYNC_MODE")
+        monkeypatch.setattr("dbsync.config._default_async_mode", None)
+
+        assert get_default_async_mode() is True
+
+    def test_loaded_once_across_threads(self, unloaded):
+        """Test that concurrent first calls load the file only once."""
+        with (
+            patch("dotenv.load_dotenv") as load_dotenv,
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            for _ in range(8):
+                executor.submit(_ensure_env_loaded)
+
+        load_dotenv.assert_called_once()
+
+    def test_dotenv_not_imported_when_skipped(self, unloaded, monkeypatch):
+        """Test that dotenv is only imported when a .env file may be loaded."""
+        monkeypatch.setenv("DBSYNC_SKIP_DOTENV", "1")
+        monkeypatch.setitem(sys.modules, "dotenv", None)
+
+        _ensure_env_loaded()
@@ -9,6 +9,7 @@ import tempfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
+from xml.etree import ElementTree
 
 from tests.coverage.analyzer import (
     CoverageAnalyzer,
@@ -663,6 +664,36 @@ class TestCICoverageRunner:
             assert "MaximumCriticalGaps" in xml_content
             assert "failure" in xml_content  # Should have failure element
 
+    def test_export_junit_xml_escapes_messages(self):
+        """Test JUnit XML export produces well-formed XML for special characters."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            runner = CICoverageRunner(output_dir=Path(temp_dir))
+
+            results = {
+                "quality_gates": {
+                    "results": [
+                        {
+                            "name": "MinimumLineCoverage",
+                            "status": "FAIL",
+                            "message": 'Coverage 70.0% < 80.0% & "strict"',
+                        },
+                    ]
+                }
+            }
+
+            xml_file = Path(temp_dir) / "junit.xml"
+            runner.export_junit_xml(results, xml_file)
+
+            suite = ElementTree.parse(xml_file).getroot()  # noqa: S314
+            assert suite.tag == "testsuite"
+            assert suite.get("tests") == "1"
+            assert suite.get("failures") == "1"
+
+            failure = suite.find("testcase/failure")
+            assert failure is not None
+            assert failure.get("message") == 'Coverage 70.0% < 80.0% & "strict"'
+            assert failure.text == 'Coverage 70.0% < 80.0% & "strict"'
+
 
 class TestCoverageIntegration:
     """Integration tests for coverage analysis system."""
@@ -1,15 +1,29 @@
 """Unit tests for governance queries module."""
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from src.dbsync.examples.queries import governance
 from src.dbsync.examples.queries.governance import (
     GovernanceQueries,
     get_comprehensive_governance_analysis,
 )
 
 
+def _analysis_result(proposals, stats, types=None):
+    """Build the single result of the proposal analysis statement.
+
+    Every row carries the statistics next to one proposal's columns; with no
+    proposals the outer join still returns one row whose proposal columns are
+    ``None``.
+    """
+    stats = {**stats, "type_distribution": types}
+    rows = [{**stats, **proposal} for proposal in proposals]
+    return Mock(mappings=lambda: rows or [{**stats, "id_": None}])
+
+
 class TestGovernanceQueries:
     """Test suite for GovernanceQueries class."""
 
@@ -19,46 +33,45 @@ class TestGovernanceQueries:
 
         # Mock proposal query results
         mock_proposals = [
-            Mock(
-                id_=1,
-                tx_id=100,
-                index=0,
-                action_type="TreasuryWithdrawals",
-                deposit=500000000,
-                return_address="addr1test123",
-                ratified_epoch=None,
-                enacted_epoch=None,
-                dropped_epoch=None,
-                expired_epoch=None,
-                proposal_time="2024-01-01 12:00:00",
-                proposal_epoch=450,
-                anchor_url="https://example.com/proposal.json",
-                anchor_hash=b"hash123",
-            ),
+            {
+                "id_": 1,
+                "tx_id": 100,
+                "index": 0,
+                "action_type": "TreasuryWithdrawals",
+                "deposit": 500000000,
+                "return_address": "addr1test123",
+                "ratified_epoch": None,
+                "enacted_epoch": None,
+                "dropped_epoch": None,
+                "expired_epoch": None,
+                "status": "Active",
+                "proposal_time": "2024-01-01 12:00:00",
+                "proposal_epoch": 450,
+                "anchor_url": "https://example.com/proposal.json",
+                "anchor_hash": b"hash123",
+            },
         ]
 
         # Mock statistics
-        mock_stats = Mock(
-            total_proposals=10,
-            ratified_count=3,
-            enacted_count=2,
-            dropped_count=1,
-            expired_count=0,
-            total_deposits=5000000000,
-        )
+        mock_stats = {
+            "total_proposals": 10,
+            "ratified_count": 3,
+            "enacted_count": 2,
+            "dropped_count": 1,
+            "expired_count": 0,
+            "total_deposits": 5000000000,
+        }
 
         # Mock type distribution
         mock_types = [
-            Mock(type_="TreasuryWithdrawals", count=5),
-            Mock(type_="ParameterChange", count=3),
-            Mock(type_="HardForkInitiation", count=2),
+            {"action_type": "TreasuryWithdrawals", "count": 5},
+            {"action_type": "ParameterChange", "count": 3},
+            {"action_type": "HardForkInitiation", "count": 2},
         ]
 
-        mock_session.execute.side_effect = [
-            Mock(all=lambda: mock_proposals),  # proposals query
-            Mock(first=lambda: mock_stats),  # status statistics
-            Mock(all=lambda: mock_types),  # type distribution
-        ]
+        mock_session.execute.return_value = _analysis_result(
+            mock_proposals, mock_stats, mock_types
+        )
 
         result = GovernanceQueries.get_governance_proposal_analysis(
             mock_session, None, 20
@@ -83,38 +96,35 @@ class TestGovernanceQueries:
         mock_session = Mock()
 
         mock_proposals = [
-            Mock(
-                id_=5,
-                tx_id=200,
-                index=1,
-                action_type="ParameterChange",
-                deposit=1000000000,
-                return_address="addr1test456",
-                ratified_epoch=451,
-                enacted_epoch=452,
-                dropped_epoch=None,
-                expired_epoch=None,
-                proposal_time="2024-01-15 14:30:00",
-                proposal_epoch=451,
-                anchor_url=None,
-                anchor_hash=None,
-            ),
+            {
+                "id_": 5,
+                "tx_id": 200,
+                "index": 1,
+                "action_type": "ParameterChange",
+                "deposit": 1000000000,
+                "return_address": "addr1test456",
+                "ratified_epoch": 451,
+                "enacted_epoch": 452,
+                "dropped_epoch": None,
+                "expired_epoch": None,
+                "status": "Enacted",
+                "proposal_time": "2024-01-15 14:30:00",
+                "proposal_epoch": 451,
+                "anchor_url": None,
+                "anchor_hash": None,
+            },
         ]
 
-        mock_stats = Mock(
-            total_proposals=1,
-            ratified_count=1,
-            enacted_count=1,
-            dropped_count=0,
-            expired_count=0,
-            total_deposits=1000000000,
-        )
+        mock_stats = {
+            "total_proposals": 1,
+            "ratified_count": 1,
+            "enacted_count": 1,
+            "dropped_count": 0,
+            "expired_count": 0,
+            "total_deposits": 1000000000,
+        }
 
-        mock_session.execute.side_effect = [
-            Mock(all=lambda: mock_proposals),
-            Mock(first=lambda: mock_stats),
-            Mock(all=lambda: []),
-        ]
+        mock_session.execute.return_value = _analysis_result(mock_proposals, mock_stats)
 
         result = GovernanceQueries.get_governance_proposal_analysis(mock_session, 5, 20)
 
@@ -128,7 +138,7 @@ class TestGovernanceQueries:
     def test_get_governance_proposal_analysis_not_found(self) -> None:
         """Test proposal analysis for non-existent proposal."""
         mock_session = Mock()
-        mock_session.execute.return_value.all.return_value = []
+        mock_session.execute.return_value = _analysis_result([], {})
 
         result = GovernanceQueries.get_governance_proposal_analysis(
             mock_session, 999, 20
@@ -317,11 +327,63 @@ class TestGovernanceQueries:
         assert stats["total_members"] == 7
         assert stats["active_members"] == 7  # registrations - deregistrations
 
+    def test_get_committee_operations_tracking_filters_in_sql(self) -> None:
+        """Test that a committee member filter is bound into each query."""
+        mock_session = Mock()
+        mock_session.execute.return_value.all.return_value = []
+
+        result = GovernanceQueries.get_committee_operations_tracking(
+            mock_session, "abcd", 20
+        )
+
+        assert result["found"] is False
+        assert result["error"] == "Committee member not found"
+        calls = mock_session.execute.call_args_list
+        assert [call.args[0] for call in calls] == list(
+            governance._COMMITTEE_BY_MEMBER_STMTS[:3]
+        )
+        assert all(
+            call.args[1] == {"limit": 20, "cold_key": b"\xab\xcd"} for call in calls
+        )
+
+    def test_get_committee_operations_tracking_invalid_member(self) -> None:
+        """Test that a non-hex committee member is rejected before querying."""
+        mock_session = Mock()
+
+        result = GovernanceQueries.get_committee_operations_tracking(
+            mock_session, "not-hex", 20
+        )
+
+        assert result["found"] is False
+        assert "expected hex string" in result["error"]
+        mock_session.execute.assert_not_called()
+
     def test_get_treasury_governance_analysis_success(self) -> None:
         """Test successful treasury governance analysis."""
         mock_session = Mock()
 
-        # Mock treasury withdrawals
+        # Mock withdrawal statistics
+        mock_withdrawal_stats = {
+            "total_withdrawals": 5,
+            "total_amount": 5000000000,
+            "avg_amount": 1000000000,
+            "max_amount": 2000000000,
+            "unique_recipients": 3,
+        }
+
+        # Mock treasury proposals
+        mock_proposals = [
+            {
+                "proposal_id": 100,
+                "proposal_index": 0,
+                "total_withdrawal": 1000000000,
+                "withdrawal_count": 1,
+                "proposal_time": "2024-01-01 11:00:00",
+                "proposal_epoch": 450,
+            },
+        ]
+
+        # Mock treasury withdrawals, each carrying the statistics
         mock_withdrawals = [
             Mock(
                 id_=1,
@@ -330,36 +392,18 @@ class TestGovernanceQueries:
                 withdrawal_time="2024-01-01 12:00:00",
                 withdrawal_epoch=450,
                 proposal_index=0,
-            ),
-        ]
-
-        # Mock withdrawal statistics
-        mock_withdrawal_stats = Mock(
-            total_withdrawals=5,
-            total_amount=5000000000,
-            avg_amount=1000000000,
-            max_amount=2000000000,
-            unique_recipients=3,
-        )
-
-        # Mock treasury proposals
-        mock_proposals = [
-            Mock(
-                id_=100,
-                index=0,
-                total_withdrawal=1000000000,
-                withdrawal_count=1,
-                proposal_time="2024-01-01 11:00:00",
-                proposal_epoch=450,
+                top_proposals=mock_proposals,
+                **mock_withdrawal_stats,
             ),
         ]
 
         mock_session.execute.side_effect = [
-            Mock(scalar=lambda: "2024-01-15 12:00:00"),  # latest block
-            Mock(scalar=lambda: 100000),  # latest slot
-            Mock(all=lambda: mock_withdrawals),  # withdrawals
-            Mock(first=lambda: mock_withdrawal_stats),  # withdrawal stats
-            Mock(all=lambda: mock_proposals),  # treasury proposals
+            Mock(
+                first=lambda: Mock(
+                    latest_slot=100000, latest_time="2024-01-15 12:00:00"
+                )
+            ),  # chain tip
+            Mock(all=lambda: mock_withdrawals),  # withdrawals and statistics
         ]
 
         result = GovernanceQueries.get_treasury_governance_analysis(
@@ -375,12 +419,23 @@ class TestGovernanceQueries:
         assert stats["unique_recipients"] == 3
 
         assert len(result["recent_withdrawals"]) == 1
-        assert len(result["top_proposals"]) == 1
+        assert result["top_proposals"] == [
+            {
+                "proposal_id": 100,
+                "proposal_index": 0,
+                "total_withdrawal_lovelace": 1000000000,
+                "withdrawal_count": 1,
+                "proposal_time": "2024-01-01 11:00:00",
+                "proposal_epoch": 450,
+            }
+        ]
 
     def test_get_treasury_governance_analysis_no_data(self) -> None:
         """Test treasury analysis with no block data."""
         mock_session = Mock()
-        mock_session.execute.return_value.scalar.return_value = None
+        mock_session.execute.return_value.first.return_value = Mock(
+            latest_slot=None, latest_time=None
+        )
 
         result = GovernanceQueries.get_treasury_governance_analysis(
             mock_session, 90, 20
@@ -473,6 +528,51 @@ class TestGovernanceQueries:
             GovernanceQueries.get_voting_participation_metrics(mock_async_session)
 
 
+class TestPrebuiltStatements:
+    """Test that the queries reuse statements built at import."""
+
+    @pytest.mark.parametrize(
+        ("proposal_id", "stmt"),
+        [
+            (None, governance._PROPOSAL_ANALYSIS_STMT),
+            (5, governance._PROPOSAL_BY_ID_ANALYSIS_STMT),
+        ],
+    )
+    def test_proposal_analysis_binds_parameters(self, proposal_id, stmt) -> None:
+        """Test that the proposal ID and limit are passed as parameters."""
+        mock_session = Mock()
+        mock_session.execute.return_value = _analysis_result(
+            [],
+            {
+                "total_proposals": 0,
+                "ratified_count": 0,
+                "enacted_count": 0,
+                "dropped_count": 0,
+                "expired_count": 0,
+                "total_deposits": 0,
+            },
+        )
+
+        GovernanceQueries.get_governance_proposal_analysis(mock_session, proposal_id, 7)
+
+        mock_session.execute.assert_called_once_with(
+            stmt,
+            {"proposal_id": proposal_id, "limit": 7},
+            execution_options={"yield_per": 500},
+        )
+
+    def test_voting_metrics_bind_the_window(self) -> None:
+        """Test that the analysis window is bound instead of built in."""
+        mock_session = MagicMock()
+        mock_session.execute.return_value.scalar.return_value = 100_000
+
+        GovernanceQueries.get_voting_participation_metrics(mock_session, 10, 5)
+
+        stmt, params = mock_session.execute.call_args.args
+        assert stmt is governance._PROPOSAL_VOTING_STMT
+        assert params == {"start_slot": 100_000 - 10 * 4320, "limit": 5}
+
+
 class TestComprehensiveGovernanceAnalysis:
     """Test suite for comprehensive governance analysis function."""
 
@@ -585,80 +685,36 @@ class TestGovernanceEdgeCases:
     """Test edge cases and error conditions."""
 
     def test_proposal_status_determination(self) -> None:
-        """Test correct proposal status determination logic."""
-        mock_session = Mock()
-
-        # Test various proposal states
-        test_cases = [
-            # (ratified_epoch, enacted_epoch, dropped_epoch, expired_epoch, expected_status)
-            (None, None, None, None, "Active"),
-            (450, None, None, None, "Ratified"),
-            (450, 451, None, None, "Enacted"),
-            (None, None, 449, None, "Dropped"),
-            (None, None, None, 452, "Expired"),
-        ]
-
-        for ratified, enacted, dropped, expired, expected_status in test_cases:
-            mock_proposals = [
-                Mock(
-                    id_=1,
-                    tx_id=100,
-                    index=0,
-                    action_type="TreasuryWithdrawals",
-                    deposit=500000000,
-                    return_address="addr1test123",
-                    ratified_epoch=ratified,
-                    enacted_epoch=enacted,
-                    dropped_epoch=dropped,
-                    expired_epoch=expired,
-                    proposal_time="2024-01-01 12:00:00",
-                    proposal_epoch=450,
-                    anchor_url=None,
-                    anchor_hash=None,
-                ),
-            ]
-
-            mock_session.execute.side_effect = [
-                Mock(all=lambda: mock_proposals),
-                Mock(
-                    first=lambda: Mock(
-                        total_proposals=1,
-                        ratified_count=0,
-                        enacted_count=0,
-                        dropped_count=0,
-                        expired_count=0,
-                        total_deposits=500000000,
-                    )
-                ),
-                Mock(all=lambda: []),
-            ]
-
-            result = GovernanceQueries.get_governance_proposal_analysis(
-                mock_session, None, 20
+        """Test that the status CASE checks the latest lifecycle stage first."""
+        status = str(
+            governance._PROPOSAL_STATUS.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
             )
+        )
 
-            assert result["found"] is True
-            assert result["proposals"][0]["status"] == expected_status
+        assert status == (
+            "CASE WHEN (gov_action_proposal.enacted_epoch IS NOT NULL) THEN 'Enacted'"
+            " WHEN (gov_action_proposal.ratified_epoch IS NOT NULL) THEN 'Ratified'"
+            " WHEN (gov_action_proposal.dropped_epoch IS NOT NULL) THEN 'Dropped'"
+            " WHEN (gov_action_proposal.expired_epoch IS NOT NULL) THEN 'Expired'"
+            " ELSE 'Active' END"
+        )
 
     def test_zero_division_protection(self) -> None:
         """Test protection against zero division in percentage calculations."""
         mock_session = Mock()
 
         # Mock zero totals
-        mock_stats = Mock(
-            total_proposals=0,
-            ratified_count=0,
-            enacted_count=0,
-            dropped_count=0,
-            expired_count=0,
-            total_deposits=0,
-        )
+        mock_stats = {
+            "total_proposals": 0,
+            "ratified_count": 0,
+            "enacted_count": 0,
+            "dropped_count": 0,
+            "expired_count": 0,
+            "total_deposits": 0,
+        }
 
-        mock_session.execute.side_effect = [
-            Mock(all=lambda: []),
-            Mock(first=lambda: mock_stats),
-            Mock(all=lambda: []),
-        ]
+        mock_session.execute.return_value = _analysis_result([], mock_stats)
 
         result = GovernanceQueries.get_governance_proposal_analysis(
             mock_session, None, 20